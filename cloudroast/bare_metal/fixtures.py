@@ -14,12 +14,12 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.bare_metal.composites import BareMetalComposite
 from cloudcafe.common.resources import ResourcePool
+from cloudroast.common.fixtures import InstrumentedTestFixture
 
 
-class BareMetalFixture(BaseTestFixture):
+class BareMetalFixture(InstrumentedTestFixture):
 
     @classmethod
     def setUpClass(cls):
@@ -33,6 +33,7 @@ class BareMetalFixture(BaseTestFixture):
 
         cls.resources = ResourcePool()
         cls.addClassCleanup(cls.resources.release)
+        cls.instrument_fixture()
 
     @classmethod
     def _create_chassis(cls):
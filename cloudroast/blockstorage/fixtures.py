@@ -14,10 +14,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from cafe.drivers.unittest.fixtures import BaseTestFixture
+from cloudroast.common.fixtures import InstrumentedTestFixture
 
 
-class BaseBlockstorageTestFixture(BaseTestFixture):
+class BaseBlockstorageTestFixture(InstrumentedTestFixture):
 
     @staticmethod
     def add_cleanup(obj_ref, function, *args, **kwargs):
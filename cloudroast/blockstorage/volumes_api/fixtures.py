@@ -14,12 +14,16 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from functools import partial
+
 from cloudcafe.common.tools.datagen import random_string
 from cloudcafe.blockstorage.composites import VolumesAutoComposite
 from cloudroast.blockstorage.fixtures import BaseBlockstorageTestFixture
 from cloudcafe.blockstorage.volumes_api.common.models import statuses
 from cloudcafe.common.behaviors import (
     StatusProgressionVerifier, StatusProgressionError)
+from cloudroast.common.admission import \
+    get_blockstorage_admission_controller
 
 
 class BaseVolumesTestFixture(BaseBlockstorageTestFixture):
@@ -49,6 +53,9 @@ class VolumesTestFixture(BaseVolumesTestFixture):
 
         super(VolumesTestFixture, cls).setUpClass()
         cls.volumes = VolumesAutoComposite()
+        cls.volumes_admission = get_blockstorage_admission_controller(
+            cls.volumes.client, cls.volumes.auth.tenant_id,
+            log=cls.fixture_log)
 
     @classmethod
     def new_volume(cls, size=None, vol_type=None, add_cleanup=True):
@@ -58,6 +65,8 @@ class VolumesTestFixture(BaseVolumesTestFixture):
         :param size: How large in GB to make the volume.
         :param vol_type: Either the name or id of the type of volume requsted.
         :add_cleanup: If True, deletes the volume after classTearDown.
+
+        Waits for enough volume quota to be free before creating the volume.
         """
 
         min_size = cls.volumes.behaviors.get_configured_volume_type_property(
@@ -65,14 +74,22 @@ class VolumesTestFixture(BaseVolumesTestFixture):
             id_=vol_type or cls.volumes.config.default_volume_type,
             name=vol_type or cls.volumes.config.default_volume_type)
 
-        volume = cls.volumes.behaviors.create_available_volume(
-            size or min_size,
-            vol_type or cls.volumes.config.default_volume_type,
-            cls.random_volume_name())
+        size = size or min_size
+        volume, reservation = cls.volumes_admission.create(
+            partial(cls.volumes.behaviors.create_available_volume,
+                    size,
+                    vol_type or cls.volumes.config.default_volume_type,
+                    cls.random_volume_name()),
+            volumes=1, gigabytes=int(size or 0))
 
         if add_cleanup:
             cls.add_cleanup(
-                cls, cls.volumes.behaviors.delete_volume_confirmed, volume.id_)
+                cls, reservation.released_by(
+                    cls.volumes.behaviors.delete_volume_confirmed),
+                volume.id_)
+        else:
+            # The caller owns the volume, so its quota can't be tracked
+            reservation.release()
 
         return volume
 
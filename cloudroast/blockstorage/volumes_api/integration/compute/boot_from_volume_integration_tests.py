@@ -22,6 +22,7 @@ from cloudroast.blockstorage.volumes_api.integration.compute.fixtures \
     import ComputeIntegrationTestFixture
 from cloudroast.blockstorage.volumes_api.integration.compute.datasets \
     import bfv_datasets
+from cloudroast.common.datasets import parallel_dataset_test
 
 
 @DataDrivenFixture
@@ -39,11 +40,13 @@ class BootFromVolumeIntegrationTests(ComputeIntegrationTestFixture):
         self.assertMinDiskSizeIsSet(image)
 
     @data_driven_test(bfv_datasets.images_by_volume)
+    @parallel_dataset_test
     def ddtest_create_basic_bootable_volume_from(self, volume_type, image):
         """Create a single volume_type volume from image"""
         self.create_volume_from_image_test(volume_type, image)
 
     @data_driven_test(bfv_datasets.images_by_flavor)
+    @parallel_dataset_test
     def ddtest_create_bootable_volume_from_a_snapshot_of_a_server(
             self, image, flavor,
             volume_type=BlockstorageDatasets.default_volume_type_model()):
@@ -51,6 +54,7 @@ class BootFromVolumeIntegrationTests(ComputeIntegrationTestFixture):
             image, flavor, volume_type)
 
     @data_driven_test(bfv_datasets.images_by_flavor)
+    @parallel_dataset_test
     def ddtest_create_bootable_volume_from_last_of_3_snapshots_of_a_server(
             self, image, flavor,
             volume_type=BlockstorageDatasets.default_volume_type_model()):
@@ -58,6 +62,7 @@ class BootFromVolumeIntegrationTests(ComputeIntegrationTestFixture):
             image, flavor, volume_type)
 
     @data_driven_test(bfv_datasets.flavors_by_images_by_volume_type)
+    @parallel_dataset_test
     def ddtest_boot_a_server_from_a_volume(
             self, image, flavor, volume_type):
 
@@ -74,6 +79,7 @@ class BootFromVolumeIntegrationTests(ComputeIntegrationTestFixture):
         server = self.servers.behaviors.create_active_server(
             name=self.random_server_name(), flavor_ref=flavor.id,
             block_device_mapping=bdm).entity
+        self.addCleanup(self.servers.client.delete_server, server.id)
 
         # Connect to server
         self.server_conn = self.connect_to_instance(server, os_type=os_type)
@@ -83,6 +89,7 @@ class BootFromVolumeIntegrationTests(ComputeIntegrationTestFixture):
         self.assertTrue(resp, "Unable to write data to bootable OS volume")
 
     @data_driven_test(bfv_datasets.images_by_flavor)
+    @parallel_dataset_test
     def ddtest_verify_data_on_custom_snapshot_after_copy_to_volume(
             self, image, flavor,
             volume_type=BlockstorageDatasets.default_volume_type_model()):
@@ -92,6 +99,8 @@ class BootFromVolumeIntegrationTests(ComputeIntegrationTestFixture):
         original_server = self.new_server(
             name=self.random_server_name(), image=image.id, flavor=flavor.id,
             add_cleanup=False)
+        self.addCleanup(
+            self.servers.client.delete_server, original_server.id)
 
         # Connect to server
         original_server_connection = self.connect_to_instance(
@@ -129,6 +138,8 @@ class BootFromVolumeIntegrationTests(ComputeIntegrationTestFixture):
             "Unable to build a server from volume '{volume}' and flavor "
             "'{flavor}' with block device mapping: {bdm}".format(
                 volume=bootable_volume.id_, flavor=flavor.id, bdm=bdm))
+        self.addCleanup(
+            self.servers.client.delete_server, new_bfv_server.id)
 
         # Setup remote instance client
         new_bfv_server_conn = self.connect_to_instance(
@@ -0,0 +1,66 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from cafe.engine.models.data_interfaces import ConfigSectionInterface
+
+
+class VolumeDataIntegrityConfig(ConfigSectionInterface):
+    """Settings for the on-instance data integrity dataset."""
+
+    SECTION_NAME = 'volume_data_integrity'
+
+    @property
+    def data_size_mb(self):
+        """
+        Megabytes of deterministic data written and verified by the volume
+        cloning, snapshot and live migration integration tests. 0 skips the
+        dataset and only the small md5 file is checked.
+        """
+        return int(self.get('data_size_mb', 0))
+
+    @property
+    def block_size_kb(self):
+        """Size of each independently checksummed block."""
+        return int(self.get('block_size_kb', 4096))
+
+    @property
+    def file_name(self):
+        return self.get('file_name', 'qe_integrity_datafile')
+
+
+class VolumeDatasetExecutionConfig(ConfigSectionInterface):
+    """Settings for running data driven volume integration tests."""
+
+    SECTION_NAME = 'volume_dataset_execution'
+
+    @property
+    def parallel(self):
+        """
+        Run every dataset of the parallel capable data driven tests
+        concurrently when the first of them runs. Each test then reports
+        the outcome of its own dataset. Every dataset runs even if the
+        runner was asked for a subset of the tests, so enable this for full
+        matrix runs.
+        """
+        return self.get_boolean('parallel', False)
+
+    @property
+    def max_workers(self):
+        """
+        Upper bound on datasets in flight at once. The free instance quota
+        can lower it further.
+        """
+        return int(self.get('max_workers', 5))
@@ -17,6 +17,45 @@ limitations under the License.
 from cloudcafe.common.tools.datagen import random_string
 from cloudcafe.compute.composites import ComputeIntegrationComposite
 from cloudroast.blockstorage.volumes_api.fixtures import VolumesTestFixture
+from cloudroast.blockstorage.volumes_api.integration.compute.config import \
+    VolumeDataIntegrityConfig, VolumeDatasetExecutionConfig
+from cloudroast.common.concurrency import run_concurrently
+
+
+class DataIntegrityManifest(object):
+    """
+    @summary: Per-block md5 checksums of a data file on a remote instance
+    """
+
+    def __init__(self, file_directory, file_name, block_size, checksums):
+        self.file_directory = file_directory
+        self.file_name = file_name
+        self.block_size = block_size
+        self.checksums = checksums
+
+    @property
+    def file_path(self):
+        return "{0}/{1}".format(
+            self.file_directory.rstrip('/'), self.file_name)
+
+    @property
+    def block_count(self):
+        return len(self.checksums)
+
+    def mismatched_blocks(self, other):
+        """
+        @summary: Returns the indexes of the blocks whose checksums differ
+                  from other's. Blocks present in only one of the manifests
+                  count as mismatched.
+        @rtype: list
+        """
+        mismatched = [
+            index for index, (checksum, other_checksum) in enumerate(
+                zip(self.checksums, other.checksums))
+            if checksum != other_checksum]
+        shorter = min(self.block_count, other.block_count)
+        longer = max(self.block_count, other.block_count)
+        return mismatched + list(range(shorter, longer))
 
 
 class ComputeIntegrationTestFixture(VolumesTestFixture):
@@ -24,12 +63,36 @@ class ComputeIntegrationTestFixture(VolumesTestFixture):
     @classmethod
     def setUpClass(cls):
         super(ComputeIntegrationTestFixture, cls).setUpClass()
+        cls.integrity_config = VolumeDataIntegrityConfig()
+        cls.dataset_execution_config = VolumeDatasetExecutionConfig()
         cls.compute = ComputeIntegrationComposite()
         cls.servers = cls.compute.servers
         cls.flavors = cls.compute.flavors
         cls.images = cls.compute.images
         cls.volume_attachments = cls.compute.volume_attachments
 
+        cls.parallel_datasets = cls.dataset_execution_config.parallel
+
+    @classmethod
+    def get_dataset_concurrency_limit(cls, case_count):
+        """
+        Used by @parallel_dataset_test. Caps concurrency at the configured
+        max_workers, and at the number of cases that fit in the free
+        instance quota, counting two servers per case (the most any
+        boot-from-volume case builds at once).
+        """
+        limit = min(case_count, cls.dataset_execution_config.max_workers)
+        try:
+            absolute = cls.compute.limits.client.get_limits().entity.absolute
+            free_instances = \
+                absolute.max_total_instances - absolute.total_instances_used
+            limit = min(limit, free_instances // 2)
+        except Exception as exception:
+            cls.fixture_log.warning(
+                "Unable to read compute limits, using configured "
+                "max_workers: {0}".format(exception))
+        return max(1, limit)
+
     @classmethod
     def random_server_name(cls):
         return random_string(prefix="Server_", size=10)
@@ -132,6 +195,106 @@ class ComputeIntegrationTestFixture(VolumesTestFixture):
         return server_connection.create_file(
             file_name, file_content, file_directory)
 
+    @staticmethod
+    def _integrity_manifest_command(file_path, block_size):
+        # Each block is hashed by its own dd | md5sum, spread across every
+        # cpu on the instance. Each result is a single short echo, so lines
+        # from parallel workers never interleave.
+        return (
+            "blocks=$(( ($(stat -c %s {path}) + {bs} - 1) / {bs} )); "
+            "[ $blocks -gt 0 ] && seq 0 $((blocks - 1)) | "
+            "xargs -P $(nproc) -I{{}} sh -c 'echo {{}} $(dd if={path} "
+            "bs={bs} skip={{}} count=1 2>/dev/null | md5sum)' | "
+            "sort -n".format(path=file_path, bs=block_size))
+
+    @classmethod
+    def _execute_integrity_command(
+            cls, server_connection, command, file_directory, file_name,
+            block_size):
+        resp = server_connection.ssh_client.execute_command(command)
+        checksums = [
+            line.split()[1] for line in (resp.stdout or '').splitlines()
+            if line.strip()]
+        assert checksums, (
+            "Unable to checksum {0}/{1} on the remote instance".format(
+                file_directory, file_name))
+        return DataIntegrityManifest(
+            file_directory, file_name, block_size, checksums)
+
+    @classmethod
+    def write_integrity_data(
+            cls, server_connection, file_directory, file_name=None,
+            size_mb=None, block_size_kb=None, seed=None):
+        """
+        @summary: Writes size_mb of deterministic pseudo-random data to a
+                  file on a linux instance, syncs it to disk and checksums
+                  it block by block, all in a single remote command.
+        @param seed: Passphrase for the data stream. The same seed and size
+                     always produce the same data. Defaults to a random seed.
+        @return: Manifest of the written file
+        @rtype: DataIntegrityManifest
+        """
+        assert file_directory.startswith('/'), (
+            "Data integrity files are only supported on linux instances")
+        file_name = file_name or cls.integrity_config.file_name
+        size_mb = size_mb or cls.integrity_config.data_size_mb
+        block_size = \
+            (block_size_kb or cls.integrity_config.block_size_kb) * 1024
+        seed = seed or random_string(size=16)
+        manifest = DataIntegrityManifest(
+            file_directory, file_name, block_size, [])
+
+        # aes-ctr over /dev/zero is a fast, seedable stream that does not
+        # compress or dedupe on the backend, unlike repeated characters.
+        command = (
+            "openssl enc -aes-128-ctr -md sha256 -nosalt -pass pass:{seed} "
+            "< /dev/zero 2>/dev/null | head -c {size} > {path} && sync && "
+            "{checksum}".format(
+                seed=seed, size=size_mb * 1024 * 1024,
+                path=manifest.file_path,
+                checksum=cls._integrity_manifest_command(
+                    manifest.file_path, block_size)))
+        return cls._execute_integrity_command(
+            server_connection, command, file_directory, file_name,
+            block_size)
+
+    @classmethod
+    def get_integrity_manifest(
+            cls, server_connection, file_directory, file_name, block_size):
+        """
+        @summary: Checksums an existing file block by block in a single
+                  remote command
+        @param block_size: Block size in bytes, which must match the one
+                           used by the manifest being compared against
+        @rtype: DataIntegrityManifest
+        """
+        file_path = "{0}/{1}".format(file_directory.rstrip('/'), file_name)
+        return cls._execute_integrity_command(
+            server_connection,
+            cls._integrity_manifest_command(file_path, block_size),
+            file_directory, file_name, block_size)
+
+    @classmethod
+    def verify_integrity_data(
+            cls, server_connection, manifest, file_directory=None):
+        """
+        @summary: Checksums the file described by manifest, optionally in a
+                  different directory (ie, on a clone's mount point), and
+                  asserts that every block matches
+        @return: Manifest of the file as found on the instance
+        @rtype: DataIntegrityManifest
+        """
+        current = cls.get_integrity_manifest(
+            server_connection, file_directory or manifest.file_directory,
+            manifest.file_name, manifest.block_size)
+        mismatched = manifest.mismatched_blocks(current)
+        assert not mismatched, (
+            "{0} of {1} blocks of {2} did not match the original data. "
+            "First mismatched blocks: {3}".format(
+                len(mismatched), manifest.block_count, current.file_path,
+                mismatched[:10]))
+        return current
+
     @classmethod
     def _get_remote_client(cls, client_type):
 
@@ -226,15 +389,22 @@ class ComputeIntegrationTestFixture(VolumesTestFixture):
         Writes data to the volume
         Saves the md5sum of the written data as a class attribute
         Syncs the filesystem write cache.
+        Writes and checksums the configured data integrity dataset, if any
         """
 
-        # Build new server using configured defaults
-        cls.test_server = server or cls.new_server()
-
-        # Set remote instance client up
-        cls.server_conn = cls.connect_to_instance(cls.test_server)
+        def build_and_connect_to_server():
+            # Build new server using configured defaults
+            test_server = server or cls.new_server()
+            # Set remote instance client up
+            return test_server, cls.connect_to_instance(test_server)
+
+        # The server and volume are independent until the attach, so
+        # provision them at the same time
+        (cls.test_server, cls.server_conn), cls.test_volume = \
+            run_concurrently([
+                build_and_connect_to_server,
+                lambda: volume or cls.new_volume()])
         cls.volume_mount_point = cls.server_conn.generate_mountpoint()
-        cls.test_volume = volume or cls.new_volume()
 
         # Attach Volume
         cls.test_attachment = cls.attach_volume_and_get_device_info(
@@ -267,6 +437,11 @@ class ComputeIntegrationTestFixture(VolumesTestFixture):
         # Make the fs writes cached data to disk before unmount.
         cls.server_conn.filesystem_sync()
 
+        cls.integrity_manifest = None
+        if cls.integrity_config.data_size_mb:
+            cls.integrity_manifest = cls.write_integrity_data(
+                cls.server_conn, cls.volume_mount_point)
+
     @classmethod
     def unmount_and_detach_test_volume(cls):
         cls.unmount_attached_volume(
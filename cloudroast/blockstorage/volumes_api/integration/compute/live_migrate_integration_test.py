@@ -74,6 +74,12 @@ class BootFromVolumeLiveMigrateIntegration(ComputeIntegrationTestFixture):
         resp = self.server_conn.create_large_file(multiplier=0.1)
         self.assertTrue(resp, "Unable to write data to bootable OS volume")
 
+        # Write the data integrity dataset to the root disk, if configured
+        integrity_manifest = None
+        if self.integrity_config.data_size_mb and os_type != 'windows':
+            integrity_manifest = self.write_integrity_data(
+                self.server_conn, '/var/tmp')
+
         # Live migration
         # Verify live migration
         self.compute_admin = ComputeAdminComposite()
@@ -87,3 +93,9 @@ class BootFromVolumeLiveMigrateIntegration(ComputeIntegrationTestFixture):
         for extra_volume, attachment in extra_volumes:
             self.compute.volume_attachments.behaviors._get_volume_status(
                 extra_volume.id_)
+
+        # Verify the dataset survived the migration
+        if integrity_manifest is not None:
+            self.server_conn = self.connect_to_instance(
+                self.server, os_type=os_type)
+            self.verify_integrity_data(self.server_conn, integrity_manifest)
@@ -63,6 +63,11 @@ class VolumeCloningIntegrationSmokeTests(ComputeIntegrationTestFixture):
             "not match".format(
                 self.original_hash, md5hash, self.written_filename))
 
+        if self.integrity_manifest is not None:
+            self.verify_integrity_data(
+                self.server_conn, self.integrity_manifest,
+                file_directory=self.clone_mount_point)
+
     def tearDown(self):
         if hasattr(self, 'clone_attachment'):
             self.unmount_attached_volume(
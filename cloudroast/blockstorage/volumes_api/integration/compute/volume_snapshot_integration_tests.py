@@ -113,6 +113,12 @@ class VolumeSnapshotIntegrationSmokeTests(ComputeIntegrationTestFixture):
         assert self.original_md5hash is not None, (
             "Unable to hash file on mounted volume")
 
+        # Write the data integrity dataset, if configured
+        integrity_manifest = None
+        if self.integrity_config.data_size_mb:
+            integrity_manifest = self.write_integrity_data(
+                self.server_conn, self.volume_mount_point)
+
         # Make the fs write cached data to disk before unmount.
         self.server_conn.filesystem_sync()
 
@@ -161,3 +167,6 @@ class VolumeSnapshotIntegrationSmokeTests(ComputeIntegrationTestFixture):
             "Unable to hash file on mounted volume")
         assert new_md5hash == self.original_md5hash, (
             "Unable to hash file on mounted volume")
+
+        if integrity_manifest is not None:
+            self.verify_integrity_data(self.server_conn, integrity_manifest)
@@ -0,0 +1,38 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from cafe.engine.models.data_interfaces import ConfigSectionInterface
+
+
+class CloudKeepBulkConfig(ConfigSectionInterface):
+    """Settings for bulk seeding and cleanup of barbican entities."""
+
+    SECTION_NAME = 'cloudkeep_bulk'
+
+    @property
+    def paging_seed_count(self):
+        """Number of entities created by the paging fixtures."""
+        return int(self.get('paging_seed_count', 150))
+
+    @property
+    def max_workers(self):
+        """Maximum number of concurrent create or delete requests."""
+        return int(self.get('max_workers', 10))
+
+    @property
+    def deferred_cleanup(self):
+        """Delete entities once per class instead of after every test."""
+        return self.get_boolean('deferred_cleanup', False)
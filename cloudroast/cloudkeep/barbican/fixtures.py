@@ -16,11 +16,12 @@ limitations under the License.
 import json
 import requests
 
+from copy import copy
+from functools import partial
 from os import path
 from uuid import uuid4
 
 from cafe.drivers.unittest.datasets import DatasetList
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cafe.resources.github.issue_tracker import GitHubTracker
 from cafe.resources.launchpad.issue_tracker import LaunchpadTracker
 from cloudcafe.cloudkeep.barbican.orders.behaviors import OrdersBehavior
@@ -37,8 +38,29 @@ from cloudcafe.cloudkeep.config import (MarshallingConfig, CloudKeepConfig,
                                         CloudKeepAuthConfig)
 from cloudcafe.common.tools import randomstring
 
+from cloudroast.cloudkeep.barbican.config import CloudKeepBulkConfig
+from cloudroast.common.concurrency import execute_concurrently
+from cloudroast.common.fixtures import InstrumentedTestFixture
 
-class BarbicanFixture(BaseTestFixture):
+
+def isolated_cleanup(func):
+    """Marks a test that must not see entities left behind by other tests.
+
+    When deferred cleanup is enabled, entities created by earlier tests in
+    the class are deleted before a marked test runs, and the entities the
+    marked test creates are deleted as soon as it finishes. Tests that
+    list entities and count the results must be marked to run with
+    deferred cleanup, see _check_isolated_listing.
+    """
+    func.isolated_cleanup = True
+    return func
+
+
+class BarbicanFixture(InstrumentedTestFixture):
+
+    # Paging fixtures seed entities for the whole class and keep what their
+    # tests create, so no entities are deleted between their tests
+    seeds_entities = False
 
     @classmethod
     def setUpClass(cls, keystone_config=None):
@@ -46,6 +68,99 @@ class BarbicanFixture(BaseTestFixture):
         cls.marshalling = MarshallingConfig()
         cls.cloudkeep = CloudKeepConfig()
         cls.keystone = keystone_config or CloudKeepAuthConfig()
+        cls.bulk_config = CloudKeepBulkConfig()
+        cls.instrument_fixture()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._delete_created_entities()
+        super(BarbicanFixture, cls).tearDownClass()
+
+    def setUp(self):
+        super(BarbicanFixture, self).setUp()
+        if (self.bulk_config.deferred_cleanup and
+                self._is_isolated_test() and not self.seeds_entities):
+            self._delete_created_entities()
+
+    def tearDown(self):
+        if not self.bulk_config.deferred_cleanup or self._is_isolated_test():
+            self._delete_created_entities()
+        super(BarbicanFixture, self).tearDown()
+
+    def _is_isolated_test(self):
+        test_method = getattr(self, self._testMethodName, None)
+        return getattr(test_method, 'isolated_cleanup', False)
+
+    def _check_isolated_listing(self):
+        """Refuses to count listed entities in an unmarked test when
+        deferred cleanup is enabled, as entities left behind by earlier
+        tests in the class would be counted too.
+        """
+        if (self.bulk_config.deferred_cleanup and
+                not self.seeds_entities and not self._is_isolated_test()):
+            self.fail(
+                '{0} counts listed entities, so it must be marked with '
+                'isolated_cleanup to run with deferred cleanup'.format(
+                    self._testMethodName))
+
+    @classmethod
+    def _delete_created_entities(cls):
+        """Deletes the entities created through the fixture's behaviors.
+
+        Called after each test, or only at class teardown when deferred
+        cleanup is enabled. Fixtures that create entities override this.
+        """
+        pass
+
+    @classmethod
+    def _create_entities_concurrently(cls, create_func, count):
+        """Calls create_func count times on a bounded pool of threads.
+
+        Returns the successful responses. Responses are still tracked by
+        the behavior that created them, so the usual delete_all_created_*
+        calls (or _delete_created_concurrently) clean them up.
+        """
+        results = execute_concurrently(
+            (create_func for _ in range(count)),
+            max_workers=cls.bulk_config.max_workers)
+        created = [result.result for result in results
+                   if not result.failed and
+                   getattr(result.result, 'id', None) is not None]
+        if len(created) != count:
+            cls.fixture_log.error(
+                'Only {0} of {1} entities were created'.format(
+                    len(created), count))
+        return created
+
+    @classmethod
+    def _delete_created_concurrently(cls, behaviors, created_attr,
+                                     delete_method):
+        """Empties a behavior's list of created entities concurrently.
+
+        The list named created_attr is split into one chunk per worker and
+        each chunk is handed to delete_method on a shallow copy of the
+        behavior, so every entity is deleted exactly as the behavior
+        itself would delete it.
+        """
+        created = list(getattr(behaviors, created_attr))
+        setattr(behaviors, created_attr, [])
+        workers = max(1, cls.bulk_config.max_workers)
+        chunks = [created[index::workers] for index in range(workers)
+                  if created[index::workers]]
+
+        def delete_chunk(chunk):
+            worker_behaviors = copy(behaviors)
+            setattr(worker_behaviors, created_attr, chunk)
+            getattr(worker_behaviors, delete_method)()
+
+        results = execute_concurrently(
+            [partial(delete_chunk, chunk) for chunk in chunks],
+            max_workers=workers)
+        for result in results:
+            if result.failed:
+                cls.fixture_log.error(
+                    'Failed to delete created entities: {0}'.format(
+                        result.exception))
 
     def get_id(self, request):
         """
@@ -194,6 +309,7 @@ class SecretsFixture(AuthenticationFixture):
         returns a 200 status code and the correct number of secrets.
         Also returns the list of secrets from the response.
         """
+        self._check_isolated_listing()
         self.assertEqual(resp.status_code, 200,
                          'Returned unexpected response code')
         sec_group = resp.entity
@@ -201,18 +317,23 @@ class SecretsFixture(AuthenticationFixture):
                          'Returned wrong number of secrets')
         return sec_group
 
-    def tearDown(self):
-        self.behaviors.delete_all_created_secrets()
-        super(SecretsFixture, self).tearDown()
+    @classmethod
+    def _delete_created_entities(cls):
+        cls._delete_created_concurrently(
+            cls.behaviors, 'created_secrets', 'delete_all_created_secrets')
 
 
 class SecretsPagingFixture(SecretsFixture):
 
+    seeds_entities = True
+
     @classmethod
     def setUpClass(cls):
         super(SecretsPagingFixture, cls).setUpClass()
-        for count in range(150):
-            cls.behaviors.create_secret_from_config(use_expiration=False)
+        cls.seeded_secrets = cls._create_entities_concurrently(
+            partial(cls.behaviors.create_secret_from_config,
+                    use_expiration=False),
+            cls.bulk_config.paging_seed_count)
 
     def tearDown(self):
         """ Overrides superclass method so that secrets are not deleted
@@ -220,11 +341,6 @@ class SecretsPagingFixture(SecretsFixture):
         """
         pass
 
-    @classmethod
-    def tearDownClass(cls):
-        cls.behaviors.delete_all_created_secrets()
-        super(SecretsPagingFixture, cls).tearDownClass()
-
 
 class OrdersFixture(AuthenticationFixture):
     @classmethod
@@ -252,6 +368,7 @@ class OrdersFixture(AuthenticationFixture):
         returns a 200 status code and the correct number of orders.
         Also returns the list of orders from the response.
         """
+        self._check_isolated_listing()
         self.assertEqual(resp.status_code, 200,
                          'Returned unexpected response code')
         ord_group = resp.entity
@@ -259,18 +376,24 @@ class OrdersFixture(AuthenticationFixture):
                          'Returned wrong number of orders')
         return ord_group
 
-    def tearDown(self):
-        self.behaviors.delete_all_created_orders_and_secrets()
-        super(OrdersFixture, self).tearDown()
+    @classmethod
+    def _delete_created_entities(cls):
+        cls._delete_created_concurrently(
+            cls.behaviors, 'created_orders',
+            'delete_all_created_orders_and_secrets')
 
 
 class OrdersPagingFixture(OrdersFixture):
 
+    seeds_entities = True
+
     @classmethod
     def setUpClass(cls):
         super(OrdersPagingFixture, cls).setUpClass()
-        for count in range(150):
-            cls.behaviors.create_order_from_config(use_expiration=False)
+        cls.seeded_orders = cls._create_entities_concurrently(
+            partial(cls.behaviors.create_order_from_config,
+                    use_expiration=False),
+            cls.bulk_config.paging_seed_count)
 
     def tearDown(self):
         """ Overrides superclass method so that orders are not deleted
@@ -278,11 +401,6 @@ class OrdersPagingFixture(OrdersFixture):
         """
         pass
 
-    @classmethod
-    def tearDownClass(cls):
-        cls.behaviors.delete_all_created_orders_and_secrets()
-        super(OrdersPagingFixture, cls).tearDownClass()
-
 
 class ContainerFixture(OrdersFixture):
     @classmethod
@@ -314,6 +432,7 @@ class ContainerFixture(OrdersFixture):
         :param limit: The limit for a paginated list
         :return: The list of containers from the response
         """
+        self._check_isolated_listing()
         container_group = resp.entity
         self.assertEqual(resp.status_code, 200,
                          'Returned unexpected response code')
@@ -337,9 +456,14 @@ class ContainerFixture(OrdersFixture):
         if num_secrets is not None:
             self.assertEqual(len(get_resp.entity.secret_refs), num_secrets)
 
-    def tearDown(self):
-        self.order_behaviors.delete_all_created_orders_and_secrets()
-        self.behaviors.delete_all_created_containers()
+    @classmethod
+    def _delete_created_entities(cls):
+        cls._delete_created_concurrently(
+            cls.order_behaviors, 'created_orders',
+            'delete_all_created_orders_and_secrets')
+        cls._delete_created_concurrently(
+            cls.behaviors, 'created_containers',
+            'delete_all_created_containers')
 
 # ---------------- DATASETS -------------
 
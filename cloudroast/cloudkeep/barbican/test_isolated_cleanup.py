@@ -0,0 +1,73 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from unittest.suite import TestSuite
+
+from cafe.drivers.unittest.decorators import tags
+
+from cloudroast.cloudkeep.barbican.fixtures import (
+    SecretsFixture, isolated_cleanup)
+
+
+def load_tests(loader, standard_tests, pattern):
+    suite = TestSuite()
+    suite.addTest(IsolatedCleanupTest("test_create_secret"))
+    suite.addTest(IsolatedCleanupTest("test_isolated_test_starts_clean"))
+    suite.addTest(IsolatedCleanupTest("test_unmarked_listing_is_refused"))
+    return suite
+
+
+class IsolatedCleanupTest(SecretsFixture):
+    """
+    @summary: Checks that a test marked with isolated_cleanup never sees
+    secrets created by earlier tests in its class, whether cleanup runs
+    after every test or is deferred to the end of the class
+    """
+
+    earlier_secret_id = None
+
+    @tags(type='positive')
+    def test_create_secret(self):
+        """Creates a secret that is left for the next test"""
+        resp = self.behaviors.create_secret_from_config(use_expiration=False)
+        self.assertEqual(resp.status_code, 201,
+                         'Returned unexpected response code')
+        IsolatedCleanupTest.earlier_secret_id = resp.id
+
+    @tags(type='positive')
+    @isolated_cleanup
+    def test_isolated_test_starts_clean(self):
+        """The secret created by the previous test was deleted"""
+        self.assertIsNotNone(self.earlier_secret_id,
+                             'No secret was created by the previous test')
+        self.assertEqual(self.behaviors.created_secrets, [])
+
+        resp = self.client.get_secret(secret_id=self.earlier_secret_id)
+        self.assertEqual(resp.status_code, 404,
+                         'Secret from the previous test was not deleted')
+
+        resp = self.behaviors.create_secret_from_config(use_expiration=False)
+        self.assertEqual(resp.status_code, 201,
+                         'Returned unexpected response code')
+        self.assertEqual(len(self.behaviors.created_secrets), 1)
+
+    @tags(type='negative')
+    def test_unmarked_listing_is_refused(self):
+        """Counting listed secrets fails in unmarked tests when deferred"""
+        if not self.bulk_config.deferred_cleanup:
+            self.skipTest('Deferred cleanup is not enabled')
+        resp = self.client.get_secrets(limit=1)
+        with self.assertRaises(self.failureException):
+            self._check_list_of_secrets(resp, 1)
@@ -0,0 +1,33 @@
+"""
+Copyright 2014 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from cafe.engine.models.data_interfaces import ConfigSectionInterface
+
+
+class CloudKeepCLIExecutionConfig(ConfigSectionInterface):
+    """Settings controlling how the barbican CLI is executed."""
+
+    SECTION_NAME = 'cloudkeep_cli_execution'
+
+    @property
+    def in_process(self):
+        """Run CLI commands inside the test process instead of a shell."""
+        return self.get_boolean('in_process', False)
+
+    @property
+    def entry_point(self):
+        """CLI entry point, as 'module.path:function'."""
+        return self.get('entry_point', 'barbicanclient.barbican:main')
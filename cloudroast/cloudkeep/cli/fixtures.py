@@ -13,10 +13,133 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import importlib
+import logging
+import shlex
+import sys
+import threading
+import traceback
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from cafe.engine.models.commandline_response import CommandLineResponse
 from cloudcafe.cloudkeep.cli.clients import SecretsCLIClient, OrdersCLIClient
 from cloudcafe.cloudkeep.cli.behaviors import (
     SecretsCLIBehaviors, OrdersCLIBehaviors)
 from cloudroast.cloudkeep.barbican.fixtures import BarbicanFixture
+from cloudroast.cloudkeep.cli.config import CloudKeepCLIExecutionConfig
+
+
+class InProcessCLIMixin(object):
+    """Runs CLI client commands by calling the CLI entry point directly.
+
+    Mixed in ahead of a BaseCommandLineClient subclass. The command string
+    is built exactly as for the subprocess path, then handed to the entry
+    point as argv while stdout and stderr are captured. The response has
+    the same standard_out, standard_error and return_code a shell run of
+    the command would produce, without paying for interpreter startup and
+    client imports on every command.
+
+    The keystone session the CLI authenticates with is cached and handed
+    back to every later command with the same credentials, so the process
+    authenticates once instead of once per command. The session's auth
+    plugin renews the token itself when it nears expiry.
+    """
+
+    ENTRY_POINT = None
+    _run_lock = threading.Lock()
+    _sessions = {}
+
+    @classmethod
+    def _load_entry_point(cls):
+        module_name, func_name = cls.ENTRY_POINT.split(':')
+        module = importlib.import_module(module_name)
+        cls._cache_keystone_sessions(module)
+        return getattr(module, func_name)
+
+    @classmethod
+    def _cache_keystone_sessions(cls, module):
+        """Wraps the CLI's keystone session factory with a cache.
+
+        Newer clients build the session in Barbican.create_keystone_session,
+        older ones in auth.create_keystone_auth_session. Sessions are keyed
+        on every --os-* argument of the command, so commands run with other
+        credentials authenticate separately.
+        """
+        if getattr(module, '_cached_keystone_sessions', False):
+            return
+        shell = getattr(module, 'Barbican', None)
+        if hasattr(shell, 'create_keystone_session'):
+            create_session = shell.create_keystone_session
+
+            def cached_create_session(self, args, *factory_args, **kwargs):
+                return cls._get_session(
+                    args, (factory_args, sorted(kwargs.items())),
+                    lambda: create_session(
+                        self, args, *factory_args, **kwargs))
+
+            shell.create_keystone_session = cached_create_session
+        elif hasattr(getattr(module, 'auth', None),
+                     'create_keystone_auth_session'):
+            create_session = module.auth.create_keystone_auth_session
+
+            def cached_create_auth_session(args):
+                return cls._get_session(
+                    args, None, lambda: create_session(args))
+
+            module.auth.create_keystone_auth_session = \
+                cached_create_auth_session
+        module._cached_keystone_sessions = True
+
+    @classmethod
+    def _get_session(cls, args, factory_args, create_session):
+        key = repr((factory_args, sorted(
+            (name, value) for name, value in vars(args).items()
+            if name.startswith('os_'))))
+        session = cls._sessions.get(key)
+        if session is None:
+            session = cls._sessions[key] = create_session()
+        return session
+
+    def run_command(self, cmd, *args):
+        response = CommandLineResponse()
+        response.command = self._build_command(cmd, *args)
+        argv = shlex.split(response.command)[1:]
+        entry_point = self._load_entry_point()
+
+        stdout, stderr = StringIO(), StringIO()
+        root_logger = logging.getLogger()
+        with self._run_lock:
+            saved_streams = sys.stdout, sys.stderr
+            saved_handlers = list(root_logger.handlers)
+            sys.stdout, sys.stderr = stdout, stderr
+            try:
+                return_code = entry_point(argv)
+            except SystemExit as exit_request:
+                return_code = exit_request.code
+            except Exception:
+                stderr.write(traceback.format_exc())
+                return_code = 1
+            finally:
+                sys.stdout, sys.stderr = saved_streams
+                # CLI apps configure logging on every run, don't let
+                # handlers bound to our captured streams pile up
+                root_logger.handlers = saved_handlers
+
+        # Match the exit status the interpreter would report
+        if return_code is None:
+            return_code = 0
+        elif not isinstance(return_code, int):
+            stderr.write('{0}\n'.format(return_code))
+            return_code = 1
+
+        response.standard_out = stdout.getvalue().splitlines()
+        response.standard_error = stderr.getvalue().splitlines()
+        response.return_code = return_code
+        return response
 
 
 class BarbicanCLIFixture(BarbicanFixture):
@@ -25,6 +148,12 @@ class BarbicanCLIFixture(BarbicanFixture):
 
     @classmethod
     def setUpFixture(cls, client_type, behavior_type):
+        cls.cli_execution_config = CloudKeepCLIExecutionConfig()
+        if cls.cli_execution_config.in_process:
+            client_type = type(
+                'InProcess{0}'.format(client_type.__name__),
+                (InProcessCLIMixin, client_type),
+                {'ENTRY_POINT': cls.cli_execution_config.entry_point})
         cls.client = client_type(
             url=cls.cloudkeep.base_url,
             api_version=cls.cloudkeep.api_version,
@@ -39,9 +168,9 @@ class BarbicanCLIFixture(BarbicanFixture):
         super(BarbicanCLIFixture, cls).setUpClass(keystone_config)
         cls.setUpFixture(cls.CLIENT_TYPE, cls.BEHAVIOR_TYPE)
 
-    def tearDown(self):
-        self.behavior._delete_all_created_entities()
-        super(BarbicanCLIFixture, self).tearDown()
+    @classmethod
+    def _delete_created_entities(cls):
+        cls.behavior._delete_all_created_entities()
 
 
 class SecretsCLIFixture(BarbicanCLIFixture):
@@ -0,0 +1,312 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections import defaultdict
+import logging
+import re
+import threading
+import time
+
+from cloudroast.common.config import QuotaAdmissionConfig
+
+QUOTA_STATUS_CODES = (413, 507)
+# Also used for policy errors and conflicts, so only counted as quota errors
+# when the response body says so
+AMBIGUOUS_STATUS_CODES = (403, 409)
+_QUOTA_MESSAGE = re.compile(r"quota|limit exceeded|over ?limit", re.I)
+
+_CONTROLLERS = {}
+_CONTROLLERS_LOCK = threading.Lock()
+
+
+class AdmissionTimeout(Exception):
+    pass
+
+
+def is_quota_error(exception, status_codes=QUOTA_STATUS_CODES):
+    """
+    @summary: Whether an exception raised by a create call reports an
+              exceeded quota. Responses with one of status_codes always do,
+              and a 403 or 409 only if its body mentions a quota or limit.
+              Exceptions without a response are judged by their message.
+    """
+    response = getattr(exception, 'response', None)
+    status_code = getattr(response, 'status_code', None)
+    if status_code is None:
+        return _QUOTA_MESSAGE.search(str(exception)) is not None
+    if int(status_code) in status_codes:
+        return True
+    if int(status_code) not in AMBIGUOUS_STATUS_CODES:
+        return False
+    content = getattr(response, 'content', None) or ''
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', 'replace')
+    return _QUOTA_MESSAGE.search(content) is not None
+
+
+class QuotaReservation(object):
+    """
+    @summary: Quota held by a create request, and then by the resource it
+              created, until released. Used as a context manager, the
+              reservation is released if the block raises.
+    """
+
+    def __init__(self, controller, amounts):
+        self.controller = controller
+        self.amounts = amounts
+        self.released = False
+
+    def release(self, *args, **kwargs):
+        """Returns the quota to the controller. Safe to call repeatedly."""
+        self.controller._release(self)
+
+    def released_by(self, delete_function):
+        """
+        @summary: Wraps a delete function so that the reservation is
+                  released once the resource has been deleted
+        """
+        def delete_and_release(*args, **kwargs):
+            try:
+                return delete_function(*args, **kwargs)
+            finally:
+                self.release()
+        return delete_and_release
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.release()
+        return False
+
+
+class QuotaAdmissionController(object):
+    """
+    @summary: Holds create requests until the resources they ask for fit in
+              the quota left over by the requests already admitted
+
+    Limits are the amounts of each resource (ie, instances, cores, ram,
+    volumes, gigabytes) available to this run when it started. Resources
+    without a limit are never held. A request larger than a whole limit is
+    admitted once nothing else is held, and left to the API to refuse.
+
+    Requests only queue while other creates from this run are in flight.
+    Otherwise quota can only free up when a test deletes what it holds, so
+    a request waits retry_interval seconds for that and is then sent
+    anyway, failing as fast as it would without admission control.
+    """
+
+    def __init__(
+            self, limits, timeout=1800, max_attempts=3, retry_interval=15,
+            status_codes=QUOTA_STATUS_CODES, log=None):
+        self.limits = dict(
+            (resource, limit) for resource, limit in limits.items()
+            if limit is not None)
+        self.timeout = timeout
+        self.max_attempts = max(1, max_attempts)
+        self.retry_interval = retry_interval
+        self.status_codes = status_codes
+        self.log = log or logging.getLogger(__name__)
+        self.in_use = defaultdict(int)
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def _fits(self, amounts):
+        for resource, amount in amounts.items():
+            limit = self.limits.get(resource)
+            if limit is None or not amount:
+                continue
+            in_use = self.in_use[resource]
+            if in_use + amount > limit and in_use > 0:
+                return False
+        return True
+
+    def admit(self, timeout=None, **amounts):
+        """
+        @summary: Blocks until the amounts fit in the remaining quota and
+                  reserves them
+        @raise AdmissionTimeout: The amounts did not fit before the timeout
+        @rtype: QuotaReservation
+        """
+        deadline = time.time() + (timeout or self.timeout)
+        idle_deadline = None
+        with self._condition:
+            while not self._fits(amounts):
+                now = time.time()
+                if now >= deadline:
+                    raise AdmissionTimeout(
+                        "Timed out waiting for quota for {0}. In use by this "
+                        "run: {1}, limits: {2}".format(
+                            amounts, dict(self.in_use), self.limits))
+                if self.in_flight:
+                    idle_deadline = None
+                else:
+                    idle_deadline = idle_deadline or now + self.retry_interval
+                    if now >= idle_deadline:
+                        self.log.warning(
+                            "No quota left for {0}, sending the request "
+                            "anyway".format(amounts))
+                        break
+                self._condition.wait(
+                    min(deadline, idle_deadline or deadline) - now)
+            for resource, amount in amounts.items():
+                self.in_use[resource] += amount
+        return QuotaReservation(self, amounts)
+
+    def _release(self, reservation):
+        with self._condition:
+            if reservation.released:
+                return
+            reservation.released = True
+            for resource, amount in reservation.amounts.items():
+                self.in_use[resource] -= amount
+            self._condition.notify_all()
+
+    def _set_in_flight(self, change):
+        with self._condition:
+            self.in_flight += change
+            self._condition.notify_all()
+
+    def _lower_limits(self, amounts):
+        """
+        The quota turned out to be smaller than the limits say, ie other
+        users of the tenant hold some of it. Cap the exhausted resources at
+        what this run holds now so that requests wait for a release.
+        Returns False if this run holds none of them, as there is then
+        nothing to wait for.
+        """
+        held = False
+        with self._condition:
+            for resource in amounts:
+                if resource in self.limits and self.in_use[resource] > 0:
+                    self.limits[resource] = min(
+                        self.limits[resource], self.in_use[resource])
+                    held = True
+        return held
+
+    def create(self, create_function, **amounts):
+        """
+        @summary: Calls create_function once its amounts are admitted,
+                  retrying when it still fails with a quota error
+        @return: The return value of create_function and the reservation,
+                 which the caller releases once the resource is deleted
+        @rtype: tuple
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            reservation = self.admit(**amounts)
+            self._set_in_flight(1)
+            try:
+                return create_function(), reservation
+            except Exception as exception:
+                reservation.release()
+                if (attempt == self.max_attempts or
+                        not is_quota_error(exception, self.status_codes)):
+                    raise
+                self.log.warning(
+                    "Create failed with a quota error, attempt {0} of {1}: "
+                    "{2}".format(attempt, self.max_attempts, exception))
+            finally:
+                self._set_in_flight(-1)
+            if not self._lower_limits(amounts):
+                time.sleep(self.retry_interval)
+
+
+def get_admission_controller(
+        key, load_limits, status_codes=QUOTA_STATUS_CODES, log=None):
+    """
+    @summary: Returns the controller shared by every fixture in the process
+              for the given key (ie, service and tenant), reading the limits
+              with load_limits the first time the key is used
+    @param load_limits: Callable returning a dict of resource name to the
+                        amount available. If it fails, nothing is held.
+    @param status_codes: Response codes the service reports an exceeded
+                         quota with
+    @rtype: QuotaAdmissionController
+    """
+    with _CONTROLLERS_LOCK:
+        controller = _CONTROLLERS.get(key)
+        if controller is None:
+            config = QuotaAdmissionConfig()
+            limits = {}
+            if config.enabled:
+                try:
+                    limits = load_limits()
+                except Exception as exception:
+                    (log or logging.getLogger(__name__)).warning(
+                        "Unable to read quotas for {0}, creates will not be "
+                        "held: {1}".format(key, exception))
+            controller = QuotaAdmissionController(
+                limits, timeout=config.timeout,
+                max_attempts=config.max_attempts if config.enabled else 1,
+                retry_interval=config.retry_interval,
+                status_codes=status_codes, log=log)
+            _CONTROLLERS[key] = controller
+    return controller
+
+
+def _remaining(maximum, used=0):
+    # Negative maximums mean unlimited
+    if maximum is None or int(maximum) < 0:
+        return None
+    return int(maximum) - int(used or 0)
+
+
+def get_compute_admission_controller(limits_client, tenant_id, log=None):
+    """
+    @summary: Controller for instances, cores and ram, using the absolute
+              limits of the tenant, which account for existing servers
+    """
+    def load_limits():
+        absolute = limits_client.get_limits().entity.absolute
+        return {
+            'instances': _remaining(
+                absolute.max_total_instances, absolute.total_instances_used),
+            'cores': _remaining(
+                absolute.max_total_cores, absolute.total_cores_used),
+            'ram': _remaining(
+                absolute.max_total_ram_size, absolute.total_ram_used)}
+    return get_admission_controller(
+        ('compute', tenant_id), load_limits, log=log)
+
+
+def get_blockstorage_admission_controller(
+        volumes_client, tenant_id, log=None):
+    """
+    @summary: Controller for volumes and gigabytes. Only the default quotas
+              are readable without admin rights, and they do not account
+              for existing volumes; quota errors lower the limits as needed.
+    """
+    def load_limits():
+        quotas = volumes_client.get_default_quotas(tenant_id).entity
+        return {
+            'volumes': _remaining(quotas.volumes),
+            'gigabytes': _remaining(quotas.gigabytes)}
+    return get_admission_controller(
+        ('blockstorage', tenant_id), load_limits, log=log)
+
+
+def get_networking_admission_controller(
+        max_security_groups, tenant_id, log=None):
+    """
+    @summary: Controller for security groups, limited by the configured
+              tenant quota. Neutron refuses creates over quota with a 409
+              naming the quota, which is_quota_error recognizes.
+    """
+    return get_admission_controller(
+        ('networking', tenant_id),
+        lambda: {'security_groups': _remaining(max_security_groups)},
+        log=log)
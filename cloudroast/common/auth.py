@@ -0,0 +1,98 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import calendar
+from datetime import datetime
+from functools import partial
+import re
+import threading
+import time
+
+from cloudcafe.auth.provider import AuthProvider
+
+from cloudroast.common.concurrency import run_concurrently
+
+# Tokens expiring within this many seconds are replaced rather than reused
+TOKEN_EXPIRY_MARGIN = 300
+
+_ACCESS_DATA_CACHE = {}
+_ACCESS_DATA_LOCK = threading.Lock()
+_EXPIRES_FORMAT = '%Y-%m-%dT%H:%M:%S'
+# Fractional seconds and a UTC zone suffix, as returned by identity
+_EXPIRES_SUFFIX = re.compile(r'(\.\d+)?(Z|[+-]00:?00)?$')
+
+
+def _cache_key(endpoint_config, user_config):
+    return tuple(
+        [getattr(endpoint_config, name, None)
+         for name in ('strategy', 'auth_endpoint')] +
+        [getattr(user_config, name, None)
+         for name in ('username', 'user_id', 'tenant_id', 'tenant_name')])
+
+
+def _expires_soon(access_data):
+    """
+    @return: True if the token of access_data expires within
+             TOKEN_EXPIRY_MARGIN. Tokens with no readable expiry are
+             treated as valid.
+    """
+    expires = getattr(getattr(access_data, 'token', None), 'expires', None)
+    if isinstance(expires, datetime):
+        expires = expires.strftime(_EXPIRES_FORMAT)
+    if not expires:
+        return False
+    try:
+        expires_at = calendar.timegm(time.strptime(
+            _EXPIRES_SUFFIX.sub('', str(expires)), _EXPIRES_FORMAT))
+    except ValueError:
+        return False
+    return expires_at - time.time() < TOKEN_EXPIRY_MARGIN
+
+
+def get_cached_access_data(endpoint_config, user_config):
+    """
+    @summary: Returns access data for a user, authenticating at most once
+              per run for each distinct user and auth endpoint, and again
+              when the cached token is about to expire
+    @return: Access data, or None if authentication failed. Failures are
+             not cached.
+    """
+    key = _cache_key(endpoint_config, user_config)
+    with _ACCESS_DATA_LOCK:
+        access_data = _ACCESS_DATA_CACHE.get(key)
+    if access_data is not None and _expires_soon(access_data):
+        access_data = None
+    if access_data is None:
+        access_data = AuthProvider.get_access_data(
+            endpoint_config, user_config=user_config)
+        if access_data is not None:
+            with _ACCESS_DATA_LOCK:
+                _ACCESS_DATA_CACHE[key] = access_data
+    return access_data
+
+
+def get_access_data_concurrently(endpoint_config, user_configs):
+    """
+    @summary: Authenticates several users at once using the per run cache
+    @param user_configs: User configs to authenticate
+    @type user_configs: list
+    @return: Access data (or None on failure) for each user config, in order
+    @rtype: list
+    """
+    return run_concurrently(
+        [partial(get_cached_access_data, endpoint_config, user_config)
+         for user_config in user_configs],
+        max_workers=len(user_configs) or 1)
@@ -0,0 +1,109 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from functools import partial
+import threading
+import time
+
+DEFAULT_MAX_WORKERS = 10
+
+
+class TaskResult(object):
+    """
+    @summary: Outcome of a single task run by execute_concurrently
+    """
+
+    def __init__(self, index, result=None, exception=None, elapsed=None):
+        self.index = index
+        self.result = result
+        self.exception = exception
+        self.elapsed = elapsed
+
+    @property
+    def failed(self):
+        return self.exception is not None
+
+
+def execute_concurrently(tasks, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    @summary: Runs callables on a bounded pool of threads
+    @param tasks: Callables taking no arguments. The iterable is consumed
+                  lazily, so generators may be used for very large batches.
+    @type tasks: iterable
+    @param max_workers: Maximum number of tasks running at any one time
+    @type max_workers: int
+    @return: One TaskResult per task, in the order the tasks were given.
+             Exceptions raised by a task are captured, not raised.
+    @rtype: list
+    """
+    task_iter = enumerate(tasks)
+    iter_lock = threading.Lock()
+    results = {}
+
+    def worker():
+        while True:
+            with iter_lock:
+                try:
+                    index, task = next(task_iter)
+                except StopIteration:
+                    return
+            start = time.time()
+            try:
+                results[index] = TaskResult(
+                    index, result=task(), elapsed=time.time() - start)
+            except Exception as exception:
+                results[index] = TaskResult(
+                    index, exception=exception,
+                    elapsed=time.time() - start)
+
+    threads = [threading.Thread(target=worker)
+               for _ in range(max(1, int(max_workers)))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return [results[index] for index in sorted(results)]
+
+
+def run_concurrently(tasks, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    @summary: Runs callables concurrently and returns their results in order
+    @param tasks: Callables taking no arguments
+    @type tasks: iterable
+    @param max_workers: Maximum number of tasks running at any one time
+    @type max_workers: int
+    @return: Return values of the tasks, in the order the tasks were given
+    @rtype: list
+    @raise Exception: The first exception raised by any task, re-raised
+                      after every task has finished
+    """
+    results = execute_concurrently(tasks, max_workers=max_workers)
+    for task_result in results:
+        if task_result.failed:
+            raise task_result.exception
+    return [task_result.result for task_result in results]
+
+
+def map_concurrently(func, iterable, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    @summary: Concurrent equivalent of map() for a single argument callable
+    @return: Return values of func, in the order of iterable
+    @rtype: list
+    """
+    return run_concurrently(
+        (partial(func, item) for item in iterable), max_workers=max_workers)
@@ -0,0 +1,87 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from cafe.engine.models.data_interfaces import ConfigSectionInterface
+
+
+class QuotaAdmissionConfig(ConfigSectionInterface):
+    """Settings for quota-aware admission of resource creation."""
+
+    SECTION_NAME = 'quota_admission'
+
+    @property
+    def enabled(self):
+        """
+        Read quotas once per run and hold create requests until they fit
+        in the remaining quota. Off by default; when disabled, creates are
+        never held or retried.
+        """
+        return self.get_boolean('enabled', False)
+
+    @property
+    def timeout(self):
+        """Seconds a create request may wait for quota to free up."""
+        return int(self.get('timeout', 1800))
+
+    @property
+    def max_attempts(self):
+        """Attempts for a create that still fails with a quota error."""
+        return int(self.get('max_attempts', 3))
+
+    @property
+    def retry_interval(self):
+        """
+        Seconds to wait before retrying a create that failed with a quota
+        error while nothing else from this run held any quota.
+        """
+        return int(self.get('retry_interval', 15))
+
+
+class RequestMetricsConfig(ConfigSectionInterface):
+    """Settings for recording the latency of every API request."""
+
+    SECTION_NAME = 'request_metrics'
+
+    @property
+    def enabled(self):
+        """
+        Time every request made through a cafe HTTP client and write the
+        timings to request_metrics.<pid>.json.gz in the run's log
+        directory when the run exits.
+        """
+        return self.get_boolean('enabled', False)
+
+
+class PhaseTimingConfig(ConfigSectionInterface):
+    """Settings for profiling where the time of a test run goes."""
+
+    SECTION_NAME = 'phase_timing'
+
+    @property
+    def enabled(self):
+        """
+        Time class setup, each test's setUp, test method, tearDown and
+        cleanups, class teardown, each class cleanup and each waiter call,
+        and write them to phase_timings.jsonl and a sorted report,
+        phase_timing_report.<pid>.txt, in the run's log directory when the
+        run exits.
+        """
+        return self.get_boolean('enabled', False)
+
+    @property
+    def report_entries(self):
+        """Number of slowest classes and single timings in the report."""
+        return int(self.get('report_entries', 25))
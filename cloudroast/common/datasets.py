@@ -0,0 +1,131 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from functools import partial, wraps
+import threading
+import unittest
+
+from cafe.drivers.unittest.decorators import (
+    DATA_DRIVEN_TEST_ATTR, DATA_DRIVEN_TEST_PREFIX)
+
+from cloudroast.common.concurrency import execute_concurrently
+from cloudroast.common.metrics import test_context
+
+_DATASET_RESULTS_LOCK = threading.Lock()
+
+
+def parallel_dataset_test(func):
+    """
+    @summary: Marks a data driven test as safe to run concurrently with its
+        other datasets. Apply it directly below @data_driven_test.
+
+        When the test class sets parallel_datasets, the first marked test
+        to run executes every dataset of every marked test of the class
+        concurrently, and each generated test then replays the outcome of
+        its own dataset. Otherwise the test runs as usual.
+    """
+
+    @wraps(func)
+    def wrapper(self, **kwargs):
+        result = get_dataset_results(type(self)).get(self._testMethodName)
+        if result is None:
+            return func(self, **kwargs)
+        if result.failed:
+            raise result.exception
+        return result.result
+
+    wrapper.parallel_dataset_test = func
+    return wrapper
+
+
+def get_dataset_results(test_class):
+    """
+    @summary: Outcomes of the parallel dataset cases of a test class, run
+        the first time they are asked for, so that they run after the
+        class's own setUpClass has completed
+    @return: TaskResult for each generated test, keyed by test name. Empty
+        unless the class sets parallel_datasets.
+    @rtype: dict
+    """
+    if not getattr(test_class, 'parallel_datasets', False):
+        return {}
+    with _DATASET_RESULTS_LOCK:
+        # Looked up on the class itself so subclasses run their own cases
+        results = test_class.__dict__.get('dataset_results')
+        if results is None:
+            results = run_parallel_datasets(test_class)
+            test_class.dataset_results = results
+    return results
+
+
+def run_parallel_datasets(test_class):
+    """
+    @summary: Runs every dataset of every @parallel_dataset_test method of a
+        test class concurrently, each on its own instance of the class so
+        that test state and cleanups stay separate. Concurrency is bounded
+        by the class's get_dataset_concurrency_limit(case_count).
+    @return: TaskResult for each generated test, keyed by test name
+    @rtype: dict
+    """
+    test_names = []
+    tasks = []
+    for attr_name in dir(test_class):
+        if not attr_name.startswith(DATA_DRIVEN_TEST_PREFIX):
+            continue
+        method = getattr(test_class, attr_name, None)
+        func = getattr(method, 'parallel_dataset_test', None)
+        if not func or getattr(method, '__unittest_skip__', False):
+            continue
+        for dataset in getattr(method, DATA_DRIVEN_TEST_ATTR, []):
+            # Same naming as DataDrivenFixture uses for generated tests
+            test_name = "test_{0}_{1}".format(
+                attr_name[len(DATA_DRIVEN_TEST_PREFIX):], dataset.name)
+            test_names.append(test_name)
+            tasks.append(partial(
+                _run_dataset_case, test_class, test_name, func,
+                dataset.data))
+
+    if not tasks:
+        return {}
+    max_workers = test_class.get_dataset_concurrency_limit(len(tasks))
+    test_class.fixture_log.info(
+        "Running {0} dataset cases, {1} at a time".format(
+            len(tasks), max_workers))
+    return dict(zip(
+        test_names, execute_concurrently(tasks, max_workers=max_workers)))
+
+
+def _run_dataset_case(test_class, test_name, func, data):
+    case = test_class(test_name)
+    with test_context.scoped(test_class, test_name):
+        try:
+            return func(case, **data)
+        except unittest.SkipTest:
+            raise
+        except Exception:
+            # The traceback is lost when the test re-raises the exception
+            test_class.fixture_log.exception(
+                "Dataset case {0} failed".format(test_name))
+            raise
+        finally:
+            while case._cleanups:
+                function, args, kwargs = case._cleanups.pop()
+                try:
+                    function(*args, **kwargs)
+                except Exception as exception:
+                    test_class.fixture_log.error(
+                        "Cleanup for dataset case {0} failed: {1}".format(
+                            test_name, exception))
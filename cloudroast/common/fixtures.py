@@ -0,0 +1,130 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from cafe.drivers.unittest.fixtures import BaseTestFixture
+from cafe.engine.behaviors import BaseBehavior
+from cafe.engine.http.client import BaseHTTPClient
+from cloudcafe.common.resources import ResourcePool
+
+from cloudroast.common.metrics import test_context
+from cloudroast.common.phase_timing import (
+    PHASE_METHODS, callable_name, enable_phase_timing)
+from cloudroast.common.request_metrics import enable_request_metrics
+
+# How far below the fixture class instrument_fixture looks for clients,
+# behaviors and resource pools, ie cls.compute.servers.behaviors
+INSTRUMENT_DEPTH = 3
+
+
+class InstrumentedTestFixture(BaseTestFixture):
+    """
+    @summary: Base fixture recording request metrics and phase timings, when
+        enabled in the request_metrics and phase_timing config sections.
+        Nothing outside the fixture is patched: its own clients, behaviors
+        and resource pools are instrumented by instrument_fixture, which
+        base fixtures call once they are built in setUpClass, and again
+        before each test for anything built later.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        enable_request_metrics()
+        profiler = enable_phase_timing()
+        if profiler is not None:
+            profiler.start_class_setup(cls)
+        else:
+            test_context.set(cls)
+        super(InstrumentedTestFixture, cls).setUpClass()
+
+    @classmethod
+    def instrument_fixture(cls):
+        """
+        @summary: Records the requests of the HTTP clients, and times the
+            waiters of the behaviors and the deletes of the resource pools,
+            held by the fixture class directly or through its composites.
+            Objects already instrumented are skipped.
+        """
+        recorder = enable_request_metrics()
+        profiler = enable_phase_timing()
+        if recorder is None and profiler is None:
+            return
+        for value in _find_instances(
+                cls, (BaseHTTPClient, BaseBehavior, ResourcePool),
+                INSTRUMENT_DEPTH):
+            if isinstance(value, BaseHTTPClient):
+                if recorder is not None:
+                    recorder.instrument_client(value)
+            elif profiler is None:
+                continue
+            elif isinstance(value, BaseBehavior):
+                profiler.instrument_behavior(value)
+            else:
+                profiler.instrument_resource_pool(value)
+
+    @classmethod
+    def addClassCleanup(cls, function, *args, **kwargs):
+        profiler = enable_phase_timing()
+        if profiler is not None:
+            function = profiler.timed(
+                function, 'class_cleanup', callable_name(function))
+        super(InstrumentedTestFixture, cls).addClassCleanup(
+            function, *args, **kwargs)
+
+    def run(self, result=None):
+        self.instrument_fixture()
+        profiler = enable_phase_timing()
+        phases = {}
+        if profiler is not None:
+            profiler.end_class_setup()
+            phases = dict(PHASE_METHODS, **{self._testMethodName: 'test'})
+            for attr_name, kind in phases.items():
+                setattr(self, attr_name, profiler.timed(
+                    getattr(self, attr_name), kind))
+        try:
+            with test_context.scoped(type(self), self._testMethodName):
+                return super(InstrumentedTestFixture, self).run(result)
+        finally:
+            for attr_name in phases:
+                self.__dict__.pop(attr_name, None)
+
+
+def _find_instances(root, types, depth):
+    """
+    @summary: Instances of types among the attributes of root, and of the
+        objects it holds, down to depth levels
+    @rtype: list
+    """
+    found = []
+    seen = set()
+    level = [root]
+    for _ in range(depth):
+        next_level = []
+        for obj in level:
+            if isinstance(obj, type):
+                values = [getattr(obj, name, None) for name in dir(obj)
+                          if not name.startswith('__')]
+            else:
+                values = list(getattr(obj, '__dict__', {}).values())
+            for value in values:
+                if (id(value) in seen or callable(value) or
+                        not hasattr(value, '__dict__')):
+                    continue
+                seen.add(id(value))
+                if isinstance(value, types):
+                    found.append(value)
+                next_level.append(value)
+        level = next_level
+    return found
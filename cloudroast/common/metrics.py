@@ -0,0 +1,133 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from contextlib import contextmanager
+import json
+import os
+import threading
+
+from cafe.engine.config import EngineConfig
+
+_RESULTS_LOCK = threading.Lock()
+
+
+class TestContext(object):
+    """
+    @summary: The test class and test the calling thread is working for, set
+        explicitly by InstrumentedTestFixture and the parallel dataset
+        runner. Threads that never set one, like the workers of a concurrent
+        create, get the context of the thread running the tests.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._runner = None
+        self._runner_context = (None, None)
+
+    def get(self):
+        """
+        @return: (test class, test name), either of which may be None
+        @rtype: tuple
+        """
+        context = self._get_own()
+        return context if context is not None else self._runner_context
+
+    def set(self, test_class, test=None):
+        if self._runner is None:
+            self._runner = threading.current_thread()
+        self._set_own((test_class, test))
+
+    @contextmanager
+    def scoped(self, test_class, test=None):
+        """
+        @summary: Sets the calling thread's context for the duration of the
+            block, restoring the previous one afterwards
+        """
+        previous = self._get_own()
+        self.set(test_class, test)
+        try:
+            yield
+        finally:
+            self._set_own(previous)
+
+    def _get_own(self):
+        if threading.current_thread() is self._runner:
+            return self._runner_context
+        return getattr(self._local, 'context', None)
+
+    def _set_own(self, context):
+        if threading.current_thread() is self._runner:
+            self._runner_context = context or (None, None)
+        else:
+            self._local.context = context
+
+
+test_context = TestContext()
+
+
+def percentile(values, percent):
+    """
+    @summary: Nearest-rank percentile of a list of numbers
+    @param percent: 0 to 100
+    @return: The percentile, or None for an empty list
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = int(round(percent / 100.0 * (len(ordered) - 1)))
+    return ordered[max(0, min(rank, len(ordered) - 1))]
+
+
+def summarize_latencies(latencies):
+    """
+    @summary: Count, mean and p50/p90/p99/max of a list of durations
+    @rtype: dict
+    """
+    return {
+        'count': len(latencies),
+        'mean': sum(latencies) / len(latencies) if latencies else None,
+        'p50': percentile(latencies, 50),
+        'p90': percentile(latencies, 90),
+        'p99': percentile(latencies, 99),
+        'max': max(latencies) if latencies else None}
+
+
+def get_run_results_directory():
+    """
+    @summary: Log directory of the current test run, where machine readable
+              results are written next to the logs
+    """
+    return (os.environ.get('CAFE_TEST_LOG_PATH') or
+            EngineConfig().log_directory)
+
+
+def write_run_results(name, records):
+    """
+    @summary: Appends records to <name>.jsonl in the run's log directory,
+              one JSON object per line
+    @param records: JSON serializable dicts
+    @type records: iterable
+    @return: Path of the results file
+    @rtype: string
+    """
+    path = os.path.join(
+        get_run_results_directory(), "{0}.jsonl".format(name))
+    with _RESULTS_LOCK:
+        with open(path, 'a') as results_file:
+            for record in records:
+                results_file.write(json.dumps(record, sort_keys=True))
+                results_file.write('\n')
+    return path
@@ -0,0 +1,329 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import atexit
+from functools import wraps
+import os
+import re
+import threading
+import time
+
+from cloudroast.common.config import PhaseTimingConfig
+from cloudroast.common.metrics import (
+    get_run_results_directory, test_context, write_run_results)
+
+# Phases that together make up the time of a test class, in run order
+PHASES = ('class_setup', 'setUp', 'test', 'tearDown', 'cleanups',
+          'class_teardown')
+# Test methods timed around each test, with the phase they count to
+PHASE_METHODS = {
+    'setUp': 'setUp', 'tearDown': 'tearDown', 'doCleanups': 'cleanups'}
+CLEANUPS = ('class_cleanup', 'resource_cleanup')
+WAITS = ('wait', 'connect')
+WAITER_PREFIX = 'wait_for_'
+# Behavior methods timed as connects, with the resource type they count to
+CONNECT_METHODS = {'get_remote_instance_client': 'ssh'}
+
+_BEHAVIORS_SUFFIX = re.compile(r'_?(API)?_?Behaviou?rs?$')
+_GENERIC_WAIT_WORDS = ('status', 'state', 'resp', 'response')
+
+_profiler = None
+_install_lock = threading.Lock()
+_checked_config = False
+
+
+class PhaseProfiler(object):
+    """
+    @summary: Records the wall time of each phase of a test run. Fixtures
+        deriving from InstrumentedTestFixture time their tests' setUp, test
+        method, tearDown and doCleanups, their class cleanups, and their
+        class setup from setUpClass to the first test or teardown. Class
+        teardown is timed by wrapping each class's tearDownClass. The
+        waiters of the fixture's behaviors and the deletes of its resource
+        pools are timed individually, inside those phases.
+    """
+
+    def __init__(self, report_entries=25):
+        self.started_at = time.time()
+        self.report_entries = report_entries
+        self.records = []
+        self._setup_started = None
+        self._setup_class = None
+        self._tearing_down = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def add(self, kind, name, start, elapsed, resource_type=None):
+        test_class, test = test_context.get()
+        record = {
+            'timestamp': start,
+            'kind': kind,
+            'name': name,
+            'resource_type': resource_type,
+            'test_class': _class_name(test_class),
+            'test': test,
+            'elapsed': elapsed,
+            'pid': os.getpid(),
+            'thread': threading.current_thread().name}
+        with self._lock:
+            self.records.append(record)
+
+    def timed(self, func, kind, name=None, resource_type=None):
+        """
+        @summary: Wraps func to record each call as a timing of the given
+            kind. Calls made while the same thread is already inside a call
+            of that kind, like a waiter calling another waiter, are not
+            recorded again.
+        """
+        profiler = self
+
+        @wraps(func)
+        def timed_call(*args, **kwargs):
+            active = profiler._local.__dict__.setdefault('active', set())
+            if kind in active:
+                return func(*args, **kwargs)
+            active.add(kind)
+            start = time.time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                active.discard(kind)
+                profiler.add(
+                    kind, name, start, time.time() - start, resource_type)
+
+        return timed_call
+
+    def instrument_behavior(self, behavior):
+        """
+        @summary: Times the waiters and remote client connects of a single
+            behavior instance. Other instances of its class are untouched.
+        """
+        if behavior.__dict__.get('_phase_timed'):
+            return
+        behavior._phase_timed = True
+        behavior_class = type(behavior)
+        for attr_name in dir(behavior_class):
+            if attr_name.startswith(WAITER_PREFIX):
+                kind = 'wait'
+                resource_type = waiter_resource_type(
+                    behavior_class, attr_name)
+            elif attr_name in CONNECT_METHODS:
+                kind = 'connect'
+                resource_type = CONNECT_METHODS[attr_name]
+            else:
+                continue
+            method = getattr(behavior, attr_name)
+            if not callable(method):
+                continue
+            setattr(behavior, attr_name, self.timed(
+                method, kind, '{0}.{1}'.format(
+                    behavior_class.__name__, attr_name), resource_type))
+
+    def instrument_resource_pool(self, pool):
+        """
+        @summary: Times each delete of the resources later added to pool
+        """
+        if pool.__dict__.get('_phase_timed'):
+            return
+        pool._phase_timed = True
+        profiler = self
+        add = pool.add
+
+        @wraps(add)
+        def timed_add(resource_id, delete_function, *args, **kwargs):
+            return add(resource_id, profiler.timed(
+                delete_function, 'resource_cleanup',
+                callable_name(delete_function)), *args, **kwargs)
+
+        pool.add = timed_add
+
+    def start_class_setup(self, test_class):
+        if test_class is self._setup_class and self._setup_started:
+            # Fixtures with several base fixtures start it more than once
+            return
+        self.end_class_setup()
+        test_context.set(test_class)
+        self._setup_class = test_class
+        self._setup_started = time.time()
+        self._time_class_teardown(test_class)
+
+    def end_class_setup(self):
+        if self._setup_started is not None:
+            self.add('class_setup', None, self._setup_started,
+                     time.time() - self._setup_started)
+            self._setup_started = None
+
+    def _time_class_teardown(self, test_class):
+        if getattr(test_class.tearDownClass, 'phase_timed', False):
+            return
+        profiler = self
+        teardown = test_class.tearDownClass.__func__
+
+        @wraps(teardown)
+        def timed_teardown(cls):
+            if profiler._tearing_down:
+                # A subclass teardown calling its parent's
+                return teardown(cls)
+            profiler.end_class_setup()
+            test_context.set(cls)
+            profiler._tearing_down = True
+            start = time.time()
+            try:
+                return teardown(cls)
+            finally:
+                profiler._tearing_down = False
+                profiler.add('class_teardown', None, start,
+                             time.time() - start)
+
+        timed_teardown.phase_timed = True
+        test_class.tearDownClass = classmethod(timed_teardown)
+
+    def report(self):
+        """
+        @summary: Where the run's time went, each section sorted by total
+            time, largest first
+        @rtype: string
+        """
+        with self._lock:
+            records = list(self.records)
+        wall_time = time.time() - self.started_at
+        phases = [r for r in records if r['kind'] in PHASES]
+        waits = [r for r in records if r['kind'] in WAITS]
+        cleanups = [r for r in records if r['kind'] in CLEANUPS]
+
+        lines = ["Phase timings of process {0}, {1:.1f}s of wall time".format(
+            os.getpid(), wall_time)]
+        lines.extend(_format_section(
+            "Time by phase", _group(phases, 'kind'), wall_time))
+        lines.extend(_format_section(
+            "Slowest classes", _group(phases, 'test_class'), wall_time,
+            self.report_entries))
+        lines.extend(_format_section(
+            "Waits and connects by resource type, part of the phases above."
+            " Concurrent calls overlap.",
+            _group(waits, 'kind', 'resource_type'), wall_time))
+        lines.extend(_format_section(
+            "Class and resource cleanups, part of the phases above",
+            _group(cleanups, 'name'), wall_time, self.report_entries))
+
+        lines.extend(['', "Slowest single timings"])
+        for record in sorted(
+                records, key=lambda r: r['elapsed'],
+                reverse=True)[:self.report_entries]:
+            lines.append("  {0:10.1f}s  {1:<16} {2} {3}".format(
+                record['elapsed'], record['kind'],
+                '.'.join(str(part) for part in (
+                    record['test_class'], record['test']) if part),
+                record['name'] or '').rstrip())
+        return '\n'.join(lines) + '\n'
+
+
+def enable_phase_timing():
+    """
+    @summary: Starts profiling the phases of this process's test run, when
+        enabled in the phase_timing config. Called by InstrumentedTestFixture
+        at class setup. The records and report are written when the process
+        exits.
+    @return: The process's profiler, or None when disabled
+    @rtype: PhaseProfiler
+    """
+    global _profiler, _checked_config
+    with _install_lock:
+        if not _checked_config:
+            _checked_config = True
+            config = PhaseTimingConfig()
+            if config.enabled:
+                _profiler = PhaseProfiler(config.report_entries)
+                atexit.register(export_phase_timings)
+    return _profiler
+
+
+def export_phase_timings():
+    """
+    @summary: Appends this process's timings to phase_timings.jsonl and
+        writes its report to phase_timing_report.<pid>.txt, both in the
+        run's log directory
+    @return: Path of the report, or None if nothing was recorded
+    """
+    if _profiler is None:
+        return None
+    _profiler.end_class_setup()
+    if not _profiler.records:
+        return None
+    write_run_results('phase_timings', _profiler.records)
+    path = os.path.join(
+        get_run_results_directory(),
+        'phase_timing_report.{0}.txt'.format(os.getpid()))
+    with open(path, 'w') as report_file:
+        report_file.write(_profiler.report())
+    return path
+
+
+def waiter_resource_type(behavior_class, waiter_name):
+    """
+    @summary: Resource a waiter waits on, from its name, ie 'server' for
+        wait_for_servers_to_be_deleted. Falls back to the behavior class
+        name for waiters named only for what they wait for, like
+        wait_for_status.
+    """
+    resource_type = waiter_name[len(WAITER_PREFIX):].split('_')[0]
+    if not resource_type or resource_type in _GENERIC_WAIT_WORDS:
+        return _BEHAVIORS_SUFFIX.sub('', behavior_class.__name__).lower()
+    if resource_type.endswith('s') and not resource_type.endswith('ss'):
+        resource_type = resource_type[:-1]
+    return resource_type
+
+
+def _class_name(test_class):
+    if test_class is None:
+        return None
+    return '{0}.{1}'.format(test_class.__module__, test_class.__name__)
+
+
+def callable_name(func):
+    name = getattr(func, '__name__', None) or type(func).__name__
+    owner = getattr(func, '__self__', None)
+    if owner is not None:
+        owner = owner if isinstance(owner, type) else type(owner)
+        name = '{0}.{1}'.format(owner.__name__, name)
+    return name
+
+
+def _group(records, *keys):
+    """
+    @return: (key, total, count, longest) for each distinct value of keys,
+        largest total first
+    @rtype: list
+    """
+    groups = {}
+    for record in records:
+        key = ' '.join(str(record[k]) for k in keys)
+        total, count, longest = groups.get(key, (0, 0, 0))
+        groups[key] = (total + record['elapsed'], count + 1,
+                       max(longest, record['elapsed']))
+    return sorted(
+        [(key,) + values for key, values in groups.items()],
+        key=lambda group: group[1], reverse=True)
+
+
+def _format_section(title, groups, wall_time, limit=None):
+    lines = ['', title]
+    for key, total, count, longest in groups[:limit]:
+        lines.append(
+            "  {0:10.1f}s {1:6.1f}% {2:7d} x  longest {3:8.1f}s  {4}".format(
+                total, 100.0 * total / wall_time if wall_time else 0, count,
+                longest, key))
+    return lines
@@ -0,0 +1,206 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import atexit
+from functools import wraps
+import gzip
+import json
+import os
+import re
+import threading
+import time
+
+from cloudroast.common.config import RequestMetricsConfig
+from cloudroast.common.metrics import get_run_results_directory, test_context
+
+try:
+    from urlparse import urlsplit
+except ImportError:
+    from urllib.parse import urlsplit
+
+COLUMNS = ('timestamp', 'test_class', 'test', 'method', 'url_template',
+           'status', 'request_bytes', 'response_bytes', 'latency')
+# Columns with few distinct values, stored as indexes into a value list
+DICTIONARY_COLUMNS = ('test_class', 'test', 'method', 'url_template')
+
+_VERSION_SEGMENT = re.compile(r'^v\d+(\.\d+)*$')
+_ACCOUNT_SEGMENT = re.compile(r'^AUTH_')
+_DIGIT = re.compile(r'\d')
+
+_recorder = None
+_install_lock = threading.Lock()
+_checked_config = False
+
+
+class RequestRecorder(object):
+    """
+    @summary: Collects one row per request, column by column
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.columns = dict((name, []) for name in COLUMNS)
+        self.dictionaries = dict((name, {}) for name in DICTIONARY_COLUMNS)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.columns['timestamp'])
+
+    def record(self, **values):
+        values['timestamp'] = round(values['timestamp'] - self.started_at, 3)
+        values['latency'] = round(values['latency'], 6)
+        with self._lock:
+            for name in COLUMNS:
+                value = values.get(name)
+                if name in self.dictionaries:
+                    value = self.dictionaries[name].setdefault(
+                        value, len(self.dictionaries[name]))
+                self.columns[name].append(value)
+
+    def instrument_client(self, client):
+        """
+        @summary: Records every request made through a single HTTP client
+            instance, against the test set in test_context by the thread
+            making it. Other instances of its class are untouched.
+        """
+        if client.__dict__.get('_request_metrics'):
+            return
+        client._request_metrics = True
+        client.request = _instrument(client.request, self)
+
+    def export(self, path):
+        """
+        @summary: Writes the rows as gzipped JSON holding one list per
+            column. Timestamps are seconds since started_at, and the
+            dictionary columns hold indexes into their dictionaries list.
+        @return: path
+        """
+        with self._lock:
+            document = {
+                'started_at': self.started_at,
+                'row_count': len(self),
+                'columns': self.columns,
+                'dictionaries': dict(
+                    (name, sorted(values, key=values.get))
+                    for name, values in self.dictionaries.items())}
+            data = json.dumps(document, separators=(',', ':'))
+        output = gzip.open(path, 'wb')
+        try:
+            output.write(data.encode('utf-8'))
+        finally:
+            output.close()
+        return path
+
+
+def enable_request_metrics():
+    """
+    @summary: Starts recording request timings for this process, when
+        enabled in the request_metrics config. Called by
+        InstrumentedTestFixture, which instruments its own clients with the
+        returned recorder. The timings are exported when the process exits.
+    @return: The process's recorder, or None when disabled
+    @rtype: RequestRecorder
+    """
+    global _recorder, _checked_config
+    with _install_lock:
+        if not _checked_config:
+            _checked_config = True
+            if RequestMetricsConfig().enabled:
+                _recorder = RequestRecorder()
+                atexit.register(export_request_metrics)
+    return _recorder
+
+
+def export_request_metrics():
+    """
+    @summary: Writes this process's timings to
+        request_metrics.<pid>.json.gz in the run's log directory
+    @return: Path of the file, or None if nothing was recorded
+    """
+    if not _recorder:
+        return None
+    return _recorder.export(os.path.join(
+        get_run_results_directory(),
+        'request_metrics.{0}.json.gz'.format(os.getpid())))
+
+
+def url_template(url):
+    """
+    @summary: Reduces a request URL to its endpoint, so that requests for
+        different resources can be compared. The query string is dropped,
+        Swift accounts become {account}, and any other path segment holding
+        a digit (ids, generated names) except a version becomes {id}.
+    """
+    parts = urlsplit(url)
+    segments = []
+    for segment in parts.path.split('/'):
+        if _ACCOUNT_SEGMENT.match(segment):
+            segment = '{account}'
+        elif _DIGIT.search(segment) and not _VERSION_SEGMENT.match(segment):
+            segment = '{id}'
+        segments.append(segment)
+    return '{0}://{1}{2}'.format(
+        parts.scheme, parts.netloc, '/'.join(segments))
+
+
+def _instrument(request, recorder):
+
+    @wraps(request)
+    def instrumented_request(method, url, *args, **kwargs):
+        test_class, test = test_context.get()
+        data = kwargs.get('data', args[2] if len(args) > 2 else None)
+        response = None
+        start = time.time()
+        try:
+            response = request(method, url, *args, **kwargs)
+            return response
+        finally:
+            latency = time.time() - start
+            recorder.record(
+                timestamp=start, latency=latency,
+                test_class=_class_name(test_class), test=test,
+                method=method.upper(), url_template=url_template(url),
+                status=getattr(response, 'status_code', None),
+                request_bytes=_get_size(data),
+                response_bytes=_get_response_size(response))
+
+    return instrumented_request
+
+
+def _class_name(test_class):
+    if test_class is None:
+        return None
+    return '{0}.{1}'.format(test_class.__module__, test_class.__name__)
+
+
+def _get_size(data):
+    if data is None:
+        return 0
+    try:
+        return len(data)
+    except TypeError:
+        return None
+
+
+def _get_response_size(response):
+    length = getattr(response, 'headers', {}).get('content-length')
+    if length is not None and length.isdigit():
+        return int(length)
+    # Only count bodies already read, so streamed responses are untouched
+    content = getattr(response, '_content', None)
+    if isinstance(content, bytes):
+        return len(content)
+    return None
@@ -40,9 +40,8 @@ class HypervisorsAdminTest(ComputeAdminFixture):
         Test that a created instance is correctly listed on a hypervisor
 
         As the admin user create an instance and wait for that instance to
-        become active. Get a list of hypervisors and search through the
-        instance id list on each hypervisor to ensure that the instance can
-        be found.
+        become active. Search the instance id lists of the hypervisors,
+        concurrently, to ensure that the instance can be found.
 
         The following assertions occur:
             - The id of the instance created during the test is found in the
@@ -50,11 +49,6 @@ class HypervisorsAdminTest(ComputeAdminFixture):
         """
         server = self.admin_server_behaviors.create_active_server().entity
         self.resources.add(server.id, self.admin_servers_client.delete_server)
-        hypervisors = self.admin_hypervisors_client.list_hypervisors().entity
-        for hypervisor in hypervisors:
-            hypervisor_with_servers = self.admin_hypervisors_client.\
-                list_hypervisor_servers(hypervisor.hypervisor_hostname).entity
-        server_id_list = [hypervisor_server.id for
-                          hypervisor_server in hypervisor_with_servers.servers]
-        self.assertIn(server.id, server_id_list,
-                      "Server not found in the Server list")
+        hypervisor_hostname = self.find_instance_hypervisor(server.id)
+        self.assertIsNotNone(hypervisor_hostname,
+                             "Server not found in the Server list")
@@ -0,0 +1,110 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from cafe.engine.models.data_interfaces import ConfigSectionInterface
+
+
+class MigrationMeasurementConfig(ConfigSectionInterface):
+    """Settings for measuring server downtime during migrations."""
+
+    SECTION_NAME = 'migration_measurement'
+
+    def _get_optional_float(self, name):
+        value = self.get(name)
+        return float(value) if value else None
+
+    @property
+    def probe_protocol(self):
+        """'tcp' to connect to probe_port, or 'icmp' to ping."""
+        return self.get('probe_protocol', 'tcp')
+
+    @property
+    def probe_port(self):
+        return int(self.get('probe_port', 22))
+
+    @property
+    def probe_interval(self):
+        """Seconds between the starts of consecutive probes."""
+        return float(self.get('probe_interval', 0.05))
+
+    @property
+    def probe_timeout(self):
+        return float(self.get('probe_timeout', 0.5))
+
+    @property
+    def dirty_memory_mb(self):
+        """
+        Memory rewritten in a loop on the guest during live migrations,
+        which needs SSH access to the guest. 0 disables the workload.
+        """
+        return int(self.get('dirty_memory_mb', 0))
+
+    @property
+    def workload_window(self):
+        """
+        Seconds the workload runs before and after a migration, over which
+        pre and post migration throughput are measured. Migrations without
+        a workload are not delayed.
+        """
+        return float(self.get('workload_window', 10))
+
+    @property
+    def max_duration(self):
+        """Longest acceptable migration in seconds, unset for no limit."""
+        return self._get_optional_float('max_duration')
+
+    @property
+    def max_blackout(self):
+        """Longest acceptable single blackout in seconds."""
+        return self._get_optional_float('max_blackout')
+
+    @property
+    def max_total_blackout(self):
+        """Longest acceptable sum of all blackouts in seconds."""
+        return self._get_optional_float('max_total_blackout')
+
+    @property
+    def min_throughput_ratio(self):
+        """
+        Lowest acceptable ratio of post to pre migration workload
+        throughput, ie 0.8.
+        """
+        return self._get_optional_float('min_throughput_ratio')
+
+
+class HypervisorInventoryConfig(ConfigSectionInterface):
+    """Settings for looking instances up across hypervisors."""
+
+    SECTION_NAME = 'hypervisor_inventory'
+
+    @property
+    def max_workers(self):
+        """Hypervisors queried at once."""
+        return int(self.get('max_workers', 20))
+
+
+class RHELActivationConfig(ConfigSectionInterface):
+    """Settings for the RHEL activation tests."""
+
+    SECTION_NAME = 'rhel_activation'
+
+    @property
+    def max_concurrent_builds(self):
+        """
+        Servers built at once, one per Red Hat image. Builds beyond this
+        wait for a running one to finish.
+        """
+        return int(self.get('max_concurrent_builds', 5))
@@ -14,10 +14,12 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import time
+from functools import partial
+import json
 import sys
+import threading
+import time
 
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.common.resources import ResourcePool
 from cloudcafe.compute.config import ComputeEndpointConfig, \
     MarshallingConfig
@@ -26,14 +28,31 @@ from cloudcafe.compute.composites import ComputeComposite, \
 from cloudcafe.compute.common.exception_handler import ExceptionHandler
 from cloudcafe.compute.common.clients.ping import PingClient
 from cloudcafe.compute.common.exceptions import ServerUnreachable
+from cloudcafe.compute.common.types import NovaServerStatusTypes
 from cloudcafe.objectstorage.composites import ObjectStorageComposite
-
-
-class ComputeFixture(BaseTestFixture):
+from cloudroast.common.admission import \
+    get_blockstorage_admission_controller, \
+    get_compute_admission_controller, is_quota_error
+from cloudroast.common.concurrency import run_concurrently
+from cloudroast.common.fixtures import InstrumentedTestFixture
+from cloudroast.common.metrics import write_run_results
+from cloudroast.compute.config import (
+    HypervisorInventoryConfig, MigrationMeasurementConfig)
+from cloudroast.compute.migration import (
+    ConnectivityProbe, MigrationMeasurement, get_guest_time,
+    start_dirty_memory_workload, stop_dirty_memory_workload,
+    workload_throughput)
+from cloudroast.objectstorage.fixtures import (
+    iter_container_names, iter_listing)
+
+
+class ComputeFixture(InstrumentedTestFixture):
     """
     @summary: Base fixture for compute tests
     """
 
+    _server_quota_amounts = {}
+
     @classmethod
     def setUpClass(cls):
         super(ComputeFixture, cls).setUpClass()
@@ -89,6 +108,10 @@ class ComputeFixture(BaseTestFixture):
         cls.flavors_client.add_exception_handler(cls.compute_exception_handler)
         cls.resources = ResourcePool()
         cls.addClassCleanup(cls.resources.release)
+        cls.compute_admission = get_compute_admission_controller(
+            cls.limits_client, getattr(cls.user_config, 'tenant_id', None),
+            log=cls.fixture_log)
+        cls.instrument_fixture()
 
     @classmethod
     def tearDownClass(cls):
@@ -104,6 +127,31 @@ class ComputeFixture(BaseTestFixture):
                 self.resources.resources = []
         super(ComputeFixture, self).tearDownClass()
 
+    @classmethod
+    def get_server_quota_amounts(cls, flavor_ref=None):
+        """
+        @summary: Quota a server of the given flavor takes up, for use with
+            the compute admission controller
+        @param flavor_ref: Flavor id, defaults to the primary flavor
+        @type flavor_ref: String
+        @return: Amount of each compute quota resource
+        @rtype: dict
+        """
+        flavor_ref = flavor_ref or cls.flavor_ref
+        amounts = cls._server_quota_amounts.get(flavor_ref)
+        if amounts is None:
+            amounts = {'instances': 1}
+            try:
+                flavor = cls.flavors_client.get_flavor_details(
+                    flavor_ref).entity
+                amounts.update(cores=int(flavor.vcpus), ram=int(flavor.ram))
+            except Exception as exception:
+                cls.fixture_log.warning(
+                    "Unable to look up flavor {0}, only instances will be "
+                    "counted against quota: {1}".format(flavor_ref, exception))
+            cls._server_quota_amounts[flavor_ref] = amounts
+        return amounts
+
     @classmethod
     def parse_image_id(cls, image_response):
         """
@@ -229,6 +277,9 @@ class ComputeAdminFixture(ComputeFixture):
         cls.admin_server_behaviors = cls.compute_admin.servers.behaviors
         cls.admin_images_behaviors = cls.compute_admin.images.behaviors
         cls.admin_servers_client.add_exception_handler(ExceptionHandler())
+        cls.migration_config = MigrationMeasurementConfig()
+        cls.hypervisor_inventory_config = HypervisorInventoryConfig()
+        cls._instance_host_index = None
 
     @classmethod
     def tearDownClass(cls):
@@ -236,6 +287,240 @@ class ComputeAdminFixture(ComputeFixture):
         cls.flavors_client.delete_exception_handler(ExceptionHandler())
         cls.resources.release()
 
+    @classmethod
+    def list_hypervisor_servers(cls, hypervisor_hostname):
+        """
+        @summary: Ids of the instances on each hypervisor matching a
+            hypervisor hostname. Nova matches the hostname as a substring,
+            so a query for compute1 also returns compute10, compute11 and
+            so on; each is keyed by its own hostname.
+        @return: Set of instance ids keyed by hypervisor hostname
+        @rtype: dict
+        """
+        entity = cls.admin_hypervisors_client.list_hypervisor_servers(
+            hypervisor_hostname).entity
+        hypervisors = entity if isinstance(entity, list) else [entity]
+        return dict(
+            (hypervisor.hypervisor_hostname, set(
+                server.id for server in
+                getattr(hypervisor, 'servers', None) or []))
+            for hypervisor in hypervisors if hypervisor)
+
+    @classmethod
+    def list_hypervisor_server_ids(cls, hypervisor_hostname):
+        """
+        @summary: Ids of the instances on the hypervisor with exactly this
+            hostname
+        @rtype: set
+        """
+        return cls.list_hypervisor_servers(hypervisor_hostname).get(
+            hypervisor_hostname, set())
+
+    @classmethod
+    def _list_hypervisor_hostnames(cls):
+        return [hypervisor.hypervisor_hostname for hypervisor in
+                cls.admin_hypervisors_client.list_hypervisors().entity]
+
+    @classmethod
+    def get_instance_host_index(cls, refresh=False):
+        """
+        @summary: Maps the id of every instance in the deployment to the
+            hostname of its hypervisor. The hypervisors are queried
+            concurrently and the index is built once per class. A query
+            also returns the hypervisors whose hostnames contain the one
+            asked for, and those are not queried again unless the query
+            for them has already started.
+        @param refresh: Rebuild the index even if it was already built
+        @type refresh: Boolean
+        @rtype: dict
+        """
+        if refresh or cls._instance_host_index is None:
+            listed = {}
+
+            def list_servers(hostname):
+                if hostname not in listed:
+                    listed.update(cls.list_hypervisor_servers(hostname))
+
+            # Shorter hostnames first, as their queries cover longer ones
+            run_concurrently(
+                (partial(list_servers, hostname) for hostname in sorted(
+                    cls._list_hypervisor_hostnames(), key=len)),
+                max_workers=cls.hypervisor_inventory_config.max_workers)
+            cls._instance_host_index = dict(
+                (server_id, hostname)
+                for hostname, server_ids in listed.items()
+                for server_id in server_ids)
+        return cls._instance_host_index
+
+    @classmethod
+    def find_instance_hypervisor(cls, server_id):
+        """
+        @summary: Finds the hypervisor an instance is on. The class's index
+            is used if it has the instance; otherwise the hypervisors are
+            queried concurrently and no more queries start once one of them
+            has found the instance.
+        @return: Hypervisor hostname, or None if no hypervisor has it
+        @rtype: String
+        """
+        index = cls._instance_host_index or {}
+        if server_id in index:
+            return index[server_id]
+
+        found = threading.Event()
+
+        def search(hostname):
+            if found.is_set():
+                return None
+            for listed_hostname, server_ids in cls.list_hypervisor_servers(
+                    hostname).items():
+                if server_id in server_ids:
+                    found.set()
+                    return listed_hostname
+            return None
+
+        hostnames = sorted(cls._list_hypervisor_hostnames(), key=len)
+        matches = run_concurrently(
+            (partial(search, hostname) for hostname in hostnames),
+            max_workers=cls.hypervisor_inventory_config.max_workers)
+        hostname = next((match for match in matches if match), None)
+        if hostname and cls._instance_host_index is not None:
+            cls._instance_host_index[server_id] = hostname
+        return hostname
+
+    def measure_live_migration(self, server, remote_client=None,
+                               block_migration=True, disk_over_commit=False):
+        """
+        @summary: Live migrates a server, waiting for it to be active again,
+            and measures the downtime. See measure_migration.
+        @rtype: MigrationMeasurement
+        """
+        def migrate():
+            self.admin_servers_client.live_migrate_server(
+                server.id, block_migration=block_migration,
+                disk_over_commit=disk_over_commit)
+            self.admin_server_behaviors.wait_for_server_status(
+                server.id, NovaServerStatusTypes.ACTIVE)
+
+        return self.measure_migration(
+            server, 'live', migrate, remote_client=remote_client)
+
+    def measure_cold_migration(self, server):
+        """
+        @summary: Migrates a server, confirming the resize once it is
+            verified, and measures the downtime. The guest is restarted, so
+            no workload runs on it. See measure_migration.
+        @rtype: MigrationMeasurement
+        """
+        def migrate():
+            self.admin_servers_client.migrate_server(server.id)
+            self.admin_server_behaviors.wait_for_server_status(
+                server.id, NovaServerStatusTypes.VERIFY_RESIZE)
+            self.admin_servers_client.confirm_resize(server.id)
+            self.admin_server_behaviors.wait_for_server_status(
+                server.id, NovaServerStatusTypes.ACTIVE)
+
+        return self.measure_migration(server, 'cold', migrate)
+
+    def measure_migration(self, server, migration_type, migrate,
+                          remote_client=None):
+        """
+        @summary: Runs a migration while probing the server from the runner
+            at a high frequency. Given a remote client, and dirty_memory_mb
+            in the migration_measurement config, a memory dirtying workload
+            runs on the guest throughout, and its throughput is compared
+            over workload_window seconds before and after the migration.
+            The measurement is logged and appended to
+            migration_measurement.jsonl in the run's log directory.
+        @param migrate: Callable that migrates the server and returns once
+            the migration has completed
+        @type migrate: callable
+        @rtype: MigrationMeasurement
+        """
+        config = self.migration_config
+        address = server.addresses.get_by_name(
+            self.servers_config.network_for_ssh)
+        address = (address.ipv4 if
+                   self.servers_config.ip_address_version_for_ssh == 4
+                   else address.ipv6)
+        host_before = self.admin_servers_client.get_server(
+            server.id).entity.host
+
+        workload = remote_client is not None and config.dirty_memory_mb > 0
+        guest_times = {}
+        if workload:
+            start_dirty_memory_workload(remote_client, config.dirty_memory_mb)
+            guest_times['workload_start'] = get_guest_time(remote_client)
+
+        probe = ConnectivityProbe(
+            address, protocol=config.probe_protocol, port=config.probe_port,
+            interval=config.probe_interval,
+            timeout=config.probe_timeout).start()
+        pass_times = []
+        try:
+            if workload:
+                time.sleep(config.workload_window)
+                guest_times['migration_start'] = get_guest_time(remote_client)
+            start = time.time()
+            migrate()
+            end = time.time()
+            if workload:
+                guest_times['migration_end'] = get_guest_time(remote_client)
+                time.sleep(config.workload_window)
+        finally:
+            samples = probe.stop()
+            if workload:
+                guest_times['workload_end'] = get_guest_time(remote_client)
+                pass_times = stop_dirty_memory_workload(remote_client)
+
+        measurement = MigrationMeasurement(
+            migration_type, server.id, start, end, samples,
+            host_before=host_before,
+            host_after=self.admin_servers_client.get_server(
+                server.id).entity.host)
+        if workload:
+            measurement.pre_throughput = workload_throughput(
+                pass_times, guest_times['workload_start'],
+                guest_times['migration_start'], config.dirty_memory_mb)
+            measurement.post_throughput = workload_throughput(
+                pass_times, guest_times['migration_end'],
+                guest_times['workload_end'], config.dirty_memory_mb)
+            measurement.max_guest_stall = max(
+                [later - earlier for earlier, later
+                 in zip(pass_times, pass_times[1:])] or [None])
+
+        record = measurement.to_record()
+        write_run_results('migration_measurement', [record])
+        self.fixture_log.info(json.dumps(record, sort_keys=True))
+        return measurement
+
+    def assert_migration_thresholds(self, measurement):
+        """
+        @summary: Fails if a measurement exceeds any threshold set in the
+            migration_measurement config
+        @type measurement: MigrationMeasurement
+        """
+        config = self.migration_config
+        checks = [
+            ('duration', measurement.duration, config.max_duration),
+            ('longest blackout', measurement.max_blackout,
+             config.max_blackout),
+            ('total blackout', measurement.total_blackout,
+             config.max_total_blackout)]
+        failures = [
+            "{0} migration {1} of {2:.2f}s exceeds {3:.2f}s".format(
+                measurement.migration_type, name, value, limit)
+            for name, value, limit in checks
+            if limit is not None and value > limit]
+
+        ratio = measurement.throughput_ratio
+        if (config.min_throughput_ratio is not None and ratio is not None and
+                ratio < config.min_throughput_ratio):
+            failures.append(
+                "{0} migration throughput ratio of {1:.2f} is below "
+                "{2:.2f}".format(measurement.migration_type, ratio,
+                                 config.min_throughput_ratio))
+        self.assertEqual([], failures, "\n".join(failures))
+
 
 class BlockstorageIntegrationFixture(ComputeFixture):
 
@@ -252,6 +537,8 @@ class BlockstorageIntegrationFixture(ComputeFixture):
         cls.volume_create_timeout = volumes.config.volume_create_max_timeout
         cls.blockstorage_client = volumes.client
         cls.blockstorage_behavior = volumes.behaviors
+        cls.blockstorage_admission = get_blockstorage_admission_controller(
+            volumes.client, volumes.auth.tenant_id, log=cls.fixture_log)
 
 
 class ObjectstorageIntegrationFixture(ComputeFixture):
@@ -263,6 +550,64 @@ class ObjectstorageIntegrationFixture(ComputeFixture):
         cls.object_storage_client = cls.object_storage_api.client
         cls.object_storage_behaviors = cls.object_storage_api.behaviors
 
+    @classmethod
+    def container_exists(cls, container_name, confirm=True):
+        """
+        @summary: Looks a container up in the account listing. Listing with
+            the name as prefix puts the container first if it exists, so a
+            single entry is requested however many containers there are.
+        @param confirm: Also require a HEAD of the container to succeed
+        @type confirm: Boolean
+        @rtype: Boolean
+        """
+        listed = next(iter_container_names(
+            cls.object_storage_client, prefix=container_name, page_size=1),
+            None) == container_name
+        if not listed or not confirm:
+            return listed
+        return cls.object_storage_client.get_container_metadata(
+            container_name).ok
+
+    @classmethod
+    def get_container_object_count(cls, container_name):
+        """
+        @summary: Object count of a container, from its HEAD response
+        @return: Count, or 0 if the container does not exist
+        @rtype: int
+        """
+        resp = cls.object_storage_client.get_container_metadata(
+            container_name)
+        if not resp.ok:
+            return 0
+        return int(resp.headers.get('x-container-object-count', 0))
+
+    @classmethod
+    def count_objects(
+            cls, object_prefix, container_prefix=None, stop_at=None):
+        """
+        @summary: Counts the objects whose names start with object_prefix
+            in every container whose name starts with container_prefix.
+            Containers whose object-count header is 0 are not listed, and
+            matching objects are counted without keeping the listing.
+        @param stop_at: Stop counting once this many objects were found,
+            ie 1 to only check whether any exist
+        @type stop_at: int
+        @rtype: int
+        """
+        count = 0
+        for container_name in iter_container_names(
+                cls.object_storage_client, prefix=container_prefix):
+            if not cls.get_container_object_count(container_name):
+                continue
+            for _ in iter_listing(
+                    partial(cls.object_storage_client.list_objects,
+                            container_name),
+                    params={'prefix': object_prefix}):
+                count += 1
+                if stop_at and count >= stop_at:
+                    return count
+        return count
+
 
 class ServerFromImageFixture(ComputeFixture):
 
@@ -280,10 +625,15 @@ class ServerFromImageFixture(ComputeFixture):
             the server domain object
         @rtype: Request Response Object
         """
-        cls.server_response = cls.server_behaviors.create_active_server(
-            flavor_ref=flavor_ref, key_name=key_name, image_ref=image_ref)
+        cls.server_response, reservation = cls.compute_admission.create(
+            partial(cls.server_behaviors.create_active_server,
+                    flavor_ref=flavor_ref, key_name=key_name,
+                    image_ref=image_ref),
+            **cls.get_server_quota_amounts(flavor_ref))
         cls.server = cls.server_response.entity
-        cls.resources.add(cls.server.id, cls.servers_client.delete_server)
+        cls.resources.add(
+            cls.server.id,
+            reservation.released_by(cls.servers_client.delete_server))
         return cls.server
 
 
@@ -301,19 +651,32 @@ class ServerFromVolumeV1Fixture(BlockstorageIntegrationFixture):
             the server domain object
         @rtype: Request Response Object
         """
-        # Creating a volume for the block device mapping
+        # Creating a volume for the block device mapping. The admission
+        # controller only reserves the quota here, retries are left to
+        # resource_build_attempts. Quota errors (including the 507 for
+        # exhausted backend capacity) wait before the next attempt.
         failures = []
+        cls.volume = None
         attempts = cls.servers_config.resource_build_attempts
         for attempt in range(attempts):
             try:
-                cls.volume = cls.blockstorage_behavior.create_available_volume(
-                    size=cls.volume_size,
-                    volume_type=cls.volume_type,
-                    image_ref=cls.image_ref)
+                with cls.blockstorage_admission.admit(
+                        volumes=1, gigabytes=cls.volume_size) as \
+                        volume_reservation:
+                    cls.volume = \
+                        cls.blockstorage_behavior.create_available_volume(
+                            size=cls.volume_size,
+                            volume_type=cls.volume_type,
+                            image_ref=cls.image_ref)
+                break
             except Exception as ex:
-                if '507' in ex.message:
+                failures.append(str(ex))
+                if is_quota_error(ex):
                     time.sleep(cls.servers_config.server_status_interval)
-                failures.append(ex.message)
+        if cls.volume is None:
+            raise Exception(
+                "Unable to create a volume to boot from after {0} attempts: "
+                "{1}".format(attempts, "; ".join(failures)))
         # Creating block device mapping used for server creation
         cls.block_device_mapping_matrix = [{
             "volume_id": cls.volume.id_,
@@ -322,11 +685,27 @@ class ServerFromVolumeV1Fixture(BlockstorageIntegrationFixture):
             "size": cls.volume_size,
             "type": ''}]
         # Creating the Boot from Volume Version 1 Instance
-        cls.server_response = cls.server_behaviors.create_active_server(
-            block_device_mapping=cls.block_device_mapping_matrix,
-            flavor_ref=flavor_ref, key_name=key_name)
+        try:
+            cls.server_response, reservation = cls.compute_admission.create(
+                partial(cls.server_behaviors.create_active_server,
+                        block_device_mapping=cls.block_device_mapping_matrix,
+                        flavor_ref=flavor_ref, key_name=key_name),
+                **cls.get_server_quota_amounts(flavor_ref))
+        except Exception:
+            # Nothing will terminate the server to delete the volume
+            try:
+                volume_reservation.released_by(
+                    cls.blockstorage_client.delete_volume)(cls.volume.id_)
+            except Exception as ex:
+                cls.fixture_log.error(
+                    "Unable to delete volume {0}: {1}".format(
+                        cls.volume.id_, ex))
+            raise
         cls.server = cls.server_response.entity
-        cls.resources.add(cls.server.id, cls.servers_client.delete_server)
+        # The volume is deleted on termination of the server
+        cls.resources.add(
+            cls.server.id, volume_reservation.released_by(
+                reservation.released_by(cls.servers_client.delete_server)))
         return cls.server
 
 
@@ -355,10 +734,17 @@ class ServerFromVolumeV2Fixture(BlockstorageIntegrationFixture):
             "source_type": 'image',
             "destination_type": 'volume',
             "delete_on_termination": True}]
-        # Creating the Boot from Volume Version 2 Instance
-        cls.server_response = cls.volume_server_behaviors.create_active_server(
-            block_device=cls.block_device_matrix, flavor_ref=flavor_ref,
-            key_name=key_name)
+        # Creating the Boot from Volume Version 2 Instance. Compute creates
+        # the volume, so its quota is held for the whole server create.
+        with cls.blockstorage_admission.admit(
+                volumes=1, gigabytes=cls.volume_size) as volume_reservation:
+            cls.server_response, reservation = cls.compute_admission.create(
+                partial(cls.volume_server_behaviors.create_active_server,
+                        block_device=cls.block_device_matrix,
+                        flavor_ref=flavor_ref, key_name=key_name),
+                **cls.get_server_quota_amounts(flavor_ref))
         cls.server = cls.server_response.entity
-        cls.resources.add(cls.server.id, cls.servers_client.delete_server)
+        cls.resources.add(
+            cls.server.id, volume_reservation.released_by(
+                reservation.released_by(cls.servers_client.delete_server)))
         return cls.server
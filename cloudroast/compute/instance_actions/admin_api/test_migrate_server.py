@@ -21,7 +21,8 @@ from cloudcafe.compute.common.types import NovaServerStatusTypes
 from cloudcafe.compute.composites import ComputeAdminComposite
 from cloudcafe.compute.config import ComputeConfig
 
-from cloudroast.compute.fixtures import ServerFromImageFixture
+from cloudroast.compute.fixtures import (
+    ComputeAdminFixture, ServerFromImageFixture)
 
 compute_config = ComputeConfig()
 hypervisor = compute_config.hypervisor.lower()
@@ -93,3 +94,46 @@ class ServerFromImageMigrateTests(ServerFromImageFixture,
         cls.admin_servers_client = cls.compute_admin.servers.client
         cls.admin_server_behaviors = cls.compute_admin.servers.behaviors
         cls.create_server()
+
+
+@unittest.skipIf(
+    hypervisor in [ComputeHypervisors.IRONIC],
+    'Migrate server not supported in current configuration.')
+class ColdMigrationMeasurementTests(ComputeAdminFixture):
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Perform actions that setup the necessary resources for testing.
+
+        The following resources are created during this setup:
+            - Create a server in active state.
+        """
+        super(ColdMigrationMeasurementTests, cls).setUpClass()
+        cls.server = cls.server_behaviors.create_active_server().entity
+        cls.resources.add(cls.server.id, cls.servers_client.delete_server)
+
+    @tags(type='smoke', net='yes')
+    def test_cold_migration_downtime(self):
+        """
+        Measure the downtime of a server during a cold migration.
+
+        The server is probed from the runner throughout the migration and
+        confirmation, and the measurement is recorded with the run results.
+
+        The following assertions occur:
+            - The server is on a different host after the migration.
+            - The migration stays within the configured duration and
+              blackout thresholds.
+        """
+        measurement = self.measure_cold_migration(self.server)
+
+        self.assertNotEqual(
+            measurement.host_before, measurement.host_after,
+            msg="Host not changed after migration for instance {uuid}, "
+                "source host is {host_before}, "
+                "destination host is {host_after}".format(
+                    host_before=measurement.host_before,
+                    host_after=measurement.host_after,
+                    uuid=self.server.id))
+        self.assert_migration_thresholds(measurement)
@@ -19,7 +19,6 @@ from unittest.suite import TestSuite
 
 
 from cafe.drivers.unittest.decorators import tags
-from cloudcafe.compute.common.types import NovaServerStatusTypes
 from cloudcafe.compute.common.types import ComputeHypervisors
 from cloudcafe.compute.config import ComputeConfig
 from cloudroast.compute.fixtures import ComputeAdminFixture
@@ -84,7 +83,7 @@ class LiveMigratationServerTests(ComputeAdminFixture):
             remote_client.create_directory(test_directory)
             self.test_directories.append(test_directory)
 
-    @tags(type='smoke', net='no')
+    @tags(type='smoke', net='yes')
     def test_live_migrate_server(self):
         """
         Verify the server completes the live migration.
@@ -92,12 +91,21 @@ class LiveMigratationServerTests(ComputeAdminFixture):
         Will invoke a live migration of the server with the block migration
         flag set to true and the disk over commit flag to false.  Will
         continue to wait until the server reaches an active state or a
-        timeout has been reached.
+        timeout has been reached. The server is probed throughout, with a
+        memory dirtying workload on the guest if one is configured, and the
+        downtime measured is recorded.
+
+        The following assertions occur:
+            - The migration stays within the configured duration, blackout
+              and throughput thresholds.
         """
-        self.admin_servers_client.live_migrate_server(
-            self.server.id, block_migration=True, disk_over_commit=False)
-        self.admin_server_behaviors.wait_for_server_status(
-            self.server.id, NovaServerStatusTypes.ACTIVE)
+        remote_client = None
+        if self.migration_config.dirty_memory_mb:
+            remote_client = self.server_behaviors.get_remote_instance_client(
+                self.server, self.servers_config)
+        measurement = self.measure_live_migration(
+            self.server, remote_client=remote_client)
+        self.assert_migration_thresholds(measurement)
 
     @tags(type='smoke', net='yes')
     def test_verify_ephemeral_disks_mounted(self):
@@ -14,11 +14,20 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from functools import partial
+import json
+import time
+
 from cafe.drivers.unittest.decorators import tags
 
 from cloudcafe.common.tools.datagen import rand_name
+from cloudroast.common.concurrency import execute_concurrently
+from cloudroast.common.metrics import write_run_results
+from cloudroast.compute.config import RHELActivationConfig
 from cloudroast.compute.fixtures import ServerFromImageFixture
 
+RESULTS_NAME = 'rhel_activation'
+
 
 class ServerRHELActivationTests(object):
 
@@ -29,22 +38,73 @@ class ServerRHELActivationTests(object):
 
         For every server in the list of servers created during test set up, get
         a remote instance client and validate that the instance has completed
-        Red Hat Linux activation.
+        Red Hat Linux activation. The servers are checked concurrently, and
+        the build and activation timings of each image are appended to
+        rhel_activation.jsonl in the run's log directory.
 
         The following assertions occur:
+            - Every server was built
             - Each server has completed Red Hat Linux activation
         """
-        # Get an instance of the remote client
-        if not self.server_list:
+        if not self.server_list and not self.failed_builds:
             self.fail("No Servers created for the activation test")
-        for server in self.server_list:
-            remote_instance = self.server_behaviors.get_remote_instance_client(
-                server, config=self.servers_config, key=self.key.private_key)
 
-            self.assertTrue(
-                remote_instance.check_rhel_activation(),
-                "Red Hat activation on server with uuid: {server_id} "
-                "failed".format(server_id=server.id))
+        results = execute_concurrently(
+            [partial(self._check_server_activation, server)
+             for server in self.server_list],
+            max_workers=len(self.server_list) or 1)
+
+        records = []
+        failures = []
+        for server, result in zip(self.server_list, results):
+            record = dict(self.build_records[server.id])
+            record.update(result.result or {})
+            if result.failed:
+                record['error'] = str(result.exception)
+                failures.append(
+                    "Red Hat activation check on server with uuid: "
+                    "{server_id} (image {image_id}) raised {error}".format(
+                        server_id=server.id, image_id=record['image_id'],
+                        error=result.exception))
+            elif not record['activated']:
+                failures.append(
+                    "Red Hat activation on server with uuid: {server_id} "
+                    "(image {image_id}) failed".format(
+                        server_id=server.id, image_id=record['image_id']))
+            records.append(record)
+
+        for image_id, exception in self.failed_builds.items():
+            records.append({'image_id': image_id, 'error': str(exception)})
+            failures.append(
+                "Server build from image {image_id} failed: {error}".format(
+                    image_id=image_id, error=exception))
+
+        write_run_results(RESULTS_NAME, records)
+        for record in records:
+            self.fixture_log.info(json.dumps(record, sort_keys=True))
+
+        self.assertEqual([], failures, "\n".join(failures))
+
+    def _check_server_activation(self, server):
+        """
+        Connects to a server and checks its activation
+
+        @return: Whether activation completed, and how long connecting and
+            checking took in seconds
+        @rtype: dict
+        """
+        start = time.time()
+        remote_instance = self.server_behaviors.get_remote_instance_client(
+            server, config=self.servers_config, key=self.key.private_key)
+        connected = time.time()
+        activated = remote_instance.check_rhel_activation()
+        checked = time.time()
+        return {
+            'activated': bool(activated),
+            'connect_seconds': connected - start,
+            'activation_check_seconds': checked - connected,
+            'active_to_activated_seconds':
+                checked - self.build_records[server.id]['active_at']}
 
 
 class ServerFromImageRHELActivationTests(ServerFromImageFixture,
@@ -60,7 +120,8 @@ class ServerFromImageRHELActivationTests(ServerFromImageFixture,
 
         The following resources are created during this setup:
             - A keypair with a random name starting with 'key'
-            - A list of servers created with the following values:
+            - A list of servers, built up to max_concurrent_builds at a
+              time, created with the following values:
                 - An image id from the list of 'Red Hat' image ids previously
                   generated
                 - Remaining values required for creating a server will come
@@ -82,8 +143,49 @@ class ServerFromImageRHELActivationTests(ServerFromImageFixture,
         if not cls.image_ids:
             cls.assertClassSetupFailure("Unable to find any Red Hat Enterprise"
                                         " Linux images to test.")
+
+        # At most max_concurrent_builds servers build at once. Quota
+        # admission only holds builds back further when it is enabled
+        max_builds = RHELActivationConfig().max_concurrent_builds
+        builds = execute_concurrently(
+            [partial(cls._build_server, image_id)
+             for image_id in cls.image_ids],
+            max_workers=max(1, min(max_builds, len(cls.image_ids))))
+
         cls.server_list = []
-        for image_id in cls.image_ids:
-            server = cls.create_server(key_name=cls.key.name,
-                                       image_ref=image_id)
+        cls.build_records = {}
+        cls.failed_builds = {}
+        for image_id, build in zip(cls.image_ids, builds):
+            if build.failed:
+                cls.fixture_log.error(
+                    "Server build from image {0} failed: {1}".format(
+                        image_id, build.exception))
+                cls.failed_builds[image_id] = build.exception
+                continue
+            server, active_at = build.result
             cls.server_list.append(server)
+            cls.build_records[server.id] = {
+                'image_id': image_id,
+                'server_id': server.id,
+                'build_seconds': build.elapsed,
+                'active_at': active_at}
+
+    @classmethod
+    def _build_server(cls, image_id):
+        """
+        Builds run concurrently, so unlike create_server this keeps the
+        response local instead of storing it on the class.
+
+        @return: The server once it is active, and the time it became so
+        @rtype: tuple
+        """
+        response, reservation = cls.compute_admission.create(
+            partial(cls.server_behaviors.create_active_server,
+                    key_name=cls.key.name, image_ref=image_id),
+            **cls.get_server_quota_amounts())
+        active_at = time.time()
+        server = response.entity
+        cls.resources.add(
+            server.id,
+            reservation.released_by(cls.servers_client.delete_server))
+        return server, active_at
@@ -51,7 +51,7 @@ class GlanceScrubberTest(ObjectstorageIntegrationFixture):
     def test_chunks_present_after_image_create(self):
         """The chunks are created in Cloud Files"""
 
-        chunks = self._get_image_chunks(self.prefix)
+        chunks = self._get_image_chunks(self.prefix, stop_at=1)
 
         self.assertGreaterEqual(chunks, 1, msg=self.message.format(
             input="Image Chunks", comparison=">=", expectation=1, reality=chunks))
@@ -74,16 +74,7 @@ class GlanceScrubberTest(ObjectstorageIntegrationFixture):
                              expectation=0,
                              reality=chunks))
 
-    def _get_image_chunks(self, prefix):
-        chunks = []
-        # List all containers
-        containers_response = self.object_storage_client.list_containers()
-
-        # Checking all containers for the image chunks
-        for container in containers_response.entity:
-            chunks_response = self.object_storage_client.list_objects(
-                container.name, params=prefix)
-            if chunks_response.entity is not None:
-                for storage_chunk in chunks_response.entity:
-                    chunks.append(storage_chunk.name)
-        return chunks
+    def _get_image_chunks(self, prefix, stop_at=None):
+        # Chunks may be in any container of the account, so every container
+        # is searched, with the container listing requested page by page
+        return self.count_objects(prefix['prefix'], stop_at=stop_at)
@@ -68,11 +68,4 @@ class MultipleContainersTest(ObjectstorageIntegrationFixture):
         self.assertTrue(found_container, msg=self.message.format(self.multiple_container))
 
     def _get_container_from_container_list(self, desired_container):
-        found_container = False
-        # List all containers
-        containers_response = self.object_storage_client.list_containers()
-        # Checking all containers for the image chunks
-        for container in containers_response.entity:
-            if container.name == desired_container:
-                found_container = True
-        return found_container
+        return self.container_exists(desired_container)
@@ -0,0 +1,235 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import socket
+import subprocess
+import threading
+import time
+
+WORKLOAD_FILE = '/dev/shm/qe_dirty_memory'
+WORKLOAD_LOG = '/tmp/qe_dirty_memory.log'
+WORKLOAD_PID = '/tmp/qe_dirty_memory.pid'
+
+
+class ConnectivityProbe(object):
+    """
+    @summary: Probes an address at a fixed interval from a background
+        thread, with a TCP connect or an ICMP echo, recording whether each
+        probe was answered
+    """
+
+    def __init__(self, address, protocol='tcp', port=22, interval=0.05,
+                 timeout=0.5):
+        self.address = address
+        self.protocol = protocol
+        self.port = port
+        self.interval = interval
+        self.timeout = timeout
+        self.samples = []
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        @return: (timestamp, answered) for every probe sent
+        @rtype: list
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.samples
+
+    def _run(self):
+        while not self._stopped.is_set():
+            started = time.time()
+            self.samples.append((started, self.check()))
+            self._stopped.wait(
+                max(0, self.interval - (time.time() - started)))
+
+    def check(self):
+        """
+        @return: Whether the address answered a single probe
+        @rtype: bool
+        """
+        if self.protocol == 'icmp':
+            command = ['ping6' if ':' in self.address else 'ping', '-c', '1',
+                       '-W', str(max(1, int(round(self.timeout)))),
+                       self.address]
+            with open(os.devnull, 'w') as devnull:
+                return subprocess.call(
+                    command, stdout=devnull, stderr=devnull) == 0
+        try:
+            connection = socket.create_connection(
+                (self.address, self.port), timeout=self.timeout)
+        except (socket.error, socket.timeout):
+            return False
+        connection.close()
+        return True
+
+
+def blackout_windows(samples, end=None):
+    """
+    @summary: Periods in which probes went unanswered after the address had
+        answered, from the first missed probe to the next answered one.
+        Misses before the first answer are not counted, so an address that
+        is never reachable from the runner reports no blackouts.
+    @param samples: (timestamp, answered) pairs in time order
+    @param end: Closes a blackout still open at the last sample, defaults
+        to the last sample's timestamp
+    @return: (start, end) pairs
+    @rtype: list
+    """
+    windows = []
+    reachable = False
+    outage_start = None
+    for timestamp, answered in samples:
+        if answered:
+            if outage_start is not None:
+                windows.append((outage_start, timestamp))
+                outage_start = None
+            reachable = True
+        elif reachable and outage_start is None:
+            outage_start = timestamp
+    if outage_start is not None:
+        windows.append((outage_start, samples[-1][0] if end is None else end))
+    return windows
+
+
+def start_dirty_memory_workload(remote_client, size_mb):
+    """
+    @summary: Starts a loop on the guest that keeps rewriting size_mb of
+        tmpfs backed memory, logging the guest time at the end of each pass
+    """
+    remote_client.ssh_client.execute_command(
+        "rm -f {log}; nohup sh -c 'while true; do dd if=/dev/zero "
+        "of={file} bs=1M count={size} conv=notrunc 2>/dev/null; "
+        "date +%s.%N >> {log}; done' > /dev/null 2>&1 & "
+        "echo $! > {pid}".format(
+            file=WORKLOAD_FILE, log=WORKLOAD_LOG, pid=WORKLOAD_PID,
+            size=size_mb))
+
+
+def stop_dirty_memory_workload(remote_client):
+    """
+    @summary: Stops the workload and removes its files from the guest
+    @return: Guest time at the end of every pass the workload completed
+    @rtype: list
+    """
+    output = remote_client.ssh_client.execute_command(
+        "kill $(cat {pid}); cat {log}; rm -f {file} {log} {pid}".format(
+            file=WORKLOAD_FILE, log=WORKLOAD_LOG, pid=WORKLOAD_PID)).stdout
+    return _parse_times(output)
+
+
+def get_guest_time(remote_client):
+    times = _parse_times(remote_client.ssh_client.execute_command(
+        'date +%s.%N').stdout)
+    return times[0] if times else None
+
+
+def _parse_times(output):
+    times = []
+    for line in (output or '').split():
+        try:
+            times.append(float(line))
+        except ValueError:
+            pass
+    return times
+
+
+def workload_throughput(pass_times, start, end, size_mb):
+    """
+    @return: MB per second rewritten by passes completing in (start, end],
+        or None for an empty window
+    @rtype: float
+    """
+    if start is None or end is None or end <= start:
+        return None
+    passes = len([t for t in pass_times if start < t <= end])
+    return passes * size_mb / (end - start)
+
+
+class MigrationMeasurement(object):
+    """
+    @summary: Timings of a single server migration
+    """
+
+    def __init__(self, migration_type, server_id, start, end, samples,
+                 host_before=None, host_after=None, pre_throughput=None,
+                 post_throughput=None, max_guest_stall=None):
+        self.migration_type = migration_type
+        self.server_id = server_id
+        self.start = start
+        self.end = end
+        self.samples = samples
+        self.host_before = host_before
+        self.host_after = host_after
+        self.pre_throughput = pre_throughput
+        self.post_throughput = post_throughput
+        self.max_guest_stall = max_guest_stall
+        self.blackouts = blackout_windows(samples)
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+    @property
+    def reachable(self):
+        """Whether the runner could reach the server at all."""
+        return any(answered for _, answered in self.samples)
+
+    @property
+    def max_blackout(self):
+        return max([end - start for start, end in self.blackouts] or [0])
+
+    @property
+    def total_blackout(self):
+        return sum(end - start for start, end in self.blackouts)
+
+    @property
+    def throughput_ratio(self):
+        if not self.pre_throughput or self.post_throughput is None:
+            return None
+        return self.post_throughput / self.pre_throughput
+
+    def to_record(self):
+        return {
+            'timestamp': self.start,
+            'migration_type': self.migration_type,
+            'server_id': self.server_id,
+            'host_before': self.host_before,
+            'host_after': self.host_after,
+            'duration': self.duration,
+            'probes': len(self.samples),
+            'probes_answered': len(
+                [s for s in self.samples if s[1]]),
+            'reachable': self.reachable,
+            'blackouts': [
+                [start - self.start, end - self.start]
+                for start, end in self.blackouts],
+            'max_blackout': self.max_blackout,
+            'total_blackout': self.total_blackout,
+            'pre_throughput_mb_per_second': self.pre_throughput,
+            'post_throughput_mb_per_second': self.post_throughput,
+            'throughput_ratio': self.throughput_ratio,
+            'max_guest_stall': self.max_guest_stall}
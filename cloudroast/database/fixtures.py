@@ -15,21 +15,50 @@ limitations under the License.
 """
 
 import time
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.database.config import DBaaSConfig
 from cloudcafe.database.behaviors import DatabaseAPI_Behaviors
 from cloudcafe.database.client import DBaaSAPIClient
 from cloudcafe.identity.v2_0.tokens_api.client import TokenAPI_Client
 from cloudcafe.identity.v2_0.tokens_api.behaviors import TokenAPI_Behaviors
 from cloudcafe.identity.v2_0.tokens_api.config import TokenAPI_Config
+from cloudroast.common.fixtures import InstrumentedTestFixture
 
 
-class DBaaSFixture(BaseTestFixture):
+class InstanceMatrixResult(object):
+    """
+    @summary: Outcome of one instance launched from an instance matrix
+
+    """
+
+    def __init__(self, name, flavor_id, volume_size):
+        self.name = name
+        self.flavor_id = flavor_id
+        self.volume_size = volume_size
+        self.instance_id = None
+        self.create_response_code = None
+        self.status = None
+        self.elapsed_time = None
+        self.create_error = None
+
+
+class DBaaSFixture(InstrumentedTestFixture):
     """
     @summary: Fixture for any DBaaS tests..
 
+    Subclasses may set INSTANCE_MATRIX to a list of instance specs, dicts
+    with 'name', 'flavor' and 'volume' keys and optional 'databases' and
+    'users' keys. All of them are launched at class setup and waited on
+    together; the results are available in cls.instance_matrix keyed by
+    name. A failed create is recorded on its result rather than failing
+    the class setup, so the other instances are still tested.
+
     """
 
+    INSTANCE_MATRIX = ()
+    INSTANCE_MATRIX_TIMEOUT = 1800
+    INSTANCE_MATRIX_POLL_INTERVAL = 10
+    INSTANCE_MATRIX_FINAL_STATES = ('ACTIVE', 'ERROR', 'FAILED')
+
     @classmethod
     def setUpClass(cls):
         super(DBaaSFixture, cls).setUpClass()
@@ -161,6 +190,96 @@ class DBaaSFixture(BaseTestFixture):
                            deserialize_format=
                            identity_config.deserialize_format)
 
+        cls.instrument_fixture()
+        cls.instance_matrix = {}
+        if cls.INSTANCE_MATRIX:
+            cls.instance_matrix = cls.launch_instance_matrix(
+                cls.INSTANCE_MATRIX)
+
+    @classmethod
+    def launch_instance_matrix(cls, matrix, dbaas=None):
+        """
+        @summary: Creates every instance in the matrix without waiting in
+        between, then waits for all of them with a single status poll
+
+        Create requests return as soon as the build is accepted, so all
+        instances provision at the same time. A create that raises is
+        recorded in the result's create_error and the rest of the matrix
+        is still launched. The instances are deleted by a class cleanup
+        task, so subclasses overriding tearDownClass must call super.
+
+        @return: InstanceMatrixResult for each spec, keyed by spec name
+        @rtype: dict
+        """
+        dbaas = dbaas or cls.client.reddwarfclient
+        results = {}
+        cls.addClassCleanup(cls._delete_instance_matrix, dbaas, results)
+        for spec in matrix:
+            result = InstanceMatrixResult(
+                spec['name'], spec['flavor'], spec['volume'])
+            results[spec['name']] = result
+            try:
+                instance = dbaas.instances.create(
+                    name=spec['name'],
+                    flavor_id=spec['flavor'],
+                    volume={"size": spec['volume']},
+                    databases=spec.get('databases'),
+                    users=spec.get('users'))
+            except Exception as exception:
+                cls.fixture_log.error(
+                    "Failed to create instance {0} with flavor {1}: "
+                    "{2}".format(spec['name'], spec['flavor'], exception))
+                result.create_error = str(exception)
+                instance = None
+            result.create_response_code = cls.behavior.get_last_response_code(
+                dbaas)
+            if instance is not None:
+                result.instance_id = instance.id
+        cls._wait_for_instance_matrix(dbaas, results)
+        return results
+
+    @classmethod
+    def _wait_for_instance_matrix(cls, dbaas, results):
+        """
+        @summary: Polls the instance list until every instance in results
+        reaches a final state or the matrix timeout expires, recording the
+        status and elapsed time of each
+
+        """
+        start_time = time.time()
+        pending = dict((result.instance_id, result)
+                       for result in results.values()
+                       if result.instance_id is not None)
+        while pending:
+            statuses = dict((instance.id, instance.status)
+                            for instance in dbaas.instances.list())
+            elapsed_time = time.time() - start_time
+            for instance_id, result in list(pending.items()):
+                if instance_id in statuses:
+                    result.status = statuses[instance_id]
+                else:
+                    # Not on the first page of the listing
+                    result.status = dbaas.instances.get(instance_id).status
+                result.elapsed_time = elapsed_time
+                if result.status in cls.INSTANCE_MATRIX_FINAL_STATES:
+                    del pending[instance_id]
+            if elapsed_time > cls.INSTANCE_MATRIX_TIMEOUT:
+                break
+            if pending:
+                time.sleep(cls.INSTANCE_MATRIX_POLL_INTERVAL)
+
+    @classmethod
+    def _delete_instance_matrix(cls, dbaas, results):
+        for result in results.values():
+            if result.instance_id is None:
+                continue
+            try:
+                dbaas.instances.delete(result.instance_id)
+            except Exception as exception:
+                cls.fixture_log.error(
+                    "Failed to delete instance {0}: {1}".format(
+                        result.instance_id, exception))
+
     @classmethod
     def tearDownClass(cls):
         super(DBaaSFixture, cls).tearDownClass()
@@ -42,6 +42,20 @@ class TestCreateInstances(DBaaSFixture):
     dbaas = None
     stability_mode = False
 
+    INSTANCE_MATRIX = [
+        {"name": "qe-{0}-instance".format(size),
+         "flavor": flavor,
+         "volume": volume,
+         "databases": [{"databases": [{"name": "databaseA"}],
+                        "name": "dbuser1",
+                        "password": "password"}]}
+        for size, flavor, volume in [("tiny", 1, 20),
+                                     ("small", 2, 40),
+                                     ("medium", 3, 75),
+                                     ("large", 4, 100),
+                                     ("xlarge", 5, 125),
+                                     ("xxlarge", 6, 150)]]
+
     def _check_instance_attribs(self,
                                 instance,
                                 exp_flavor,
@@ -60,6 +74,36 @@ class TestCreateInstances(DBaaSFixture):
                          "Expected %s | Actual %s" % (exp_name,
                                                       instance.name))
 
+    def _check_matrix_instance(self, name):
+        """
+        Checks an instance launched by the class instance matrix
+
+        """
+        result = self.instance_matrix[name]
+        self.assertIsNone(result.create_error,
+                          "Create instance failed: %s" % result.create_error)
+        self.assertTrue(result.create_response_code == '200',
+                        "Create instance failed with code %s"
+                        % result.create_response_code)
+        self.assertEqual(result.status,
+                         'ACTIVE',
+                         "Instance fell into state: %s after %s seconds"
+                         % (result.status, result.elapsed_time))
+
+        #Get the instance and check instance attribs:
+        #such as the flavor / volume size
+        instance = self.dbaas.instances.get(result.instance_id)
+        self._check_instance_attribs(instance,
+                                     result.flavor_id,
+                                     result.volume_size,
+                                     result.name)
+
+        #try to find our instance in the list
+        self.assertTrue(self.behavior.found_resource(
+            self.dbaas,
+            instanceId=instance.id),
+            "Did not find our instance id: %s in the list." % instance.id)
+
     @classmethod
     def setUpClass(cls):
         """
@@ -72,9 +116,15 @@ class TestCreateInstances(DBaaSFixture):
     @classmethod
     def tearDownClass(cls):
         """
-        Tearing down: Deleting the instance if in active state
+        Tearing down: Deleting the instances if in active state, then the
+        instance matrix through the fixture's class cleanup
 
         """
+        cls._delete_active_instances()
+        super(TestCreateInstances, cls).tearDownClass()
+
+    @classmethod
+    def _delete_active_instances(cls):
         #Delete the instance ID created for test if active
         dbaas = cls.dbaas
         for instance_id in cls.all_instances:
@@ -91,231 +141,49 @@ class TestCreateInstances(DBaaSFixture):
         Tearing down: Deleting the instance if in active state
 
         """
-        self.tearDownClass()
+        self._delete_active_instances()
 
     def test_create_tiny_instance(self):
         """
         Creating a tiny instance (512M)
 
         """
-
-        NAME = "qe-tiny-instance"
-        FLAVOR = 1
-        VOLUME = 20
-        instance = self.dbaas.instances.create(
-            name=NAME,
-            flavor_id=FLAVOR,
-            volume={"size": VOLUME},
-            databases=[{"databases": [{"name": "databaseA"}],
-                        "name": "dbuser1",
-                        "password": "password"}])
-        httpCode = self.behavior.get_last_response_code(self.dbaas)
-        self.assertTrue(httpCode == '200',
-                        "Create instance failed with code %s" % httpCode)
-        status, elapsed_time = self.behavior.wait_for_active(
-            self.dbaas,
-            instanceId=self.instance_id)
-        self.assertEqual(status,
-                         'ACTIVE',
-                         "Instance fell into state: %s" % status)
-
-        #Get the instance and check instance attribs:
-        # such as the flavor / volume size
-        instance = self.dbaas.instances.get(instance)
-        self._check_instance_attribs(instance, FLAVOR, VOLUME, NAME)
-
-        #try to find our instance in the list
-        self.assertTrue(self.behavior.found_resource(self.dbaas,
-                                                     instanceId=instance.id),
-                        "Did not find our instance id: %s in the list."
-                        % instance.id)
+        self._check_matrix_instance("qe-tiny-instance")
 
     def test_create_small_instance(self):
         """
         Creating a small instance (1G)
 
         """
-        #print(self.instance_id)
-        NAME = "qe-small-instance"
-        FLAVOR = 2
-        VOLUME = 40
-        instance = self.dbaas.instances.create(
-            name=NAME,
-            flavor_id=FLAVOR,
-            volume={"size": VOLUME},
-            databases=[{"databases": [{"name": "databaseA"}],
-                        "name": "dbuser1",
-                        "password": "password"}])
-        httpCode = self.behavior.get_last_response_code(self.dbaas)
-        self.sml_instance_id = instance.id
-        self.assertTrue(httpCode == '200',
-                        "Create instance failed with code %s" % httpCode)
-        status, elapsed_time = self.behavior.wait_for_active(
-            self.dbaas,
-            instanceId=self.instance_id)
-        self.assertEqual(status,
-                         'ACTIVE',
-                         "Instance fell into state: %s" % status)
-
-        #Get the instance and check instance attribs:
-        # such as the flavor / volume size
-        instance = self.dbaas.instances.get(instance)
-        self._check_instance_attribs(instance, FLAVOR, VOLUME, NAME)
-
-        #try to find our instance in the list
-        self.assertTrue(self.behavior.found_resource(self.dbaas,
-                                                     instanceId=instance.id),
-                        "Did not find our instance id: %s in the list."
-                        % instance.id)
+        self._check_matrix_instance("qe-small-instance")
 
     def test_create_medium_instance(self):
         """
         Creating a medium instance (2G)
 
         """
-        NAME = "qe-medium-instance"
-        FLAVOR = 3
-        VOLUME = 75
-        instance = self.dbaas.instances.create(
-            name=NAME,
-            flavor_id=FLAVOR,
-            volume={"size": VOLUME},
-            databases=[{"databases": [{"name": "databaseA"}],
-                        "name": "dbuser1",
-                        "password": "password"}])
-        httpCode = self.behavior.get_last_response_code(self.dbaas)
-        self.med_instance_id = instance.id
-        self.assertTrue(httpCode == '200',
-                        "Create instance failed with code %s" % httpCode)
-        status, elapsed_time = self.behavior.wait_for_active(
-            self.dbaas,
-            instanceId=self.instance_id)
-        self.assertEqual(status,
-                         'ACTIVE',
-                         "Instance fell into state: %s" % status)
-
-        #Get the instance and check instance attribs:
-        # such as the flavor / volume size
-        instance = self.dbaas.instances.get(instance)
-        self._check_instance_attribs(instance, FLAVOR, VOLUME, NAME)
-
-        #try to find our instance in the list
-        self.assertTrue(self.behavior.found_resource(self.dbaas,
-                                                     instanceId=instance.id),
-                        "Did not find our instance id: %s in the list."
-                        % instance.id)
+        self._check_matrix_instance("qe-medium-instance")
 
     def test_create_large_instance(self):
         """
         Creating a 4G instance
 
         """
-
-        NAME = "qe-large-instance"
-        FLAVOR = 4
-        VOLUME = 100
-        instance = self.dbaas.instances.create(
-            name=NAME,
-            flavor_id=FLAVOR,
-            volume={"size": VOLUME},
-            databases=[{"databases": [{"name": "databaseA"}],
-                        "name": "dbuser1",
-                        "password": "password"}])
-        httpCode = self.behavior.get_last_response_code(self.dbaas)
-        self.lrg_instance_id = instance.id
-        self.assertTrue(httpCode == '200',
-                        "Create instance failed with code %s" % httpCode)
-        status, elapsed_time = self.behavior.wait_for_active(
-            self.dbaas,
-            instanceId=self.instance_id)
-        self.assertEqual(status,
-                         'ACTIVE',
-                         "Instance fell into state: %s" % status)
-
-        #Get the instance and check instance attribs:
-        #such as the flavor / volume size
-        instance = self.dbaas.instances.get(instance)
-        self._check_instance_attribs(instance, FLAVOR, VOLUME, NAME)
-
-        #try to find our instance in the list
-        self.assertTrue(self.behavior.found_resource(self.dbaas,
-                                                     instanceId=instance.id),
-                        "Did not find our instance id: %s in the list."
-                        % instance.id)
+        self._check_matrix_instance("qe-large-instance")
 
     def test_create_xlarge_instance(self):
         """
         Creating an 8G instance
 
         """
-        NAME = "qe-xlarge-instance"
-        FLAVOR = 5
-        VOLUME = 125
-        instance = self.dbaas.instances.create(
-            name=NAME,
-            flavor_id=FLAVOR,
-            volume={"size": VOLUME},
-            databases=[{"databases": [{"name": "databaseA"}],
-                        "name": "dbuser1",
-                        "password": "password"}])
-        httpCode = self.behavior.get_last_response_code(self.dbaas)
-        self.xlrg_instance_id_instance_id = instance.id
-        self.assertTrue(httpCode == '200',
-                        "Create instance failed with code %s" % httpCode)
-        status, elapsed_time = self.behavior.wait_for_active(
-            self.dbaas,
-            instanceId=self.instance_id)
-        self.assertEqual(status,
-                         'ACTIVE',
-                         "Instance fell into state: %s" % status)
-
-        #Get the instance and check instance attribs:
-        #such as the flavor / volume size
-        instance = self.dbaas.instances.get(instance)
-        self._check_instance_attribs(instance, FLAVOR, VOLUME, NAME)
-
-        #try to find our instance in the list
-        self.assertTrue(self.behavior.found_resource(
-            self.dbaas,
-            instanceId=instance.id),
-            "Did not find our instance id: %s in the list." % instance.id)
+        self._check_matrix_instance("qe-xlarge-instance")
 
     def test_create_xxlarge_instance(self):
         """
         Creating an 16G instance
 
         """
-        NAME = "qe-xxlarge-instance"
-        FLAVOR = 6
-        VOLUME = 150
-        instance = self.dbaas.instances.create(
-            name=NAME,
-            flavor_id=FLAVOR,
-            volume={"size": VOLUME},
-            databases=[{"databases": [{"name": "databaseA"}],
-                        "name": "dbuser1",
-                        "password": "password"}])
-        httpCode = self.behavior.get_last_response_code(self.dbaas)
-        self.xxlrg_instance_id = instance.id
-        self.assertTrue(httpCode == '200',
-                        "Create instance failed with code %s" % httpCode)
-        status, elapsed_time = self.behavior.wait_for_active(
-            self.dbaas,
-            instanceId=instance.id)
-        self.assertEqual(status,
-                         'ACTIVE',
-                         "Instance fell into state: %s" % status)
-
-        #Get the instance and check instance attribs:
-        #such as the flavor / volume size
-        instance = self.dbaas.instances.get(instance)
-        self._check_instance_attribs(instance, FLAVOR, VOLUME, NAME)
-
-        #try to find our instance in the list
-        self.assertTrue(self.behavior.found_resource(
-            self.dbaas,
-            instanceId=instance.id),
-            "Did not find our instance id: %s in the list." % instance.id)
+        self._check_matrix_instance("qe-xxlarge-instance")
 
     def test_create_2_dbs_instance(self):
         """
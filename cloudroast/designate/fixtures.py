@@ -14,7 +14,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.common.resources import ResourcePool
 from cloudcafe.common.tools.datagen import rand_name
 from cloudcafe.designate.config import DesignateConfig
@@ -23,9 +22,10 @@ from cloudcafe.designate.v1.domain_api.client import DomainAPIClient
 from cloudcafe.designate.v1.server_api.client import ServerAPIClient
 from cloudcafe.designate.behaviors import DomainBehaviors
 from cloudcafe.designate.behaviors import ServerBehaviors
+from cloudroast.common.fixtures import InstrumentedTestFixture
 
 
-class DesignateFixture(BaseTestFixture):
+class DesignateFixture(InstrumentedTestFixture):
 
     @classmethod
     def setUpClass(cls):
@@ -45,6 +45,7 @@ class DesignateFixture(BaseTestFixture):
         cls.server_behaviors = ServerBehaviors(cls.server_client)
 
         cls.resources = ResourcePool()
+        cls.instrument_fixture()
 
     @classmethod
     def tearDownClass(cls):
@@ -14,9 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.auth.config import UserAuthConfig
-from cloudcafe.auth.provider import AuthProvider
 from cloudcafe.common.resources import ResourcePool
 from cloudcafe.compute.config import ComputeEndpointConfig
 from cloudcafe.compute.flavors_api.config import FlavorsConfig
@@ -41,11 +39,25 @@ from cloudcafe.objectstorage.objectstorage_api.config import (
     ObjectStorageAPIConfig)
 
 from cloudroast.blockstorage.volumes_api.fixtures import VolumesTestFixture
+from cloudroast.common.auth import get_cached_access_data
+from cloudroast.common.concurrency import run_concurrently
+from cloudroast.common.fixtures import InstrumentedTestFixture
 from cloudroast.compute.fixtures import ComputeFixture
 from cloudroast.objectstorage.fixtures import ObjectStorageFixture
 
 
-class ImagesFixture(BaseTestFixture):
+def cached_auth_composite(auth_composite):
+    """
+    @summary: Subclass of an images auth composite whose access data comes
+        from get_cached_access_data, so composites for the same user share a
+        token for the run and re-authenticate only as it nears expiry
+    """
+    return type(auth_composite.__name__, (auth_composite,), {
+        'access_data': property(lambda self: get_cached_access_data(
+            self.endpoint_config, self.user_config))})
+
+
+class ImagesFixture(InstrumentedTestFixture):
     """@summary: Fixture for Images API"""
 
     @classmethod
@@ -53,10 +65,13 @@ class ImagesFixture(BaseTestFixture):
         super(ImagesFixture, cls).setUpClass()
         cls.resources = ResourcePool()
 
-        cls.user_one = ImagesAuthComposite()
-        cls.user_two = ImagesAuthCompositeAltOne()
-        cls.user_three = ImagesAuthCompositeAltTwo()
-        cls.user_admin = ImagesAuthCompositeAdmin()
+        # Each auth composite authenticates on creation, so build them at
+        # once, taking access data from the per run cache
+        (cls.user_one, cls.user_two, cls.user_three,
+         cls.user_admin) = run_concurrently(
+            [cached_auth_composite(composite) for composite in (
+                ImagesAuthComposite, ImagesAuthCompositeAltOne,
+                ImagesAuthCompositeAltTwo, ImagesAuthCompositeAdmin)])
 
         cls.images = ImagesComposite(cls.user_one)
         cls.images_alt_one = ImagesComposite(cls.user_two)
@@ -64,6 +79,7 @@ class ImagesFixture(BaseTestFixture):
         cls.images_admin = ImagesComposite(cls.user_admin)
 
         cls.addClassCleanup(cls.resources.release)
+        cls.instrument_fixture()
 
 
 class ImagesIntegrationFixture(ComputeFixture, ImagesFixture,
@@ -90,7 +106,7 @@ class ImagesIntegrationFixture(ComputeFixture, ImagesFixture,
         servers_config = ServersConfig()
         user_config_alt_one = AltOneUserConfig()
 
-        access_data_alt_one = AuthProvider.get_access_data(
+        access_data_alt_one = get_cached_access_data(
             auth_endpoint_config, user_config_alt_one)
 
         # Create compute clients and behaviors for alt_one user
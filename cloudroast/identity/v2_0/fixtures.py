@@ -1,9 +1,9 @@
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.identity.composites import (
     IdentityServiceComposite, AdminIdentityServiceComposite)
+from cloudroast.common.fixtures import InstrumentedTestFixture
 
 
-class IdentityBaseTestFixture(BaseTestFixture):
+class IdentityBaseTestFixture(InstrumentedTestFixture):
     @classmethod
     def setUpClass(cls):
         super(IdentityBaseTestFixture, cls).setUpClass()
@@ -13,3 +13,4 @@ class IdentityBaseTestFixture(BaseTestFixture):
         cls.admin_identity = AdminIdentityServiceComposite()
         cls.admin_identity.authenticate()
         cls.admin_identity.load_extensions()
+        cls.instrument_fixture()
@@ -1,9 +1,9 @@
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 
 from cloudcafe.identity.v3.composites import IdentityV3Composite
+from cloudroast.common.fixtures import InstrumentedTestFixture
 
 
-class IdentityV3Fixture(BaseTestFixture):
+class IdentityV3Fixture(InstrumentedTestFixture):
 
     @classmethod
     def setUpClass(cls):
@@ -15,6 +15,7 @@ class IdentityV3Fixture(BaseTestFixture):
         super(IdentityV3Fixture, cls).setUpClass()
         cls.v3_composite = IdentityV3Composite(cls.user_config)
         cls.v3_composite.load_clients_and_behaviors()
+        cls.instrument_fixture()
 
     def _verify_catalog_response(self, catalog_response,
                                  catalog_is_empty=False):
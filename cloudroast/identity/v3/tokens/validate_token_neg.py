@@ -2,10 +2,10 @@ import uuid
 
 from cafe.drivers.unittest.datasets import DatasetList
 from cafe.drivers.unittest.decorators import DataDrivenClass, tags
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.identity.v3.composites import IdentityV3Composite
 from cloudcafe.identity.v3.config import (
     ServiceAdmin, IdentityAdmin, UserAdmin, UserManage, DefaultUser)
+from cloudroast.common.fixtures import InstrumentedTestFixture
 
 
 class ValidateDataset(DatasetList):
@@ -36,7 +36,7 @@ class ValidateDataset(DatasetList):
 
 
 @DataDrivenClass(ValidateDataset())
-class TestNegativeToken(BaseTestFixture):
+class TestNegativeToken(InstrumentedTestFixture):
     """Test Class for validate token negative test cases."""
 
     @classmethod
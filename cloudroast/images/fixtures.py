@@ -16,9 +16,7 @@ limitations under the License.
 
 import re
 
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.auth.config import UserAuthConfig, UserConfig
-from cloudcafe.auth.provider import AuthProvider
 from cloudcafe.common.resources import ResourcePool
 from cloudcafe.compute.common.exception_handler import ExceptionHandler
 from cloudcafe.compute.config import ComputeEndpointConfig
@@ -43,8 +41,11 @@ from cloudcafe.objectstorage.objectstorage_api.client import (
 from cloudcafe.objectstorage.objectstorage_api.config import (
     ObjectStorageAPIConfig)
 
+from cloudroast.common.auth import get_access_data_concurrently
+from cloudroast.common.fixtures import InstrumentedTestFixture
 
-class ImagesFixture(BaseTestFixture):
+
+class ImagesFixture(InstrumentedTestFixture):
     """@summary: Fixture for Cloud Images api"""
 
     @classmethod
@@ -99,6 +100,7 @@ class ImagesFixture(BaseTestFixture):
 
         cls.exception_handler = ExceptionHandler()
         cls.images_client.add_exception_handler(cls.exception_handler)
+        cls.instrument_fixture()
 
     @classmethod
     def tearDownClass(cls):
@@ -128,9 +130,13 @@ class ImagesFixture(BaseTestFixture):
             user_list[user][cls.CONFIG] = UserConfig(section_name=user)
             user_list[user][cls.CONFIG].SECTION_NAME = user
 
-            access_data = AuthProvider.get_access_data(
-                cls.endpoint_config,
-                user_config=user_list[user][cls.CONFIG])
+        # Authenticate all users at once, reusing tokens already issued
+        # during this run
+        all_access_data = get_access_data_concurrently(
+            cls.endpoint_config,
+            [user_list[user][cls.CONFIG] for user in account_list])
+
+        for user, access_data in zip(account_list, all_access_data):
             # If authentication fails, fail immediately
             if access_data is None:
                 cls.assertClassSetupFailure('Authentication failed.')
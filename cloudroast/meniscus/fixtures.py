@@ -13,7 +13,6 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cafe.engine.clients.elasticsearch import BaseElasticSearchClient
 from cafe.resources.rsyslog.client import RSyslogClient
 from cloudcafe.meniscus.common.cleanup_client import MeniscusDbClient
@@ -27,9 +26,10 @@ from cloudcafe.meniscus.tenant_api.behaviors import (TenantBehaviors,
 from cloudcafe.meniscus.correlator_api.client import PublishingClient
 from cloudcafe.meniscus.correlator_api.behaviors import PublishingBehaviors
 from cloudcafe.meniscus.status_api.client import WorkerStatusClient
+from cloudroast.common.fixtures import InstrumentedTestFixture
 
 
-class MeniscusFixture(BaseTestFixture):
+class MeniscusFixture(InstrumentedTestFixture):
 
     @classmethod
     def setUpClass(cls):
@@ -45,6 +45,7 @@ class MeniscusFixture(BaseTestFixture):
         # ElasticSearch client
         es_servers = [cls.storage_config.address]
         cls.es_client = BaseElasticSearchClient(servers=es_servers)
+        cls.instrument_fixture()
 
 
 class VersionFixture(MeniscusFixture):
@@ -15,13 +15,13 @@ limitations under the License.
 """
 
 from cafe.drivers.unittest.decorators import tags
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 
 from cloudcafe.networking.networks.extensions.limits_api.composites \
     import LimitsComposite
+from cloudroast.common.fixtures import InstrumentedTestFixture
 
 
-class LimitsGetTest(BaseTestFixture):
+class LimitsGetTest(InstrumentedTestFixture):
     @classmethod
     def setUpClass(cls):
         super(LimitsGetTest, cls).setUpClass()
@@ -13,10 +13,10 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from functools import partial
 import operator
 import re
 
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.common.resources import ResourcePool
 from cloudcafe.common.tools.datagen import rand_name
 from cloudcafe.compute.composites import ComputeComposite
@@ -43,9 +43,12 @@ from cloudcafe.networking.networks.extensions.security_groups_api.composites \
 from cloudcafe.networking.networks.extensions.security_groups_api.models.\
     response import SecurityGroup, SecurityGroupRule
 from cloudcafe.networking.networks.personas import ServerPersona
+from cloudroast.common.admission import get_compute_admission_controller, \
+    get_networking_admission_controller
+from cloudroast.common.fixtures import InstrumentedTestFixture
 
 
-class NetworkingFixture(BaseTestFixture):
+class NetworkingFixture(InstrumentedTestFixture):
     """
     @summary: Base fixture for networking tests
     """
@@ -101,6 +104,7 @@ class NetworkingFixture(BaseTestFixture):
         # to the networkingCleanUp
         cls.resources = ResourcePool()
         cls.addClassCleanup(cls.resources.release_lifo)
+        cls.instrument_fixture()
 
     @classmethod
     def baseCleanUp(cls, delete_list, resource, delete_method,
@@ -731,6 +735,12 @@ class NetworkingSecurityGroupsFixture(NetworkingAPIFixture):
             port_range_max=None, port_range_min=None,
             tenant_id=cls.user.tenant_id)
 
+        # Security groups quota, held until the groups are cleaned up
+        cls.secgroups_admission = get_networking_admission_controller(
+            cls.sec.config.max_secgroups_per_tenant, cls.user.tenant_id,
+            log=cls.fixture_log)
+        cls.secgroup_reservations = []
+
         # Using the secGroupCleanup method
         cls.addClassCleanup(cls.secGroupCleanUp)
 
@@ -788,6 +798,9 @@ class NetworkingSecurityGroupsFixture(NetworkingAPIFixture):
             keep_resources_on_failure=cls.sec.config.keep_resources_on_failure,
             failed_list=cls.failed_secgroups)
         cls.delete_secgroups = []
+        for reservation in cls.secgroup_reservations:
+            reservation.release()
+        cls.secgroup_reservations = []
 
     @classmethod
     def create_ping_ssh_ingress_rules(cls, sec_group_id, ethertype='IPv4'):
@@ -830,13 +843,21 @@ class NetworkingSecurityGroupsFixture(NetworkingAPIFixture):
         if expected_secgroup.description:
             request_kwargs['description'] = expected_secgroup.description
 
-        # ResourceBuildException will be raised if not created successfully
-        resp = self.sec.behaviors.create_security_group(**request_kwargs)
+        # ResourceBuildException will be raised if not created successfully.
+        # Waits for security groups quota to free up before creating it.
+        resp, reservation = self.secgroups_admission.create(
+            partial(self.sec.behaviors.create_security_group,
+                    **request_kwargs),
+            security_groups=1)
 
         secgroup = resp.response.entity
 
         if delete:
             self.delete_secgroups.append(secgroup.id)
+            self.secgroup_reservations.append(reservation)
+        else:
+            # The caller owns the group, so its quota can't be tracked
+            reservation.release()
 
         # Check the Security Group response
         self.assertSecurityGroupResponse(expected_secgroup, secgroup,
@@ -1000,6 +1021,12 @@ class NetworkingComputeFixture(NetworkingSecurityGroupsFixture):
         cls.failed_servers = []
         cls.delete_keypairs = []
 
+        # Instances quota, held until the servers are cleaned up
+        cls.servers_admission = get_compute_admission_controller(
+            cls.compute.limits.client, cls.user.tenant_id,
+            log=cls.fixture_log)
+        cls.server_reservations = []
+
         # Using the serversCleanup method
         cls.addClassCleanup(cls.serversCleanUp)
 
@@ -1024,6 +1051,10 @@ class NetworkingComputeFixture(NetworkingSecurityGroupsFixture):
             cls.delete_servers = []
             cls.failed_servers = []
 
+            for reservation in cls.server_reservations:
+                reservation.release()
+            cls.server_reservations = []
+
             if cls.delete_keypairs:
                 cls.fixture_log.info('Deleting Keypairs...')
                 for key_name in cls.delete_keypairs:
@@ -1033,12 +1064,15 @@ class NetworkingComputeFixture(NetworkingSecurityGroupsFixture):
     def create_test_server(cls, name=None, key_name=None,
                            scheduler_hints=None, network_ids=None,
                            port_ids=None, active_server=True):
-        resp = cls.net.behaviors.create_networking_server(
-            name=name, key_name=key_name, scheduler_hints=scheduler_hints,
-            network_ids=network_ids, port_ids=port_ids,
-            active_server=active_server)
+        resp, reservation = cls.servers_admission.create(
+            partial(cls.net.behaviors.create_networking_server,
+                    name=name, key_name=key_name,
+                    scheduler_hints=scheduler_hints, network_ids=network_ids,
+                    port_ids=port_ids, active_server=active_server),
+            instances=1)
         server = resp.entity
         cls.delete_servers.append(server.id)
+        cls.server_reservations.append(reservation)
         return server
 
     @classmethod
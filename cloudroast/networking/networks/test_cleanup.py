@@ -16,12 +16,12 @@ limitations under the License.
 
 from prettytable import PrettyTable
 
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.networking.networks.common.composites import CustomComposite
 from cloudcafe.networking.networks.common.tools.resources import Resources
+from cloudroast.common.fixtures import InstrumentedTestFixture
 
 
-class NetworkingCleanUp(BaseTestFixture):
+class NetworkingCleanUp(InstrumentedTestFixture):
     """Clean up test for networking related resources.
 
     Uses the delete_networking method from the Resources class at:
@@ -0,0 +1,206 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from cafe.engine.models.data_interfaces import ConfigSectionInterface
+
+
+class ObjectStorageSeedingConfig(ConfigSectionInterface):
+    """Settings for bulk seeding containers with objects."""
+
+    SECTION_NAME = 'objectstorage_seeding'
+
+    @property
+    def method(self):
+        """
+        'put' for concurrent object PUTs, 'archive' for extract-archive
+        uploads, or 'auto' to use archives when bulk_upload is enabled.
+        """
+        return self.get('method', 'auto')
+
+    @property
+    def max_workers(self):
+        """Maximum number of PUTs or archive uploads in flight at once."""
+        return int(self.get('max_workers', 20))
+
+    @property
+    def archive_batch_size(self):
+        """Objects per extract-archive upload."""
+        return int(self.get('archive_batch_size', 10000))
+
+
+class ObjectStorageListingBenchmarkConfig(ConfigSectionInterface):
+    """Settings for the container listing benchmark."""
+
+    SECTION_NAME = 'objectstorage_listing_benchmark'
+
+    @staticmethod
+    def _split(value):
+        return [item.strip() for item in value.split(',')]
+
+    @property
+    def enabled(self):
+        return self.get_boolean('enabled', False)
+
+    @property
+    def container_sizes(self):
+        """Comma separated object counts of the benchmarked containers."""
+        return [int(size) for size in self._split(
+            self.get('container_sizes', '1000,10000'))]
+
+    @property
+    def page_sizes(self):
+        """Comma separated listing limits."""
+        return [int(size) for size in self._split(
+            self.get('page_sizes', '100,1000,10000'))]
+
+    @property
+    def formats(self):
+        return self._split(self.get('formats', 'json,xml,plain'))
+
+    @property
+    def delimiters(self):
+        """Comma separated delimiters, 'none' lists without one."""
+        return self._split(self.get('delimiters', 'none,/'))
+
+    @property
+    def iterations(self):
+        """Full walks of the listing per benchmark case."""
+        return int(self.get('iterations', 3))
+
+
+class ObjectStorageArchiveConfig(ConfigSectionInterface):
+    """Settings for the extract-archive feature tests."""
+
+    SECTION_NAME = 'objectstorage_archives'
+
+    @property
+    def num_archive_files(self):
+        """
+        Files in each test archive. The first ten are named foo/bar so that
+        they extract into containers of their own.
+        """
+        return int(self.get('num_archive_files', 20))
+
+
+class ObjectStorageScaleConfig(ConfigSectionInterface):
+    """Settings for the bulk delete and extract-archive scale tests."""
+
+    SECTION_NAME = 'objectstorage_scale'
+
+    @property
+    def enabled(self):
+        return self.get_boolean('enabled', False)
+
+    @property
+    def object_count(self):
+        """Objects deleted or extracted by each scale test."""
+        return int(self.get('object_count', 10000))
+
+    @property
+    def delete_batch_size(self):
+        """
+        Entries per bulk delete request, 0 uses the configured
+        bulk_delete_max_count.
+        """
+        return int(self.get('delete_batch_size', 0))
+
+    @property
+    def extraction_containers(self):
+        """
+        Containers a single archive extracts into. Swift refuses archives
+        creating more than max_containers_per_extraction (10000 by default).
+        """
+        return int(self.get('extraction_containers', 100))
+
+    @property
+    def archive_format(self):
+        return self.get('archive_format', 'tar')
+
+
+class ObjectStorageRangeRequestConfig(ConfigSectionInterface):
+    """Settings for the concurrent range request tests."""
+
+    SECTION_NAME = 'objectstorage_range_requests'
+
+    @property
+    def request_count(self):
+        """Randomized range requests made against each object."""
+        return int(self.get('request_count', 200))
+
+    @property
+    def max_ranges(self):
+        """Most byte ranges in a single multi-range request."""
+        return int(self.get('max_ranges', 5))
+
+    @property
+    def max_workers(self):
+        """Range requests in flight at once."""
+        return int(self.get('max_workers', 10))
+
+    @property
+    def seed(self):
+        """Seed for the generated ranges, a random seed if unset."""
+        seed = self.get('seed')
+        return int(seed) if seed else None
+
+    @property
+    def multi_range_manifests(self):
+        """
+        Also send multi-range requests to DLOs and SLOs, which return the
+        wrong parts on some deployments.
+        """
+        return self.get_boolean('multi_range_manifests', False)
+
+
+class ObjectStorageDatasetExecutionConfig(ConfigSectionInterface):
+    """Settings for running data driven object storage tests."""
+
+    SECTION_NAME = 'objectstorage_dataset_execution'
+
+    @property
+    def parallel(self):
+        """
+        Run every dataset of the parallel capable data driven tests of a
+        class concurrently when the first of them runs. Each test then
+        reports the outcome of its own dataset. Every dataset runs even if
+        the runner was asked for a subset of the tests.
+        """
+        return self.get_boolean('parallel', False)
+
+    @property
+    def max_workers(self):
+        """Upper bound on datasets in flight at once."""
+        return int(self.get('max_workers', 10))
+
+
+class ObjectStorageContainerPoolConfig(ConfigSectionInterface):
+    """Settings for the run wide pool of reusable empty containers."""
+
+    SECTION_NAME = 'objectstorage_container_pool'
+
+    @property
+    def enabled(self):
+        """
+        Hand out pooled containers from get_pooled_container. Pooling also
+        needs bulk_delete to be available; without it every call creates
+        and deletes a container of its own.
+        """
+        return self.get_boolean('enabled', True)
+
+    @property
+    def size(self):
+        """Containers created at once whenever the pool runs dry."""
+        return int(self.get('size', 10))
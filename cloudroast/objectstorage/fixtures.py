@@ -13,9 +13,73 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import atexit
+from functools import partial
+from hashlib import sha1
+from io import BytesIO
+from itertools import islice
+import mmap
+import os
+import shutil
+import tarfile
+import threading
+
 from cafe.drivers.unittest.decorators import memoized
-from cafe.drivers.unittest.fixtures import BaseTestFixture
+from cafe.engine.config import EngineConfig
+from cloudcafe.common.tools.md5hash import get_md5_hash
 from cloudcafe.objectstorage.composites import ObjectStorageComposite
+from cloudroast.common.concurrency import run_concurrently
+from cloudroast.common.fixtures import InstrumentedTestFixture
+from cloudroast.objectstorage.config import (
+    ObjectStorageContainerPoolConfig, ObjectStorageDatasetExecutionConfig,
+    ObjectStorageSeedingConfig)
+
+try:
+    from urllib import quote
+except ImportError:
+    from urllib.parse import quote
+
+CONTENT_TYPE_TEXT = 'text/plain; charset=UTF-8'
+ARCHIVE_MODES = {'tar': 'w', 'tar.gz': 'w:gz', 'tar.bz2': 'w:bz2'}
+# Part of the archive cache key; bump it when the archive layout changes
+ARCHIVE_LAYOUT_VERSION = '1'
+# The most entries Swift returns in a single listing
+LISTING_PAGE_SIZE = 10000
+
+
+def iter_listing(list_function, params=None, page_size=None):
+    """
+    Yields every entry of a container or object listing, requesting it
+    page by page with marker.
+    """
+    page_size = page_size or LISTING_PAGE_SIZE
+    params = dict(params or {}, format='json', limit=page_size)
+    while True:
+        response = list_function(params=dict(params))
+        if not response.ok:
+            raise Exception(
+                "Unable to list page after {0}: received {1}".format(
+                    params.get('marker'), response.status_code))
+        page = response.entity or []
+        for entry in page:
+            yield entry
+        if len(page) < page_size:
+            return
+        params['marker'] = page[-1].name
+
+
+def iter_container_names(client, prefix=None, page_size=None):
+    """
+    Yields the names of the containers of client's account, page by page.
+    """
+    params = {'prefix': prefix} if prefix else {}
+    for container in iter_listing(
+            client.list_containers, params=params, page_size=page_size):
+        yield container.name
+
+
+def _media_type(content_type):
+    return (content_type or '').split(';')[0].strip().lower()
 
 
 class ObjectStorageUser(object):
@@ -30,11 +94,24 @@ class ObjectStorageUser(object):
         self.roles = []
 
 
-class ObjectStorageFixture(BaseTestFixture):
+class ObjectStorageFixture(InstrumentedTestFixture):
     """
     @summary: Base fixture for objectstorage tests
     """
 
+    # Containers seeded with a cache_key, shared by every class in the run
+    _seeded_containers = {}
+    _seeding_lock = threading.Lock()
+    _archive_lock = threading.RLock()
+
+    # Empty containers shared by every class in the run, see
+    # get_pooled_container
+    _container_pool = []
+    _pooled_containers = set()
+    _container_pool_lock = threading.Lock()
+
+    LISTING_PAGE_SIZE = LISTING_PAGE_SIZE
+
     @classmethod
     @memoized
     def required_version(cls, *required_versions):
@@ -170,6 +247,391 @@ class ObjectStorageFixture(BaseTestFixture):
             cls.objectstorage_api_config.base_container_name)
         cls.client = object_storage_api.client
         cls.behaviors = object_storage_api.behaviors
+        cls.seeding_config = ObjectStorageSeedingConfig()
+        cls.dataset_execution_config = ObjectStorageDatasetExecutionConfig()
+        cls.parallel_datasets = cls.dataset_execution_config.parallel
+        cls.container_pool_config = ObjectStorageContainerPoolConfig()
+        cls.instrument_fixture()
+
+    @classmethod
+    def feature_enabled(cls, feature):
+        """
+        rtype:   bool
+        returns: Whether feature is configured as available in swift.
+        """
+        features = cls.behaviors.get_configured_features()
+        return (features == cls.objectstorage_api_config.ALL_FEATURES or
+                feature in features.split())
+
+    @classmethod
+    def get_dataset_concurrency_limit(cls, case_count):
+        """
+        Used by @parallel_dataset_test. Every case works in containers of
+        its own, so only the configured max_workers bounds concurrency.
+        """
+        return max(1, min(
+            case_count, cls.dataset_execution_config.max_workers))
+
+    @staticmethod
+    def sequential_object_names(count, prefix='obj_', width=7):
+        """
+        Yields count object names that list in the order they were
+        generated, ie obj_0000000, obj_0000001, ...
+        """
+        for index in range(count):
+            yield '{0}{1:0{2}d}'.format(prefix, index, width)
+
+    @classmethod
+    def seed_container(
+            cls, object_names, container_name=None, data='',
+            content_type=CONTENT_TYPE_TEXT, method=None, cache_key=None):
+        """
+        Creates an object for every name in object_names, either with
+        concurrent PUTs or with extract-archive uploads of
+        archive_batch_size objects each. Objects get content_type either way.
+
+        object_names may be a generator, so very large containers can be
+        seeded without building the list of names.
+
+        If no container_name is given, a container is created and deleted
+        at class cleanup. With a cache_key, the first class to seed that
+        key does the work and every later call in the run gets the same
+        container back; cached containers are deleted when the run exits
+        and must not be modified by tests.
+
+        rtype:   string
+        returns: The name of the seeded container.
+        """
+        if cache_key is None:
+            return cls._seed_container(
+                object_names, container_name, data, content_type, method,
+                add_cleanup=True)
+
+        with cls._seeding_lock:
+            if cache_key not in cls._seeded_containers:
+                if not cls._seeded_containers:
+                    atexit.register(
+                        ObjectStorageFixture._delete_seeded_containers,
+                        cls.behaviors)
+                cls._seeded_containers[cache_key] = cls._seed_container(
+                    object_names, container_name, data, content_type,
+                    method, add_cleanup=False)
+            return cls._seeded_containers[cache_key]
+
+    @classmethod
+    def _seed_container(
+            cls, object_names, container_name, data, content_type, method,
+            add_cleanup):
+        if container_name is None:
+            container_name = \
+                cls.behaviors.generate_unique_container_name('seeded')
+            if add_cleanup:
+                cls.addClassCleanup(
+                    cls.behaviors.force_delete_containers, [container_name])
+        cls.client.create_container(container_name)
+
+        method = method or cls.seeding_config.method
+        if method == 'auto':
+            method = 'archive' if cls.feature_enabled('bulk_upload') else 'put'
+
+        if not isinstance(data, bytes):
+            data = data.encode('utf-8')
+        headers = {'Content-Length': str(len(data)),
+                   'Content-Type': content_type}
+        if method == 'archive':
+            batches = cls._batches(
+                object_names, cls.seeding_config.archive_batch_size)
+            tasks = (partial(
+                cls._upload_seed_archive, container_name, batch, data,
+                headers) for batch in batches)
+        else:
+            tasks = (partial(
+                cls._put_seed_object, container_name, name, headers, data)
+                for name in object_names)
+        run_concurrently(tasks, max_workers=cls.seeding_config.max_workers)
+        return container_name
+
+    @staticmethod
+    def _batches(iterable, size):
+        iterator = iter(iterable)
+        while True:
+            batch = list(islice(iterator, size))
+            if not batch:
+                return
+            yield batch
+
+    @classmethod
+    def _put_seed_object(cls, container_name, object_name, headers, data):
+        response = cls.client.create_object(
+            container_name, object_name, headers=headers, data=data)
+        if not response.ok:
+            raise Exception(
+                "Unable to seed object {0}/{1}: received {2}".format(
+                    container_name, object_name, response.status_code))
+
+    @classmethod
+    def _upload_seed_archive(
+            cls, container_name, object_names, data, headers):
+        """
+        Extracts a batch of seed objects from an archive. Swift sets the
+        Content-Type of extracted objects from their user.mime_type xattr;
+        clusters that ignore it get the batch PUT again with headers.
+        """
+        content_type = headers['Content-Type']
+        archive = BytesIO()
+        tar = tarfile.open(
+            fileobj=archive, mode='w', format=tarfile.PAX_FORMAT)
+        for object_name in object_names:
+            member = tarfile.TarInfo(object_name)
+            member.size = len(data)
+            member.pax_headers = {
+                'SCHILY.xattr.user.mime_type': content_type}
+            tar.addfile(member, BytesIO(data))
+        tar.close()
+
+        response = cls.client.create_archive_object(
+            archive.getvalue(), 'tar', upload_path=container_name,
+            headers={'Accept': 'application/json'})
+        created = int(getattr(response.entity, 'num_files_created', 0) or 0)
+        if not response.ok or created != len(object_names):
+            raise Exception(
+                "Unable to seed {0}: extracted {1} of {2} objects, "
+                "received {3}".format(
+                    container_name, created, len(object_names),
+                    response.status_code))
+
+        response = cls.client.get_object_metadata(
+            container_name, object_names[0])
+        if (_media_type(response.headers.get('content-type')) !=
+                _media_type(content_type)):
+            for object_name in object_names:
+                cls._put_seed_object(
+                    container_name, object_name, headers, data)
+
+    @classmethod
+    def get_archive(cls, object_names, archive_format='tar', corruption=None):
+        """
+        Returns the path of an archive holding a file for each name in
+        object_names, whose content is the md5 hash of its name.
+
+        Archives are content-addressed in the engine temp directory, so
+        each variant is built once and reused by every class and run.
+
+        corruption is an optional (start, end) byte range overwritten with
+        null bytes in the stored archive, ie a header field. The corrupt
+        copy is patched in place through mmap and cached as well.
+
+        rtype:   string
+        returns: Path of the archive file.
+        """
+        object_names = list(object_names)
+        key = sha1()
+        for part in [ARCHIVE_LAYOUT_VERSION, archive_format,
+                     repr(corruption)] + object_names:
+            key.update(part.encode('utf-8'))
+            key.update(b'\n')
+        path = os.path.join(
+            EngineConfig().temp_directory,
+            'archive_{0}.{1}'.format(key.hexdigest(), archive_format))
+
+        with cls._archive_lock:
+            if os.path.exists(path):
+                return path
+            partial_path = '{0}.{1}.partial'.format(path, os.getpid())
+            if corruption is None:
+                cls._build_archive(partial_path, object_names, archive_format)
+            else:
+                shutil.copyfile(
+                    cls.get_archive(object_names, archive_format),
+                    partial_path)
+                cls._corrupt_file(partial_path, *corruption)
+            os.rename(partial_path, path)
+        return path
+
+    @classmethod
+    def build_archive(cls, object_names, archive_format='tar'):
+        """
+        Streams an archive holding a file for each name in object_names,
+        whose content is the md5 hash of its name, to a new file in the
+        engine temp directory. Members are written one at a time, so a
+        generator of names can produce archives of any size. The file is
+        removed at class cleanup.
+
+        rtype:   tuple
+        returns: Path of the archive file and the number of files in it.
+        """
+        path = os.path.join(
+            EngineConfig().temp_directory,
+            'archive_{0}.{1}'.format(
+                cls.behaviors.generate_unique_container_name('stream'),
+                archive_format))
+        cls.addClassCleanup(os.remove, path)
+        return path, cls._build_archive(path, object_names, archive_format)
+
+    @staticmethod
+    def _build_archive(path, object_names, archive_format):
+        count = 0
+        tar = tarfile.open(path, mode=ARCHIVE_MODES[archive_format])
+        try:
+            for object_name in object_names:
+                content = get_md5_hash(object_name).encode('utf-8')
+                member = tarfile.TarInfo(object_name)
+                member.size = len(content)
+                tar.addfile(member, BytesIO(content))
+                count += 1
+        finally:
+            tar.close()
+        return count
+
+    @staticmethod
+    def _corrupt_file(path, start, end):
+        with open(path, 'r+b') as archive_file:
+            archive_map = mmap.mmap(archive_file.fileno(), 0)
+            try:
+                archive_map[start:end] = b'\x00' * (end - start)
+                archive_map.flush()
+            finally:
+                archive_map.close()
+
+    @classmethod
+    def iter_container_names(cls, prefix=None, page_size=None):
+        """
+        Yields the names of the account's containers, page by page.
+        """
+        return iter_container_names(
+            cls.client, prefix=prefix,
+            page_size=page_size or cls.LISTING_PAGE_SIZE)
+
+    @classmethod
+    def iter_object_names(cls, container_name, prefix=None, page_size=None):
+        """
+        Yields the names of the objects in a container, page by page, so
+        containers of any size can be walked without holding the listing.
+        """
+        params = {'prefix': prefix} if prefix else {}
+        for obj in iter_listing(
+                partial(cls.client.list_objects, container_name),
+                params=params, page_size=page_size or cls.LISTING_PAGE_SIZE):
+            yield obj.name
+
+    @staticmethod
+    def compare_listing(listed_names, expected_names):
+        """
+        Walks two iterables of names side by side, stopping at the first
+        difference.
+
+        rtype:   tuple
+        returns: The number of names that matched, and the first
+                 (expected, listed) pair that did not, or None. A missing
+                 name on either side is reported as None.
+        """
+        listed_names = iter(listed_names)
+        matched = 0
+        for expected in expected_names:
+            listed = next(listed_names, None)
+            if listed != expected:
+                return matched, (expected, listed)
+            matched += 1
+        listed = next(listed_names, None)
+        if listed is not None:
+            return matched, (None, listed)
+        return matched, None
+
+    @staticmethod
+    def _delete_seeded_containers(behaviors):
+        behaviors.force_delete_containers(
+            list(ObjectStorageFixture._seeded_containers.values()))
+
+    def get_pooled_container(self):
+        """
+        Returns an empty container from a pool shared by the whole run, for
+        tests that only read and write objects in it. At cleanup it is
+        emptied with bulk deletes and goes back to the pool; one left with
+        metadata, ACLs or objects is deleted instead. Pooled containers are
+        deleted in one batch when the run exits.
+
+        Falls back to create_temp_container when pooling is disabled or
+        bulk delete is not available.
+
+        rtype:   string
+        returns: The name of the container.
+        """
+        if not (self.container_pool_config.enabled and
+                self.feature_enabled('bulk_delete')):
+            return self.create_temp_container(descriptor='pooled')
+
+        with self._container_pool_lock:
+            if not self._container_pool:
+                self._fill_container_pool()
+            container_name = self._container_pool.pop()
+        self.addCleanup(self._release_pooled_container, container_name)
+        return container_name
+
+    @classmethod
+    def _fill_container_pool(cls):
+        if not cls._pooled_containers:
+            atexit.register(
+                ObjectStorageFixture._delete_pooled_containers,
+                cls.behaviors)
+        container_names = [
+            cls.behaviors.generate_unique_container_name('pooled')
+            for _ in range(max(1, cls.container_pool_config.size))]
+        responses = run_concurrently(
+            [partial(cls.client.create_container, container_name)
+             for container_name in container_names],
+            max_workers=len(container_names))
+        for container_name, response in zip(container_names, responses):
+            if not response.ok:
+                raise Exception(
+                    "Unable to create pooled container {0}: received "
+                    "{1}".format(container_name, response.status_code))
+            cls._pooled_containers.add(container_name)
+            cls._container_pool.append(container_name)
+
+    @classmethod
+    def _release_pooled_container(cls, container_name):
+        if cls._reset_pooled_container(container_name):
+            with cls._container_pool_lock:
+                cls._container_pool.append(container_name)
+            return
+        cls.behaviors.force_delete_containers([container_name])
+        with cls._container_pool_lock:
+            cls._pooled_containers.discard(container_name)
+
+    @classmethod
+    def _reset_pooled_container(cls, container_name):
+        """
+        Bulk deletes every object in a pooled container.
+
+        rtype:   bool
+        returns: Whether the container is now empty and free of metadata,
+                 and so can be handed out again.
+        """
+        targets = ('/{0}/{1}'.format(
+            quote(container_name), quote(object_name.encode('utf-8')))
+            for object_name in cls.iter_object_names(container_name))
+        for batch in cls._batches(
+                targets, cls.objectstorage_api_config.bulk_delete_max_count):
+            if not cls.client.bulk_delete(batch).ok:
+                return False
+
+        response = cls.client.get_container_metadata(container_name)
+        if not response.ok:
+            return False
+        for header, value in response.headers.items():
+            header = header.lower()
+            if header == 'x-container-object-count' and value != '0':
+                return False
+            if header.startswith('x-container-meta-') or header in (
+                    'x-container-read', 'x-container-write',
+                    'x-versions-location', 'x-history-location'):
+                return False
+        return True
+
+    @staticmethod
+    def _delete_pooled_containers(behaviors):
+        behaviors.force_delete_containers(
+            list(ObjectStorageFixture._pooled_containers))
 
     def create_temp_container(self, descriptor='', headers=None):
         """
@@ -0,0 +1,160 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import json
+import time
+import unittest
+from xml.etree import ElementTree
+
+from cafe.drivers.unittest.datasets import DatasetList
+from cafe.drivers.unittest.decorators import (
+    DataDrivenFixture, data_driven_test, tags)
+from cloudroast.common.metrics import summarize_latencies, write_run_results
+from cloudroast.objectstorage.config import \
+    ObjectStorageListingBenchmarkConfig
+from cloudroast.objectstorage.fixtures import ObjectStorageFixture
+
+RESULTS_NAME = 'objectstorage_listing_benchmark'
+OBJECTS_PER_PSEUDO_DIR = 100
+
+benchmark_config = ObjectStorageListingBenchmarkConfig()
+
+
+def benchmark_object_names(object_count):
+    """
+    Object names grouped OBJECTS_PER_PSEUDO_DIR to a pseudo directory, so
+    that listing with a '/' delimiter returns one entry per directory.
+    """
+    for index in range(object_count):
+        yield 'dir_{0:05d}/obj_{1:07d}'.format(
+            index // OBJECTS_PER_PSEUDO_DIR, index)
+
+
+def listing_datasets():
+    datasets = DatasetList()
+    for object_count in benchmark_config.container_sizes:
+        for listing_format in benchmark_config.formats:
+            for page_size in benchmark_config.page_sizes:
+                for delimiter in benchmark_config.delimiters:
+                    datasets.append_new_dataset(
+                        '{0}_objects_{1}_limit_{2}_delimiter_{3}'.format(
+                            object_count, listing_format, page_size,
+                            'slash' if delimiter == '/' else delimiter),
+                        {'object_count': object_count,
+                         'listing_format': listing_format,
+                         'page_size': page_size,
+                         'delimiter': None if delimiter == 'none'
+                         else delimiter})
+    return datasets
+
+
+@unittest.skipUnless(
+    benchmark_config.enabled, "Container listing benchmark is not enabled")
+@DataDrivenFixture
+class ContainerListingBenchmark(ObjectStorageFixture):
+    """
+    Measures how long Swift takes to list containers of different sizes,
+    walking each listing page by page with marker, and appends one record
+    per case to objectstorage_listing_benchmark.jsonl in the run's log
+    directory.
+    """
+
+    @data_driven_test(listing_datasets())
+    @tags('benchmark')
+    def ddtest_container_listing(
+            self, object_count, listing_format, page_size, delimiter):
+        container_name = self.seed_container(
+            benchmark_object_names(object_count),
+            cache_key='listing_benchmark_{0}'.format(object_count))
+
+        latencies = []
+        entry_count = 0
+        start = time.time()
+        for _ in range(benchmark_config.iterations):
+            page_latencies, entry_count = self._walk_listing(
+                container_name, listing_format, page_size, delimiter)
+            latencies.extend(page_latencies)
+        elapsed = time.time() - start
+
+        record = {
+            'timestamp': start,
+            'swift_version': self.objectstorage_api_config.version,
+            'container_objects': object_count,
+            'format': listing_format,
+            'page_size': page_size,
+            'delimiter': delimiter,
+            'iterations': benchmark_config.iterations,
+            'entries': entry_count,
+            'pages_per_walk': len(latencies) // benchmark_config.iterations,
+            'entries_per_second':
+                entry_count * benchmark_config.iterations / elapsed,
+            'page_latency': summarize_latencies(latencies)}
+        write_run_results(RESULTS_NAME, [record])
+        self.fixture_log.info(json.dumps(record, sort_keys=True))
+
+        if delimiter is None:
+            expected = object_count
+        else:
+            expected = -(-object_count // OBJECTS_PER_PSEUDO_DIR)
+        self.assertEqual(
+            expected,
+            entry_count,
+            msg="expected {0} entries in the listing, received {1}".format(
+                expected, entry_count))
+
+    def _walk_listing(self, container_name, listing_format, page_size,
+                      delimiter):
+        """
+        Lists the whole container, one page at a time.
+
+        rtype:   tuple
+        returns: The duration of each page request and the number of
+                 entries listed.
+        """
+        params = {'format': listing_format, 'limit': page_size}
+        if delimiter:
+            params['delimiter'] = delimiter
+        latencies = []
+        entry_count = 0
+        while True:
+            start = time.time()
+            response = self.client.list_objects(
+                container_name, params=dict(params))
+            latencies.append(time.time() - start)
+            self.assertTrue(
+                response.ok,
+                msg="listing {0} failed with {1}".format(
+                    container_name, response.status_code))
+
+            names = self._parse_listing(listing_format, response.content)
+            entry_count += len(names)
+            if len(names) < page_size:
+                return latencies, entry_count
+            params['marker'] = names[-1]
+
+    @staticmethod
+    def _parse_listing(listing_format, content):
+        if not content:
+            return []
+        if isinstance(content, bytes):
+            content = content.decode('utf-8')
+        if listing_format == 'json':
+            return [entry.get('name') or entry.get('subdir')
+                    for entry in json.loads(content)]
+        if listing_format == 'xml':
+            root = ElementTree.fromstring(content.encode('utf-8'))
+            return [child.get('name') if child.tag == 'subdir'
+                    else child.findtext('name') for child in root]
+        return content.splitlines()
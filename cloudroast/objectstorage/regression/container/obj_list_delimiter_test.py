@@ -56,12 +56,11 @@ class DelimiterTest(ObjectStorageFixture):
                      "music_collection2/maximum_drok",
                      "transparent_aluminum_doc"]
 
-        for obj_name in obj_names:
-            self.client.create_object(
-                self.container_name,
-                obj_name,
-                headers=self.headers,
-                data=self.object_data)
+        self.seed_container(
+            obj_names,
+            container_name=self.container_name,
+            data=self.object_data,
+            content_type=CONTENT_TYPE_TEXT)
 
         params = {"delimiter": "/", "format": "json"}
         response = self.client.list_objects(self.container_name, params=params)
@@ -27,21 +27,12 @@ class ListLimitTest(ObjectStorageFixture):
         super(ListLimitTest, cls).setUpClass()
 
         cls.container_name = CONTAINER_NAME
-        cls.client.create_container(cls.container_name)
-
-        object_data = 'Test file data'
-        content_length = str(len(object_data))
-        headers = {'Content-Length': content_length,
-                   'Content-Type': CONTENT_TYPE_TEXT}
-
         cls.obj_names = ["a_obj", "b_obj", "c_obj"]
-
-        for obj_name in cls.obj_names:
-            cls.client.create_object(
-                cls.container_name,
-                obj_name,
-                headers=headers,
-                data=object_data)
+        cls.seed_container(
+            cls.obj_names,
+            container_name=cls.container_name,
+            data='Test file data',
+            content_type=CONTENT_TYPE_TEXT)
 
     @classmethod
     def tearDownClass(cls):
@@ -29,21 +29,12 @@ class MarkerEndMarkerTest(ObjectStorageFixture):
         super(MarkerEndMarkerTest, cls).setUpClass()
 
         cls.container_name = CONTAINER_NAME
-        cls.client.create_container(cls.container_name)
-
-        object_data = Constants.VALID_OBJECT_DATA
-        content_length = str(len(object_data))
-        headers = {'Content-Length': content_length,
-                   'Content-Type': CONTENT_TYPE_TEXT}
-
         cls.obj_names = ["b_obj", "c_obj", "d_obj", "e_obj", "f_obj", "g_obj"]
-
-        for obj_name in cls.obj_names:
-            cls.client.create_object(
-                cls.container_name,
-                obj_name,
-                headers=headers,
-                data=object_data)
+        cls.seed_container(
+            cls.obj_names,
+            container_name=cls.container_name,
+            data=Constants.VALID_OBJECT_DATA,
+            content_type=CONTENT_TYPE_TEXT)
 
     @classmethod
     def tearDownClass(cls):
@@ -44,35 +44,15 @@ class PrefixTest(ObjectStorageFixture):
     def test_prefix(self):
         prefix = "music"
 
-        self.client.create_object(
-            self.container_name,
-            "music_play_list",
-            headers=self.headers,
-            data=self.object_data)
-
-        self.client.create_object(
-            self.container_name,
-            "must_have_slurm",
-            headers=self.headers,
-            data=self.object_data)
-
-        self.client.create_object(
-            self.container_name,
-            "music/grok",
-            headers=self.headers,
-            data=self.object_data)
-
-        self.client.create_object(
-            self.container_name,
-            "music/drok",
-            headers=self.headers,
-            data=self.object_data)
-
-        self.client.create_object(
-            self.container_name,
-            "music/the_best_of_grok_and_drok/",
-            headers=self.headers,
-            data=self.object_data)
+        self.seed_container(
+            ["music_play_list",
+             "must_have_slurm",
+             "music/grok",
+             "music/drok",
+             "music/the_best_of_grok_and_drok/"],
+            container_name=self.container_name,
+            data=self.object_data,
+            content_type=CONTENT_TYPE_TEXT)
 
         params = {"prefix": prefix, "format": "json"}
         response = self.client.list_objects(self.container_name, params=params)
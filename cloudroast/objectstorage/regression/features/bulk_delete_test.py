@@ -13,14 +13,20 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import json
 import re
+import time
 import unittest
 
 from cloudcafe.common.tools.check_dict import get_value
 from cloudcafe.objectstorage.objectstorage_api.common.constants import \
     Constants
+from cloudroast.common.metrics import summarize_latencies, write_run_results
+from cloudroast.objectstorage.config import ObjectStorageScaleConfig
 from cloudroast.objectstorage.fixtures import ObjectStorageFixture
 
+SCALE_RESULTS_NAME = 'objectstorage_scale'
+scale_config = ObjectStorageScaleConfig()
 
 
 class BulkDeleteTest(ObjectStorageFixture):
@@ -59,9 +65,7 @@ class BulkDeleteTest(ObjectStorageFixture):
 
         objects_to_create = objects_to_remain + objects_to_delete
 
-        for name in objects_to_create:
-            self.behaviors.create_object(
-                container_name=container_name, object_name=name, data='')
+        self.seed_container(objects_to_create, container_name=container_name)
 
         targets = ['/{0}/{1}'.format(
             container_name, name) for name in objects_to_delete]
@@ -108,9 +112,7 @@ class BulkDeleteTest(ObjectStorageFixture):
 
         objects_list = ['{0}{1}'.format(base_name, x) for x in range(1, 10)]
 
-        for name in objects_list:
-            self.behaviors.create_object(
-                container_name=container_name, object_name=name, data='')
+        self.seed_container(objects_list, container_name=container_name)
 
         targets = ['/{0}/{1}'.format(
             container_name, name) for name in objects_list]
@@ -165,9 +167,7 @@ class BulkDeleteTest(ObjectStorageFixture):
         objects_list = ['{0}{1}'.format(base_name, x + 1) for x in xrange(
             0, self.objectstorage_api_config.bulk_delete_max_count)]
 
-        for name in objects_list:
-            self.behaviors.create_object(
-                container_name=container_name, object_name=name, data='')
+        self.seed_container(objects_list, container_name=container_name)
 
         targets = ['/{0}/{1}'.format(
             container_name, name) for name in objects_list]
@@ -213,9 +213,7 @@ class BulkDeleteTest(ObjectStorageFixture):
         objects_list = ['{0}{1}'.format(base_name, x + 1) for x in xrange(
             0, self.objectstorage_api_config.bulk_delete_max_count + 1)]
 
-        for name in objects_list:
-            self.behaviors.create_object(
-                container_name=container_name, object_name=name, data='')
+        self.seed_container(objects_list, container_name=container_name)
 
         targets = ['/{0}/{1}'.format(
             container_name, name) for name in objects_list]
@@ -259,3 +257,79 @@ class BulkDeleteTest(ObjectStorageFixture):
         self.assertEqual(
             response_status, '400 Bad Request',
             'should not bulk delete objects.')
+
+    @unittest.skipUnless(scale_config.enabled, 'scale tests are not enabled')
+    def test_bulk_delete_at_scale(self):
+        """
+        Scenario:
+            Seed a container with object_count objects to delete and a
+            tenth as many to keep.
+            Bulk delete the first set, delete_batch_size objects per request.
+
+        Expected Results:
+            Every request should delete its whole batch, and a paginated
+            listing should show only the objects that were kept.
+        """
+        object_count = scale_config.object_count
+        batch_size = (scale_config.delete_batch_size or
+                      self.objectstorage_api_config.bulk_delete_max_count)
+        keep_count = max(1, object_count // 10)
+
+        def names_to_delete():
+            return self.sequential_object_names(
+                object_count, prefix='delete_')
+
+        def names_to_keep():
+            return self.sequential_object_names(keep_count, prefix='keep_')
+
+        container_name = self.create_temp_container('bulk_delete')
+        self.seed_container(names_to_delete(), container_name=container_name)
+        self.seed_container(names_to_keep(), container_name=container_name)
+
+        targets = ('/{0}/{1}'.format(container_name, name)
+                   for name in names_to_delete())
+        latencies = []
+        total_deleted = 0
+        start = time.time()
+        for batch in self._batches(targets, batch_size):
+            request_start = time.time()
+            response = self.client.bulk_delete(batch)
+            latencies.append(time.time() - request_start)
+            self.assertTrue(response.ok, 'bulk delete should be successful.')
+
+            number_deleted = int(re.findall(
+                r'Number Deleted: (\d+)', response.content)[0])
+            self.assertEqual(
+                number_deleted, len(batch),
+                'should delete every object in batch {0}.'.format(
+                    len(latencies)))
+            total_deleted += number_deleted
+        elapsed = time.time() - start
+
+        record = {
+            'timestamp': start,
+            'operation': 'bulk_delete',
+            'swift_version': self.objectstorage_api_config.version,
+            'items': total_deleted,
+            'items_per_request': batch_size,
+            'requests': len(latencies),
+            'elapsed': elapsed,
+            'items_per_second': total_deleted / elapsed,
+            'request_latency': summarize_latencies(latencies)}
+        write_run_results(SCALE_RESULTS_NAME, [record])
+        self.fixture_log.info(json.dumps(record, sort_keys=True))
+
+        self.assertEqual(
+            total_deleted, object_count, 'should delete every object.')
+
+        listed = next(self.iter_object_names(
+            container_name, prefix='delete_', page_size=1), None)
+        self.assertIsNone(
+            listed, 'deleted object {0} is still listed.'.format(listed))
+
+        matched, mismatch = self.compare_listing(
+            self.iter_object_names(container_name), names_to_keep())
+        self.assertIsNone(
+            mismatch,
+            'listing differs after {0} objects: expected {1}, '
+            'listed {2}.'.format(matched, *(mismatch or (None, None))))
@@ -19,6 +19,7 @@ from cafe.drivers.unittest.decorators import (
 from cafe.engine.http.client import HTTPClient
 from cloudcafe.objectstorage.objectstorage_api.common.constants import \
     Constants
+from cloudroast.common.datasets import parallel_dataset_test
 from cloudroast.objectstorage.fixtures import ObjectStorageFixture
 from cloudroast.objectstorage.generators import ObjectDatasetList
 
@@ -34,8 +35,15 @@ class CORSTest(ObjectStorageFixture):
 
         cls.dumb_client = HTTPClient()
         cls.object_name = Constants.VALID_OBJECT_NAME
+        # get_tempurl_key sets the account key when there is none, so it
+        # is fetched once here rather than by concurrent dataset cases.
+        # Form POST signs with the same key.
+        cls.tempurl_key = None
+        if cls.feature_enabled('tempurl') or cls.feature_enabled('formpost'):
+            cls.tempurl_key = cls.behaviors.get_tempurl_key()
 
     @data_driven_test(ObjectDatasetList())
+    @parallel_dataset_test
     @ObjectStorageFixture.required_features('tempurl')
     def ddtest_container_cors_with_tempurl(self, generate_object, **kwargs):
         """
@@ -71,7 +79,7 @@ class CORSTest(ObjectStorageFixture):
                         self.object_name,
                         headers=object_headers)
 
-        tempurl_key = self.behaviors.get_tempurl_key()
+        tempurl_key = self.tempurl_key
         tempurl_info = self.client.create_temp_url(
             'GET', container_name, self.object_name, 900, tempurl_key)
 
@@ -170,7 +178,7 @@ class CORSTest(ObjectStorageFixture):
         container_name = self.create_temp_container(
             descriptor=CONTAINER_DESCRIPTOR, headers=container_headers)
 
-        tempurl_key = self.behaviors.get_tempurl_key()
+        tempurl_key = self.tempurl_key
         files = [{'name': 'foo1'}]
 
         # Requests with no Origin should not return CORS headers.
@@ -305,6 +313,7 @@ class CORSTest(ObjectStorageFixture):
                                           preflight_response.status_code))
 
     @data_driven_test(ObjectDatasetList())
+    @parallel_dataset_test
     @ObjectStorageFixture.required_features('tempurl')
     def ddtest_container_cors_with_wildcard_origin(self, generate_object,
                                                    **kwargs):
@@ -342,7 +351,7 @@ class CORSTest(ObjectStorageFixture):
                         self.object_name,
                         headers=object_headers)
 
-        tempurl_key = self.behaviors.get_tempurl_key()
+        tempurl_key = self.tempurl_key
         tempurl_info = self.client.create_temp_url('GET',
                                                    container_name,
                                                    self.object_name,
@@ -393,6 +402,7 @@ class CORSTest(ObjectStorageFixture):
                 cors_response.headers.get('Access-Control-Allow-Origin')))
 
     @data_driven_test(ObjectDatasetList())
+    @parallel_dataset_test
     @ObjectStorageFixture.required_features('tempurl', 'object-cors')
     def ddtest_object_cors_with_tempurl(self, generate_object, **kwargs):
         """
@@ -427,7 +437,7 @@ class CORSTest(ObjectStorageFixture):
                         self.object_name,
                         headers=object_headers)
 
-        tempurl_key = self.behaviors.get_tempurl_key()
+        tempurl_key = self.tempurl_key
         tempurl_info = self.client.create_temp_url(
             'GET', container_name, self.object_name, 900, tempurl_key)
 
@@ -499,6 +509,7 @@ class CORSTest(ObjectStorageFixture):
                             'differing origin.')
 
     @data_driven_test(ObjectDatasetList())
+    @parallel_dataset_test
     @ObjectStorageFixture.required_features('tempurl', 'object-cors')
     def ddtest_object_override_container_cors_with_tempurl(
             self, generate_object, **kwargs):
@@ -539,7 +550,7 @@ class CORSTest(ObjectStorageFixture):
                         self.object_name,
                         headers=object_headers)
 
-        tempurl_key = self.behaviors.get_tempurl_key()
+        tempurl_key = self.tempurl_key
         tempurl_info = self.client.create_temp_url(
             'GET', container_name, self.object_name, 900, tempurl_key)
 
@@ -20,6 +20,7 @@ from cafe.drivers.unittest.decorators import (
     DataDrivenFixture, data_driven_test)
 from cloudcafe.objectstorage.objectstorage_api.common.constants import \
     Constants
+from cloudroast.common.datasets import parallel_dataset_test
 from cloudroast.objectstorage.fixtures import ObjectStorageFixture
 from cloudroast.objectstorage.generators import ObjectDatasetList
 
@@ -37,6 +38,7 @@ class ExpiringObjectTest(ObjectStorageFixture):
         cls.default_obj_data = Constants.VALID_OBJECT_DATA
 
     @data_driven_test(ObjectDatasetList())
+    @parallel_dataset_test
     def ddtest_object_creation_with_x_delete_at(self, object_type,
                                                 generate_object):
         container_name = self.create_temp_container(
@@ -61,6 +63,7 @@ class ExpiringObjectTest(ObjectStorageFixture):
         self.assertEqual(response.status_code, 404)
 
     @data_driven_test(ObjectDatasetList())
+    @parallel_dataset_test
     def ddtest_object_creation_with_x_delete_after(
             self, object_type, generate_object):
         container_name = self.create_temp_container(
@@ -82,6 +85,7 @@ class ExpiringObjectTest(ObjectStorageFixture):
         self.assertEqual(response.status_code, 404)
 
     @data_driven_test(ObjectDatasetList())
+    @parallel_dataset_test
     def ddtest_object_creation_with_x_delete_after_with_unicode_container_name(
             self, object_type, generate_object):
         """
@@ -137,6 +141,7 @@ class ExpiringObjectTest(ObjectStorageFixture):
                 received=str(received)))
 
     @data_driven_test(ObjectDatasetList())
+    @parallel_dataset_test
     def ddtest_object_creation_with_x_delete_at_with_unicode_container_name(
             self, object_type, generate_object):
         """
@@ -193,6 +198,7 @@ class ExpiringObjectTest(ObjectStorageFixture):
                 received=str(received)))
 
     @data_driven_test(ObjectDatasetList())
+    @parallel_dataset_test
     def ddtest_object_deletion_with_x_delete_at(self, **kwargs):
         """
         Scenario:
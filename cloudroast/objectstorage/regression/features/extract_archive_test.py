@@ -13,7 +13,10 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import json
 import os
+import time
+import unittest
 
 from cafe.drivers.unittest.datasets import DatasetList
 from cafe.drivers.unittest.decorators import (
@@ -22,10 +25,16 @@ from cafe.engine.config import EngineConfig
 from cloudcafe.common.tools.md5hash import get_md5_hash
 from cloudcafe.objectstorage.objectstorage_api.common.constants import \
     Constants
+from cloudroast.common.metrics import write_run_results
+from cloudroast.objectstorage.config import (
+    ObjectStorageArchiveConfig, ObjectStorageScaleConfig)
 from cloudroast.objectstorage.fixtures import ObjectStorageFixture
 
 BASE_NAME = "extract_archive"
 HTTP_OK = 200
+SCALE_RESULTS_NAME = 'objectstorage_scale'
+
+scale_config = ObjectStorageScaleConfig()
 
 archive_formats = DatasetList()
 archive_formats.append_new_dataset(
@@ -57,7 +66,7 @@ class ExtractArchiveTest(ObjectStorageFixture):
         cls.obj_names_with_slashes = []
         cls.obj_names_without_slashes = []
 
-        cls.num_archive_files = 20
+        cls.num_archive_files = ObjectStorageArchiveConfig().num_archive_files
         for num in range(cls.num_archive_files):
             if num < 10:
                 cls.obj_names_with_slashes.append(
@@ -72,25 +81,15 @@ class ExtractArchiveTest(ObjectStorageFixture):
         cls.obj_names = \
             cls.obj_names_with_slashes + cls.obj_names_without_slashes
 
-        tar_archive = cls.client.create_archive(cls.obj_names, None)
-        cls.archive_paths["tar"] = tar_archive
-
-        gz_archive = cls.client.create_archive(cls.obj_names, "gz")
-        cls.archive_paths["tar.gz"] = gz_archive
-
-        bz2_archive = cls.client.create_archive(cls.obj_names, "bz2")
-        cls.archive_paths["tar.bz2"] = bz2_archive
-
-    @classmethod
-    def tearDownClass(cls):
-        super(ExtractArchiveTest, cls).setUpClass()
-        for key in cls.archive_paths.keys():
-            os.remove(cls.archive_paths[key])
+        # Archives are cached across classes and runs, see get_archive
+        for archive_format in ["tar", "tar.gz", "tar.bz2"]:
+            cls.archive_paths[archive_format] = cls.get_archive(
+                cls.obj_names, archive_format)
 
     def read_archive_data(self, archive_path):
         archive_data = None
 
-        archive_file = open(archive_path, 'r')
+        archive_file = open(archive_path, 'rb')
         archive_data = archive_file.read()
         archive_file.close()
 
@@ -375,3 +374,104 @@ class ExtractArchiveTest(ObjectStorageFixture):
             obj_name)
 
         self.assertGreater(response.headers.get('content-length'), 0)
+
+    @unittest.skipUnless(scale_config.enabled, 'scale tests are not enabled')
+    @ObjectStorageFixture.required_features('bulk_upload')
+    def test_extract_archive_at_scale(self):
+        """
+        Scenario: upload a streamed archive of object_count files spread
+        over extraction_containers containers to the account
+
+        Expected Results: every file is extracted, and a paginated listing
+        of each new container holds exactly the files archived for it
+        """
+        archive_format = scale_config.archive_format
+        object_count = scale_config.object_count
+        container_count = min(scale_config.extraction_containers,
+                              object_count)
+        container_prefix = self.behaviors.generate_unique_container_name(
+            'scale')
+        container_names = [
+            '{0}_{1:05d}'.format(container_prefix, index)
+            for index in range(container_count)]
+        self.addCleanup(
+            self.behaviors.force_delete_containers, container_names)
+
+        def names_in(container_index):
+            for index in range(container_index, object_count,
+                               container_count):
+                yield 'obj_{0:07d}'.format(index)
+
+        def archive_names():
+            for index in range(object_count):
+                yield '{0}/obj_{1:07d}'.format(
+                    container_names[index % container_count], index)
+
+        build_start = time.time()
+        archive_path, archived = self.build_archive(
+            archive_names(), archive_format)
+        build_elapsed = time.time() - build_start
+        archive_size = os.path.getsize(archive_path)
+
+        start = time.time()
+        with open(archive_path, 'rb') as archive_file:
+            response = self.client.create_archive_object(
+                archive_file,
+                archive_format,
+                headers={'Accept': 'application/json'})
+        elapsed = time.time() - start
+
+        expected = HTTP_OK
+        received = response.status_code
+        self.assertEqual(
+            expected,
+            received,
+            "extract archive expected successful status code: {0}"
+            " received: {1}".format(expected, received))
+
+        created = int(response.entity.num_files_created)
+        record = {
+            'timestamp': start,
+            'operation': 'extract_archive',
+            'swift_version': self.objectstorage_api_config.version,
+            'archive_format': archive_format,
+            'archive_bytes': archive_size,
+            'archive_build_seconds': build_elapsed,
+            'containers': container_count,
+            'items': created,
+            'requests': 1,
+            'elapsed': elapsed,
+            'items_per_second': created / elapsed}
+        write_run_results(SCALE_RESULTS_NAME, [record])
+        self.fixture_log.info(json.dumps(record, sort_keys=True))
+
+        expected = archived
+        received = created
+        self.assertEqual(
+            expected,
+            received,
+            msg="response body 'Number Files Created' expected: {0}"
+            " received {1}".format(expected, received))
+
+        self.assertEqual(
+            0,
+            len(response.entity.errors),
+            msg="response body 'Errors' expected None received {0}".format(
+                response.entity.errors))
+
+        matched, mismatch = self.compare_listing(
+            self.iter_container_names(prefix=container_prefix),
+            container_names)
+        self.assertIsNone(
+            mismatch,
+            msg="container listing differs after {0} containers: expected"
+            " {1} listed {2}".format(matched, *(mismatch or (None, None))))
+
+        for index, container_name in enumerate(container_names):
+            matched, mismatch = self.compare_listing(
+                self.iter_object_names(container_name), names_in(index))
+            self.assertIsNone(
+                mismatch,
+                msg="{0} listing differs after {1} objects: expected {2}"
+                " listed {3}".format(
+                    container_name, matched, *(mismatch or (None, None))))
@@ -13,12 +13,11 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
-import os
-
 from cafe.engine.config import EngineConfig
 from cloudcafe.common.tools import randomstring as randstring
 from cloudcafe.objectstorage.objectstorage_api.common.constants import \
     Constants
+from cloudroast.objectstorage.config import ObjectStorageArchiveConfig
 from cloudroast.objectstorage.fixtures import ObjectStorageFixture
 
 BASE_NAME = "extract_corrupt_archive"
@@ -55,7 +54,7 @@ class ExtractCorruptArchiveTest(ObjectStorageFixture):
         cls.obj_names_with_slashes = []
         cls.obj_names_without_slashes = []
 
-        cls.num_archive_files = 20
+        cls.num_archive_files = ObjectStorageArchiveConfig().num_archive_files
         for num in range(cls.num_archive_files):
             if num < 10:
                 cls.obj_names_with_slashes.append(
@@ -70,25 +69,15 @@ class ExtractCorruptArchiveTest(ObjectStorageFixture):
         cls.obj_names = \
             cls.obj_names_with_slashes + cls.obj_names_without_slashes
 
-        tar_archive = cls.client.create_archive(cls.obj_names, None)
-        cls.archive_paths["tar"] = tar_archive
-
-        gz_archive = cls.client.create_archive(cls.obj_names, "gz")
-        cls.archive_paths["tar.gz"] = gz_archive
-
-        bz2_archive = cls.client.create_archive(cls.obj_names, "bz2")
-        cls.archive_paths["tar.bz2"] = bz2_archive
-
-    @classmethod
-    def tearDownClass(cls):
-        super(ExtractCorruptArchiveTest, cls).setUpClass()
-        for key in cls.archive_paths.keys():
-            os.remove(cls.archive_paths[key])
+        # Archives are cached across classes and runs, see get_archive
+        for archive_format in ["tar", "tar.gz", "tar.bz2"]:
+            cls.archive_paths[archive_format] = cls.get_archive(
+                cls.obj_names, archive_format)
 
     def read_archive_data(self, archive_path):
         archive_data = None
 
-        archive_file = open(archive_path, 'r')
+        archive_file = open(archive_path, 'rb')
         archive_data = archive_file.read()
         archive_file.close()
 
@@ -114,19 +103,9 @@ class ExtractCorruptArchiveTest(ObjectStorageFixture):
 
         archive_format = "tar"
 
-        temp_data = self.read_archive_data(self.archive_paths[archive_format])
-
-        enumerated_data = enumerate(temp_data)
-
-        temp = []
-
-        for i, char in enumerated_data:
-            if (i >= TAR_CHKSUM_HEADER_OFFSET and i < TAR_CHKSUM_HEADER_END):
-                temp.append("\x00")
-            else:
-                temp.append(char)
-
-        data = ''.join(temp)
+        corruption = (TAR_CHKSUM_HEADER_OFFSET, TAR_CHKSUM_HEADER_END)
+        data = self.read_archive_data(self.get_archive(
+            self.obj_names, archive_format, corruption=corruption))
 
         headers = {'Accept': 'application/json'}
 
@@ -198,20 +177,9 @@ class ExtractCorruptArchiveTest(ObjectStorageFixture):
 
         archive_format = "tar"
 
-        temp_data = self.read_archive_data(self.archive_paths[archive_format])
-
-        enumerated_data = enumerate(temp_data)
-
-        temp = []
-
-        for i, char in enumerated_data:
-            if (i >= TAR_TYPE_FLAG_HEADER_OFFSET and
-                    i < TAR_TYPE_FLAG_HEADER_END):
-                temp.append("\x00")
-            else:
-                temp.append(char)
-
-        data = ''.join(temp)
+        corruption = (TAR_TYPE_FLAG_HEADER_OFFSET, TAR_TYPE_FLAG_HEADER_END)
+        data = self.read_archive_data(self.get_archive(
+            self.obj_names, archive_format, corruption=corruption))
 
         headers = {'Accept': 'application/json'}
 
@@ -283,19 +251,9 @@ class ExtractCorruptArchiveTest(ObjectStorageFixture):
 
         archive_format = "tar"
 
-        temp_data = self.read_archive_data(self.archive_paths[archive_format])
-
-        enumerated_data = enumerate(temp_data)
-
-        temp = []
-
-        for i, char in enumerated_data:
-            if (i >= TAR_MODE_HEADER_OFFSET and i < TAR_MODE_HEADER_END):
-                temp.append("\x00")
-            else:
-                temp.append(char)
-
-        data = ''.join(temp)
+        corruption = (TAR_MODE_HEADER_OFFSET, TAR_MODE_HEADER_END)
+        data = self.read_archive_data(self.get_archive(
+            self.obj_names, archive_format, corruption=corruption))
 
         headers = {'Accept': 'application/json'}
 
@@ -367,19 +325,9 @@ class ExtractCorruptArchiveTest(ObjectStorageFixture):
 
         archive_format = "tar.gz"
 
-        temp_data = self.read_archive_data(self.archive_paths[archive_format])
-
-        enumerated_data = enumerate(temp_data)
-
-        temp = []
-
-        for i, char in enumerated_data:
-            if i == TAR_GZ_ID1_HEADER:
-                temp.append("\x00")
-            else:
-                temp.append(char)
-
-        data = ''.join(temp)
+        corruption = (TAR_GZ_ID1_HEADER, TAR_GZ_ID1_HEADER + 1)
+        data = self.read_archive_data(self.get_archive(
+            self.obj_names, archive_format, corruption=corruption))
 
         headers = {'Accept': 'application/json'}
 
@@ -451,19 +399,9 @@ class ExtractCorruptArchiveTest(ObjectStorageFixture):
 
         archive_format = "tar.gz"
 
-        temp_data = self.read_archive_data(self.archive_paths[archive_format])
-
-        enumerated_data = enumerate(temp_data)
-
-        temp = []
-
-        for i, char in enumerated_data:
-            if i == TAR_GZ_ID2_HEADER:
-                temp.append("\x00")
-            else:
-                temp.append(char)
-
-        data = ''.join(temp)
+        corruption = (TAR_GZ_ID2_HEADER, TAR_GZ_ID2_HEADER + 1)
+        data = self.read_archive_data(self.get_archive(
+            self.obj_names, archive_format, corruption=corruption))
 
         headers = {'Accept': 'application/json'}
 
@@ -535,19 +473,9 @@ class ExtractCorruptArchiveTest(ObjectStorageFixture):
 
         archive_format = "tar.gz"
 
-        temp_data = self.read_archive_data(self.archive_paths[archive_format])
-
-        enumerated_data = enumerate(temp_data)
-
-        temp = []
-
-        for i, char in enumerated_data:
-            if i == TAR_GZ_CM_HEADER:
-                temp.append("\x00")
-            else:
-                temp.append(char)
-
-        data = ''.join(temp)
+        corruption = (TAR_GZ_CM_HEADER, TAR_GZ_CM_HEADER + 1)
+        data = self.read_archive_data(self.get_archive(
+            self.obj_names, archive_format, corruption=corruption))
 
         headers = {'Accept': 'application/json'}
 
@@ -619,19 +547,9 @@ class ExtractCorruptArchiveTest(ObjectStorageFixture):
 
         archive_format = "tar.gz"
 
-        temp_data = self.read_archive_data(self.archive_paths[archive_format])
-
-        enumerated_data = enumerate(temp_data)
-
-        temp = []
-
-        for i, char in enumerated_data:
-            if i == TAR_GZ_FLAG_HEADER:
-                temp.append("\x00")
-            else:
-                temp.append(char)
-
-        data = ''.join(temp)
+        corruption = (TAR_GZ_FLAG_HEADER, TAR_GZ_FLAG_HEADER + 1)
+        data = self.read_archive_data(self.get_archive(
+            self.obj_names, archive_format, corruption=corruption))
 
         headers = {'Accept': 'application/json'}
 
@@ -704,19 +622,9 @@ class ExtractCorruptArchiveTest(ObjectStorageFixture):
 
         archive_format = "tar.bz2"
 
-        temp_data = self.read_archive_data(self.archive_paths[archive_format])
-
-        enumerated_data = enumerate(temp_data)
-
-        temp = []
-
-        for i, char in enumerated_data:
-            if (i >= BZ2_MAGIC_HEADER_OFFSET and i < BZ2_MAGIC_HEADER_END):
-                temp.append("\x00")
-            else:
-                temp.append(char)
-
-        data = ''.join(temp)
+        corruption = (BZ2_MAGIC_HEADER_OFFSET, BZ2_MAGIC_HEADER_END)
+        data = self.read_archive_data(self.get_archive(
+            self.obj_names, archive_format, corruption=corruption))
 
         headers = {'Accept': 'application/json'}
 
@@ -788,19 +696,9 @@ class ExtractCorruptArchiveTest(ObjectStorageFixture):
 
         archive_format = "tar.bz2"
 
-        temp_data = self.read_archive_data(self.archive_paths[archive_format])
-
-        enumerated_data = enumerate(temp_data)
-
-        temp = []
-
-        for i, char in enumerated_data:
-            if i == BZ2_VERSION_HEADER:
-                temp.append("\x00")
-            else:
-                temp.append(char)
-
-        data = ''.join(temp)
+        corruption = (BZ2_VERSION_HEADER, BZ2_VERSION_HEADER + 1)
+        data = self.read_archive_data(self.get_archive(
+            self.obj_names, archive_format, corruption=corruption))
 
         headers = {'Accept': 'application/json'}
 
@@ -872,19 +770,9 @@ class ExtractCorruptArchiveTest(ObjectStorageFixture):
 
         archive_format = "tar.bz2"
 
-        temp_data = self.read_archive_data(self.archive_paths[archive_format])
-
-        enumerated_data = enumerate(temp_data)
-
-        temp = []
-
-        for i, char in enumerated_data:
-            if i == BZ2_BLOCKSIZE_HEADER:
-                temp.append("\x00")
-            else:
-                temp.append(char)
-
-        data = ''.join(temp)
+        corruption = (BZ2_BLOCKSIZE_HEADER, BZ2_BLOCKSIZE_HEADER + 1)
+        data = self.read_archive_data(self.get_archive(
+            self.obj_names, archive_format, corruption=corruption))
 
         headers = {'Accept': 'application/json'}
 
@@ -13,12 +13,17 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from functools import partial
+import random
 import unittest
 
 from cafe.drivers.unittest.decorators import (
     DataDrivenFixture, data_driven_test)
 from cloudcafe.objectstorage.objectstorage_api.common.constants import \
     Constants
+from cloudroast.common.concurrency import execute_concurrently
+from cloudroast.common.datasets import parallel_dataset_test
+from cloudroast.objectstorage.config import ObjectStorageRangeRequestConfig
 from cloudroast.objectstorage.fixtures import ObjectStorageFixture
 from cloudroast.objectstorage.generators import ObjectDatasetList
 
@@ -27,14 +32,88 @@ CONTAINER_NAME = 'object_range_request_test_container'
 CONTENT_MSG = 'expected {0} in the content body. received {1}'
 CONTENT_TYPE_MSG = 'expected content_type {0} received {1}'
 MULTIPART = "multipart/byteranges;boundary="
+MAX_REPORTED_FAILURES = 10
+
+
+def iter_multipart_parts(content, boundary):
+    """
+    Yields the headers and body of each part of a multipart/byteranges
+    body. Bodies are memoryview slices of content, so no part is copied;
+    only the short header blocks are.
+
+    @raise ValueError: The body is not delimited by the boundary
+    """
+    view = memoryview(content)
+    delimiter = b'--' + boundary.encode('ascii')
+    position = content.find(delimiter)
+    if position < 0:
+        raise ValueError('boundary {0} not found'.format(boundary))
+    while True:
+        position += len(delimiter)
+        if content.startswith(b'--', position):
+            return
+        headers_end = content.find(b'\r\n\r\n', position)
+        if headers_end < 0:
+            raise ValueError('part headers at {0} not terminated'.format(
+                position))
+        headers = {}
+        for line in content[position:headers_end].splitlines():
+            name, separator, value = line.partition(b':')
+            if separator:
+                headers[name.strip().lower().decode('ascii')] = \
+                    value.strip().decode('ascii')
+        body_start = headers_end + 4
+        body_end = content.find(b'\r\n' + delimiter, body_start)
+        if body_end < 0:
+            raise ValueError('part at {0} not terminated'.format(body_start))
+        yield headers, view[body_start:body_end]
+        position = body_end + 2
+
+
+def random_range_headers(rng, length, count, max_ranges, multi_range=True):
+    """
+    Generates count Range header values for an object of length bytes,
+    mixing single ("a-b"), open-ended ("a-"), suffix ("-n") and, if
+    multi_range, non-overlapping multi-range requests.
+
+    @return: (header value, [(first byte, last byte), ...]) pairs
+    @rtype: list
+    """
+    kinds = ['single', 'open', 'suffix'] + (['multi'] if multi_range else [])
+    requests = []
+    for _ in range(count):
+        kind = rng.choice(kinds)
+        if kind == 'suffix':
+            size = rng.randint(1, length)
+            requests.append(
+                ('bytes=-{0}'.format(size), [(length - size, length - 1)]))
+        elif kind == 'open':
+            start = rng.randrange(length)
+            requests.append(
+                ('bytes={0}-'.format(start), [(start, length - 1)]))
+        else:
+            range_count = 1 if kind == 'single' else rng.randint(
+                2, max(2, max_ranges))
+            points = sorted(
+                rng.randrange(length) for _ in range(range_count * 2))
+            ranges = []
+            for start, end in zip(points[::2], points[1::2]):
+                if not ranges or start > ranges[-1][1]:
+                    ranges.append((start, end))
+            requests.append((
+                'bytes={0}'.format(','.join(
+                    '{0}-{1}'.format(start, end) for start, end in ranges)),
+                ranges))
+    return requests
 
 
 @DataDrivenFixture
 class ObjectRangeRequestTest(ObjectStorageFixture):
 
-    def setUp(self):
-        super(ObjectRangeRequestTest, self).setUp()
-        self.object_name = Constants.VALID_OBJECT_NAME
+    @classmethod
+    def setUpClass(cls):
+        super(ObjectRangeRequestTest, cls).setUpClass()
+        cls.object_name = Constants.VALID_OBJECT_NAME
 
     def get_boundary(self, content_type_header):
         """
@@ -63,25 +142,55 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
         multipart_content = {}
 
         try:
-            split_body = content.split("--{0}".format(boundary))
-        except AttributeError, error:
+            for i, (_, body) in enumerate(
+                    iter_multipart_parts(content, boundary), 1):
+                multipart_content['value{0}'.format(i)] = body.tobytes()
+        except (AttributeError, TypeError, ValueError), error:
             self.fail("body cannot be split on boundary."
                       " error: {0}".format(error))
 
-        i = 1
-        end = len(split_body) - 1
+        return multipart_content
 
-        try:
-            while i < end:
-                multipart_content['value{0}'.format(i)] = \
-                    split_body[i].split('\r\n\r\n')[1].strip('\r\n')
-                i += 1
-        except AttributeError, error:
-            self.error("error parsing content. error: {0}".format(error))
+    def check_range_response(self, response, ranges, payload):
+        """
+        Compares a range response with the expected slices of payload,
+        a memoryview of the object's data.
 
-        return multipart_content
+        @return: A description of the first problem found, or None
+        @rtype: string
+        """
+        length = len(payload)
+        if response.status_code != 206:
+            return 'status {0}'.format(response.status_code)
+
+        if len(ranges) == 1:
+            parts = [(response.headers, memoryview(response.content))]
+        else:
+            content_type = response.headers.get('content-type', '')
+            if not content_type.startswith(MULTIPART):
+                return CONTENT_TYPE_MSG.format(MULTIPART, content_type)
+            try:
+                parts = list(iter_multipart_parts(
+                    response.content, content_type[len(MULTIPART):]))
+            except ValueError, error:
+                return 'unparsable multipart body: {0}'.format(error)
+            if len(parts) != len(ranges):
+                return 'expected {0} parts received {1}'.format(
+                    len(ranges), len(parts))
+
+        for (start, end), (headers, body) in zip(ranges, parts):
+            expected = 'bytes {0}-{1}/{2}'.format(start, end, length)
+            received = headers.get('content-range')
+            if received != expected:
+                return 'expected content-range {0} received {1}'.format(
+                    expected, received)
+            if body != payload[start:end + 1]:
+                return 'body of {0}-{1} differs from the object'.format(
+                    start, end)
+        return None
 
     @data_driven_test(ObjectDatasetList())
+    @parallel_dataset_test
     def ddtest_basic_object_range_request(self, object_type, generate_object):
         """
         Scenario:
@@ -161,6 +270,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
 
     @unittest.skip('JIRA Bug https://jira.rax.io/browse/STORDEV-189')
     @data_driven_test(ObjectDatasetList())
+    @parallel_dataset_test
     def ddtest_multi_part_range_request(self, object_type, generate_object):
         """
         Scenario:
@@ -329,6 +439,7 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
                                                     str(response.content)))
 
     @data_driven_test(ObjectDatasetList())
+    @parallel_dataset_test
     def ddtest_range_request_with_bad_ranges(
             self, object_type, generate_object):
         """
@@ -467,3 +578,59 @@ class ObjectRangeRequestTest(ObjectStorageFixture):
                 msg=CONTENT_MSG.format(
                     obj_data,
                     str(response.content)))
+
+    @data_driven_test(ObjectDatasetList())
+    @parallel_dataset_test
+    def ddtest_concurrent_random_range_requests(
+            self, object_type, generate_object):
+        """
+        Scenario:
+            Upload a single object and make a large set of randomized
+            single, open-ended, suffix and multi-range requests against it
+            concurrently.
+
+        Expected Results:
+            Every response should hold exactly the requested bytes of the
+            object, with matching Content-Range headers.
+        """
+        config = ObjectStorageRangeRequestConfig()
+        seed = config.seed
+        if seed is None:
+            seed = random.randint(0, 2 ** 32)
+        self.fixture_log.info(
+            'range requests for {0} seeded with {1}'.format(object_type, seed))
+
+        container_name = self.create_temp_container(descriptor=CONTAINER_NAME)
+        obj_data = ''.join(["grok_{0}/".format(x) for x in range(1000000)])
+        generate_object(container_name, self.object_name, data=obj_data)
+        payload = memoryview(obj_data.encode('utf-8'))
+
+        range_requests = random_range_headers(
+            random.Random(seed), len(payload), config.request_count,
+            config.max_ranges,
+            multi_range=(object_type == 'standard' or
+                         config.multi_range_manifests))
+
+        def check(range_header, ranges):
+            response = self.client.get_object(
+                container_name,
+                self.object_name,
+                headers={'Range': range_header})
+            return self.check_range_response(response, ranges, payload)
+
+        results = execute_concurrently(
+            (partial(check, range_header, ranges)
+             for range_header, ranges in range_requests),
+            max_workers=config.max_workers)
+
+        failures = []
+        for (range_header, _), result in zip(range_requests, results):
+            problem = result.exception if result.failed else result.result
+            if problem:
+                failures.append('{0}: {1}'.format(range_header, problem))
+
+        self.assertEqual(
+            [],
+            failures[:MAX_REPORTED_FAILURES],
+            msg='{0} of {1} range requests failed (seed {2})'.format(
+                len(failures), len(range_requests), seed))
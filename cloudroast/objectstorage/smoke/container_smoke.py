@@ -291,14 +291,7 @@ class ContainerSmokeTest(ObjectStorageFixture):
                 foo/objet1.txt
                 foo/bar/
         """
-        container_name = self.behaviors.generate_unique_container_name(
-            self.base_container_name)
-
-        self.client.create_container(container_name)
-
-        self.addCleanup(
-            self.behaviors.force_delete_containers,
-            [container_name])
+        container_name = self.get_pooled_container()
 
         dir_marker = 'path_test/'
 
@@ -367,13 +360,7 @@ class ContainerSmokeTest(ObjectStorageFixture):
                 received=str(received)))
 
     def test_objects_list_with_prefix_delimiter_query_parameters(self):
-        container_name = self.behaviors.generate_unique_container_name(
-            self.base_container_name)
-        self.client.create_container(container_name)
-
-        self.addCleanup(
-            self.behaviors.force_delete_containers,
-            [container_name])
+        container_name = self.get_pooled_container()
 
         object_data = 'Test file data'
         content_length = str(len(object_data))
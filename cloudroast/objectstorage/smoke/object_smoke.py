@@ -47,8 +47,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_object_retrieval_with_valid_object_name(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         generate_object(container_name, object_name)
 
@@ -73,8 +72,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
         Bug filed for dlo/slo support of If-match Header:
         https://bugs.launchpad.net/swift/+bug/1279076
         """
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         obj_info = generate_object(container_name, object_name)
 
@@ -104,8 +102,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
         Bug filed for dlo/slo support of If-match Header:
         https://bugs.launchpad.net/swift/+bug/1279076
         """
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         object_info = generate_object(container_name, object_name)
 
@@ -150,8 +147,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_object_retrieval_with_if_modified_since(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         generate_object(container_name, object_name)
 
@@ -177,8 +173,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_object_not_modified_with_if_modified_since(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         generate_object(container_name, object_name)
 
@@ -204,8 +199,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_object_retrieval_with_if_unmodified_since(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         generate_object(container_name, object_name)
 
@@ -231,8 +225,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_object_retrieval_fails_with_if_unmodified_since(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         generate_object(container_name, object_name)
 
@@ -259,8 +252,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_partial_object_retrieval_with_start_range(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         generate_object(container_name, object_name)
 
@@ -284,8 +276,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_partial_object_retrieval_with_end_range(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         generate_object(container_name, object_name)
 
@@ -311,8 +302,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_partial_object_retrieval_with_range(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         generate_object(container_name, object_name)
 
@@ -338,8 +328,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_partial_object_retrieval_with_complete_range(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         generate_object(container_name, object_name)
 
@@ -365,8 +354,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_object_creation_with_valid_object_name(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         object_info = generate_object(container_name, object_name)
 
@@ -408,8 +396,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList(exclude=['dlo', 'slo']))
     def ddtest_object_update_with_valid_object_name(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         generate_object(container_name, object_name)
 
@@ -438,8 +425,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_object_creation_with_etag(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         object_info = generate_object(container_name, object_name)
 
@@ -485,8 +471,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList(exclude=['dlo', 'slo']))
     def test_object_creation_with_uppercase_etag(self):
 
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         object_data = "valid_data"
         data_md5 = md5(object_data).hexdigest()
@@ -533,8 +518,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @ObjectStorageFixture.required_features('object-cors')
     def ddtest_object_creation_with_access_control_allow_credentials(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         object_headers = {'Access-Control-Allow-Credentials': 'true'}
         object_info = generate_object(container_name, object_name,
@@ -577,8 +561,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @ObjectStorageFixture.required_features('object-cors')
     def ddtest_object_creation_with_access_control_allow_methods(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         object_headers = {
             'Access-Control-Allow-Methods': 'GET, POST, OPTIONS'}
@@ -622,8 +605,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @ObjectStorageFixture.required_features('object-cors')
     def ddtest_object_creation_with_access_control_allow_origin(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         object_headers = {
             'Access-Control-Allow-Origin': 'http://example.com'}
@@ -666,8 +648,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @ObjectStorageFixture.required_features('object-cors')
     def ddtest_object_creation_with_access_control_expose_headers(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         object_headers = {'Access-Control-Expose-Headers': 'X-Foo-Header'}
         object_info = generate_object(container_name, object_name,
@@ -710,8 +691,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @ObjectStorageFixture.required_features('object-cors')
     def ddtest_object_creation_with_access_controle_max_age(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         object_headers = {'Access-Control-Max-Age': '5'}
         object_info = generate_object(container_name, object_name,
@@ -754,8 +734,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @ObjectStorageFixture.required_features('object-cors')
     def ddtest_object_creation_with_access_control_request_headers(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         object_headers = {'Access-Control-Request-Headers': 'x-requested-with'}
         object_info = generate_object(container_name, object_name,
@@ -798,8 +777,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @ObjectStorageFixture.required_features('object-cors')
     def ddtest_object_creation_with_access_control_request_method(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         object_headers = {'Access-Control-Request-Method': 'GET'}
         object_info = generate_object(container_name, object_name,
@@ -842,8 +820,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @ObjectStorageFixture.required_features('object-cors')
     def ddtest_object_retrieval_with_origin(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         headers = {'access-control-allow-origin': 'http://example.com',
                    'access-control-expose-headers': 'X-Trans-Id'}
@@ -875,8 +852,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList(exclude=['dlo', 'slo']))
     def ddtest_object_creation_with_file_compression(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
 
         def object_data_op(data, extra_data):
@@ -922,8 +898,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_object_creation_with_content_disposition(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         object_headers = {
             'Content-Disposition': 'attachment; filename=testdata.txt'}
@@ -964,8 +939,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_object_creation_with_x_delete_at(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
 
         start_time = calendar.timegm(time.gmtime())
@@ -1008,8 +982,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_object_creation_with_delete_after(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         object_headers = {'X-Delete-After': '60'}
         object_info = generate_object(container_name, object_name,
@@ -1116,10 +1089,8 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @unittest.skip('Problem with this tests assertion, needs review')
     @data_driven_test(ObjectDatasetList())
     def ddtest_put_copy_object(self, object_type, generate_object):
-        src_container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
-        dest_container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        src_container_name = self.get_pooled_container()
+        dest_container_name = self.get_pooled_container()
 
         src_object_name = '{0}_source'.format(self.default_obj_name)
         generate_object(src_container_name, src_object_name)
@@ -1163,10 +1134,8 @@ class ObjectSmokeTest(ObjectStorageFixture):
 
     @data_driven_test(ObjectDatasetList())
     def ddtest_copy_object(self, object_type, generate_object):
-        src_container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
-        dest_container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        src_container_name = self.get_pooled_container()
+        dest_container_name = self.get_pooled_container()
 
         src_object_name = '{0}_source'.format(self.default_obj_name)
         generate_object(src_container_name, src_object_name)
@@ -1211,8 +1180,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_object_deletion_with_valid_object(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         generate_object(container_name, object_name)
 
@@ -1251,8 +1219,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_obj_metadata_update_with_object_possessing_metadata(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         generate_object(container_name, object_name,
                         headers={'X-Object-Meta-Grok': 'Drok'})
@@ -1312,8 +1279,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
 
     @data_driven_test(ObjectDatasetList())
     def ddtest_obj_metadata_update(self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object_name = self.default_obj_name
         generate_object(container_name, object_name)
 
@@ -1354,8 +1320,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_content_type_not_detected_without_detect_content_type_header(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object1_name = 'object1.txt'
         object1_headers = {'Content-Type': 'application/x-www-form-urlencoded'}
         generate_object(container_name, object1_name, headers=object1_headers)
@@ -1389,8 +1354,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
     @data_driven_test(ObjectDatasetList())
     def ddtest_content_type_detected_with_detect_content_type(
             self, object_type, generate_object):
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
         object1_name = 'object1.txt'
         object1_headers = {'X-Detect-Content-Type': True,
                            'Content-Type': 'application/x-www-form-urlencoded'}
@@ -1433,8 +1397,7 @@ class ObjectSmokeTest(ObjectStorageFixture):
             Return a 201 status code and a single object should
             be created.
         """
-        container_name = self.create_temp_container(
-            descriptor=CONTAINER_DESCRIPTOR)
+        container_name = self.get_pooled_container()
 
         headers = {"Transfer-Encoding": "chunked"}
 
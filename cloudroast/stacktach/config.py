@@ -0,0 +1,57 @@
+"""
+Copyright 2016 Rackspace
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from cafe.engine.models.data_interfaces import ConfigSectionInterface
+
+
+class StackTachScenarioConfig(ConfigSectionInterface):
+    """Settings for running StackTach lifecycle scenarios."""
+
+    SECTION_NAME = 'stacktach_scenarios'
+
+    @property
+    def concurrent_lifecycles(self):
+        """
+        Run the lifecycles of every StackTach functional class scheduled in
+        the run at once, the first time any of them is set up. Leave this
+        disabled when test classes are split across processes.
+        """
+        return self.get_boolean('concurrent_lifecycles', False)
+
+    @property
+    def max_workers(self):
+        """Maximum number of lifecycles (servers) in flight at once."""
+        return int(self.get('max_workers', 11))
+
+
+class StackTachPagingConfig(ConfigSectionInterface):
+    """Settings for paged verification of StackTach DB list endpoints."""
+
+    SECTION_NAME = 'stacktach_paging'
+
+    @property
+    def page_size(self):
+        """Records requested per page (the DB API caps this at 1000)."""
+        return int(self.get('page_size', 1000))
+
+    @property
+    def max_records(self):
+        """
+        Stop after this many records, by default a single full page. 0
+        walks the whole table, which on a production deployment can take
+        thousands of requests.
+        """
+        return int(self.get('max_records', 1000))
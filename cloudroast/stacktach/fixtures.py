@@ -13,9 +13,12 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import atexit
 from datetime import datetime, timedelta
+from functools import partial
+import threading
+import time
 
-from cafe.drivers.unittest.fixtures import BaseTestFixture
 from cloudcafe.common.tools.datagen import rand_name
 from cloudcafe.common.tools.time import string_to_datetime
 from cloudcafe.compute.common.constants import Constants
@@ -28,10 +31,123 @@ from cloudcafe.stacktach.v2.stacktach_db_api.behaviors import StackTachDBBehavio
 from cloudcafe.stacktach.v2.stacktach_db_api.client import StackTachDBClient
 from cloudcafe.stacktach.v2.stacky_api.behaviors import StackTachBehavior
 from cloudcafe.stacktach.v2.stacky_api.client import StackTachClient
+from cloudroast.common.concurrency import (
+    TaskResult, execute_concurrently, run_concurrently)
+from cloudroast.common.fixtures import InstrumentedTestFixture
 from cloudroast.compute.fixtures import ComputeFixture
+from cloudroast.stacktach.config import (
+    StackTachPagingConfig, StackTachScenarioConfig)
 
 
-class StackTachFixture(BaseTestFixture):
+class StackTachEventTypes(object):
+    LAUNCH = "launch"
+    DELETE = "delete"
+    EXIST = "exist"
+
+
+class StackTachEventSnapshot(object):
+    """
+    @summary: Launch, delete and exist events for a set of instances,
+        fetched concurrently and indexed for direct lookup.
+        Events are indexed by (instance uuid, event type), sorted by id,
+        and by (instance uuid, event type, event id).
+    """
+
+    def __init__(self, db_behavior, instance_ids, max_workers=None):
+        self.db_behavior = db_behavior
+        self.instance_ids = list(instance_ids)
+        self.max_workers = max_workers or 3 * len(self.instance_ids) or 1
+        self.responses = {}
+        self.events = {}
+        self.events_by_id = {}
+        self.refresh()
+
+    def refresh(self):
+        """
+        @summary: Fetches all events for the snapshot's instances again
+        """
+        list_calls = {
+            StackTachEventTypes.LAUNCH:
+                self.db_behavior.list_launches_for_uuid,
+            StackTachEventTypes.DELETE:
+                self.db_behavior.list_deletes_for_uuid,
+            StackTachEventTypes.EXIST:
+                self.db_behavior.list_exists_for_uuid}
+        keys = [(instance_id, event_type)
+                for instance_id in self.instance_ids
+                for event_type in list_calls]
+        responses = run_concurrently(
+            [partial(list_calls[event_type], instance=instance_id)
+             for instance_id, event_type in keys],
+            max_workers=self.max_workers)
+
+        self.responses = dict(zip(keys, responses))
+        self.events = {}
+        self.events_by_id = {}
+        for key, response in self.responses.items():
+            events = sorted(response.entity or [],
+                            key=lambda event: event.id_)
+            self.events[key] = events
+            for event in events:
+                self.events_by_id[key + (event.id_,)] = event
+
+    def response(self, instance_id, event_type):
+        """@summary: Returns the list response for an instance's events"""
+        return self.responses[(instance_id, event_type)]
+
+    def list(self, instance_id, event_type):
+        """@summary: Returns an instance's events, sorted by id"""
+        return self.events.get((instance_id, event_type), [])
+
+    def first(self, instance_id, event_type):
+        """@summary: Returns an instance's earliest event, or None"""
+        events = self.list(instance_id, event_type)
+        return events[0] if events else None
+
+    def get(self, instance_id, event_type, event_id):
+        """@summary: Returns a single event by id, or None"""
+        return self.events_by_id.get((instance_id, event_type, event_id))
+
+
+class PagedListingStats(object):
+    """
+    @summary: Record counts and timings gathered while walking a paged
+        StackTach DB listing
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.records = 0
+        self.page_latencies = []
+        self.elapsed = 0.0
+
+    @property
+    def pages(self):
+        return len(self.page_latencies)
+
+    @property
+    def records_per_second(self):
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+    def latency_percentile(self, percentile):
+        """@summary: Returns the page latency at the given percentile"""
+        if not self.page_latencies:
+            return 0.0
+        latencies = sorted(self.page_latencies)
+        index = int(round((len(latencies) - 1) * percentile / 100.0))
+        return latencies[index]
+
+    def __str__(self):
+        return ("{0}: {1} records in {2} pages, {3:.3f}s total, "
+                "{4:.1f} records/s, page latency p50 {5:.3f}s "
+                "p95 {6:.3f}s max {7:.3f}s".format(
+                    self.name, self.records, self.pages, self.elapsed,
+                    self.records_per_second, self.latency_percentile(50),
+                    self.latency_percentile(95),
+                    self.latency_percentile(100)))
+
+
+class StackTachFixture(InstrumentedTestFixture):
     """
     @summary: Fixture for any StackTach test.
     """
@@ -52,9 +168,10 @@ class StackTachFixture(BaseTestFixture):
                                                cls.deserializer)
         cls.stacktach_behavior = StackTachBehavior(cls.stacktach_client,
                                                    cls.stacktach_config)
+        cls.instrument_fixture()
 
 
-class StackTachDBFixture(BaseTestFixture):
+class StackTachDBFixture(InstrumentedTestFixture):
     """
     @summary: Fixture for any StackTachDB test.
     """
@@ -77,40 +194,256 @@ class StackTachDBFixture(BaseTestFixture):
                                                    cls.deserializer)
         cls.stacktach_db_behavior = StackTachDBBehavior(cls.stacktach_dbclient,
                                                         cls.stacktach_config)
+        cls.paging_config = StackTachPagingConfig()
+        cls.instrument_fixture()
+
+    def verify_paged_listing(self, list_call, verify_entity, name=None,
+                             page_size=None, max_records=None):
+        """
+        @summary: Walks a StackTach DB listing page by page using the
+            limit/offset query parameters, verifying each record as its page
+            arrives, so only one page is held in memory at a time. The walk
+            ends at the first empty page, as the server may return fewer
+            records per page than requested.
+        @param list_call: Client list method, e.g. list_launches
+        @type list_call: Callable
+        @param verify_entity: Called with every record returned
+        @type verify_entity: Callable
+        @param page_size: Records per page, defaults to the paging config
+        @type page_size: Int
+        @param max_records: Stop after this many records, defaults to the
+            paging config; 0 walks the whole listing
+        @type max_records: Int
+        @return: Record counts, throughput and per page latencies
+        @rtype: PagedListingStats
+        """
+        page_size = page_size or self.paging_config.page_size
+        if max_records is None:
+            max_records = self.paging_config.max_records
+        stats = PagedListingStats(name or list_call.__name__)
+
+        start_time = time.time()
+        while True:
+            params = {'limit': page_size, 'offset': stats.records}
+            page_start = time.time()
+            response = list_call(requestslib_kwargs={'params': params})
+            stats.page_latencies.append(time.time() - page_start)
+            self.assertEqual(response.status_code, 200,
+                             self.msg.format("status code", "200",
+                                             response.status_code,
+                                             response.reason,
+                                             "page at offset {0}".format(
+                                                 stats.records)))
+            page = response.entity or []
+            for entity in page:
+                verify_entity(entity)
+            if not page:
+                break
+            stats.records += len(page)
+            if max_records and stats.records >= max_records:
+                break
+        stats.elapsed = time.time() - start_time
+
+        self.fixture_log.info(str(stats))
+        return stats
 
     @classmethod
-    def stacktach_events_for_server(cls, server):
+    def stacktach_events_for_server(cls, server, event_snapshot=None):
         """
         @summary: Connects to StackTach DB to obtain
         relevant validation data for a server.
         @param server: Server details.
         @type server: Server
+        @param event_snapshot: Snapshot already holding the server's events,
+            shared with other servers. Fetched for this server when not
+            given.
+        @type event_snapshot: StackTachEventSnapshot
         """
-        cls.launch_response = (
-            cls.stacktach_db_behavior.list_launches_for_uuid(
-                instance=server.id))
-        cls.event_launches = sorted(cls.launch_response.entity,
-                                    key=lambda launch: launch.id_)
+        cls.event_instance_id = server.id
+        cls.event_snapshot = event_snapshot or StackTachEventSnapshot(
+            cls.stacktach_db_behavior, [server.id])
+
+        cls.launch_response = cls.event_snapshot.response(
+            server.id, StackTachEventTypes.LAUNCH)
+        cls.event_launches = cls.event_snapshot.list(
+            server.id, StackTachEventTypes.LAUNCH)
         cls.event_launch = cls.event_launches[0]
 
-        cls.delete_response = (
-            cls.stacktach_db_behavior.list_deletes_for_uuid(
-                instance=server.id))
-        cls.event_delete = None
-        if cls.delete_response.entity:
-            cls.event_delete = cls.delete_response.entity[0]
+        cls.delete_response = cls.event_snapshot.response(
+            server.id, StackTachEventTypes.DELETE)
+        cls.event_delete = cls.event_snapshot.first(
+            server.id, StackTachEventTypes.DELETE)
 
-        cls.exist_response = (
-            cls.stacktach_db_behavior.list_exists_for_uuid(
-                instance=server.id))
-        cls.event_exist = None
-        if cls.exist_response.entity:
-            cls.event_exists = sorted(cls.exist_response.entity,
-                                      key=lambda exist: exist.id_)
-            cls.event_exist = cls.event_exists[0]
+        cls.exist_response = cls.event_snapshot.response(
+            server.id, StackTachEventTypes.EXIST)
+        cls.event_exist = cls.event_snapshot.first(
+            server.id, StackTachEventTypes.EXIST)
+        if cls.event_exist:
+            cls.event_exists = cls.event_snapshot.list(
+                server.id, StackTachEventTypes.EXIST)
 
 
 class StackTachComputeIntegration(ComputeFixture, StackTachDBFixture):
+    """
+    @summary: Fixture for tests that walk a server through a lifecycle and
+        validate the events StackTach recorded for it. Test classes perform
+        their server actions in run_lifecycle, and pick out the events their
+        tests check in select_events, once the events are loaded.
+
+        When concurrent_lifecycles is enabled in the stacktach_scenarios
+        config, the first class to be set up runs the lifecycle of every
+        test class scheduled in the run at once, each on its own server.
+        Every class then picks up its own precomputed state when it is set
+        up.
+    """
+
+    _lifecycles_started = False
+    _lifecycle_results = {}
+    _lifecycle_lock = threading.Lock()
+    _scheduled_classes = []
+    _fixture_classes = set()
+
+    def __init__(self, *args, **kwargs):
+        # Test instances are only built for the tests scheduled to run, so
+        # their classes are the ones whose lifecycles are orchestrated
+        super(StackTachComputeIntegration, self).__init__(*args, **kwargs)
+        if type(self) not in StackTachComputeIntegration._scheduled_classes:
+            StackTachComputeIntegration._scheduled_classes.append(type(self))
+
+    @classmethod
+    def setUpClass(cls):
+        scenario_config = StackTachScenarioConfig()
+        if scenario_config.concurrent_lifecycles:
+            cls._run_all_lifecycles(scenario_config.max_workers)
+
+        with cls._lifecycle_lock:
+            result = cls._lifecycle_results.pop(cls, None)
+        if result is None:
+            cls._set_up_fixture()
+            cls.run_lifecycle()
+            cls.load_events()
+        elif result.failed:
+            raise result.exception
+
+    @classmethod
+    def _set_up_fixture(cls):
+        """
+        @summary: Sets up the compute and StackTach DB fixtures of the class,
+            once per run
+        """
+        if cls in StackTachComputeIntegration._fixture_classes:
+            return
+        StackTachComputeIntegration._fixture_classes.add(cls)
+        super(StackTachComputeIntegration, cls).setUpClass()
+
+    @classmethod
+    def run_lifecycle(cls):
+        """
+        @summary: Creates the server and performs the actions under test.
+            Overridden by test classes.
+        """
+        cls.create_server()
+
+    @classmethod
+    def load_events(cls, event_snapshot=None):
+        """
+        @summary: Loads the StackTach events of the created server, then
+            lets the test class pick out the ones its tests check
+        @param event_snapshot: Snapshot holding the events of the servers of
+            every orchestrated class. Fetched for this server when not given.
+        @type event_snapshot: StackTachEventSnapshot
+        """
+        cls.stacktach_events_for_server(cls.created_server, event_snapshot)
+        cls.select_events()
+
+    @classmethod
+    def select_events(cls):
+        """
+        @summary: Picks out the events the tests check, ie the launch after
+            a resize. Overridden by test classes.
+        """
+        pass
+
+    @classmethod
+    def _lifecycle_classes(cls):
+        """
+        @summary: Returns the test classes scheduled in the run that are not
+            skipped, starting with the class being set up
+        """
+        classes = [cls]
+        for klass in StackTachComputeIntegration._scheduled_classes:
+            if (klass not in classes and
+                    not getattr(klass, '__unittest_skip__', False)):
+                classes.append(klass)
+        return classes
+
+    @classmethod
+    def _run_all_lifecycles(cls, max_workers):
+        """
+        @summary: Runs the lifecycle of every scheduled test class
+            concurrently, once per run, and stores each outcome for its
+            class. Fixtures are set up one class at a time on the calling
+            thread; only the lifecycles, which build servers and wait on
+            them, run on the pool.
+        """
+        with cls._lifecycle_lock:
+            if StackTachComputeIntegration._lifecycles_started:
+                return
+            StackTachComputeIntegration._lifecycles_started = True
+
+        results = {}
+        classes = []
+        for klass in cls._lifecycle_classes():
+            try:
+                klass._set_up_fixture()
+            except Exception as exception:
+                results[klass] = TaskResult(None, exception=exception)
+            else:
+                classes.append(klass)
+
+        results.update(zip(classes, execute_concurrently(
+            [klass.run_lifecycle for klass in classes],
+            max_workers=max_workers)))
+        cls._load_all_events(
+            [klass for klass in classes if not results[klass].failed],
+            results)
+        with cls._lifecycle_lock:
+            cls._lifecycle_results.update(results)
+        atexit.register(StackTachComputeIntegration._release_unclaimed)
+
+    @classmethod
+    def _load_all_events(cls, classes, results):
+        """
+        @summary: Fetches the events of the servers of every class in one
+            snapshot and loads each class's events from it. Classes whose
+            events cannot be loaded have their result replaced by the error.
+        """
+        if not classes:
+            return
+        try:
+            event_snapshot = StackTachEventSnapshot(
+                classes[0].stacktach_db_behavior,
+                [klass.created_server.id for klass in classes])
+        except Exception as exception:
+            for klass in classes:
+                results[klass] = TaskResult(None, exception=exception)
+            return
+        for klass in classes:
+            try:
+                klass.load_events(event_snapshot)
+            except Exception as exception:
+                results[klass] = TaskResult(None, exception=exception)
+
+    @classmethod
+    def _release_unclaimed(cls):
+        """
+        @summary: Deletes servers built for classes that were scheduled but
+            never set up during the run
+        """
+        for klass in list(cls._lifecycle_results):
+            resources = getattr(klass, 'resources', None)
+            if resources is not None:
+                resources.release()
 
     @classmethod
     def create_server(cls, name=None, image_ref=None, flavor_ref=None,
@@ -135,8 +468,6 @@ class StackTachComputeIntegration(ComputeFixture, StackTachDBFixture):
         @param networks:The networks to which you want to attach the server.
         @type networks: String
         """
-        super(StackTachComputeIntegration, cls).setUpClass()
-
         if name is None:
             name = rand_name('testservercc')
         if image_ref is None:
@@ -389,6 +720,25 @@ class StackTachComputeIntegration(ComputeFixture, StackTachDBFixture):
 
 class StackTachTestAssertionsFixture(StackTachDBFixture):
 
+    def get_indexed_event(self, event_type, event):
+        """
+        @summary: Looks an event up by id in the snapshot of the server's
+            events, failing if the snapshot does not hold it
+        @param event_type: One of StackTachEventTypes
+        @type event_type: String
+        @param event: Event picked by the test, ie cls.event_launches[1]
+        @return: The indexed event
+        """
+        self.assertIsNotNone(event, self.msg.format(
+            event_type, "Not None", event, "No event was found", ""))
+        indexed_event = self.event_snapshot.get(
+            self.event_instance_id, event_type, event.id_)
+        self.assertIsNotNone(indexed_event, self.msg.format(
+            event_type, event.id_, indexed_event,
+            "Event is not in the snapshot for instance",
+            self.event_instance_id))
+        return indexed_event
+
     def validate_attributes_in_launch_response(self, num_of_launch_entry=1):
         """
         @summary: Validates that all the attributes of
@@ -397,11 +747,13 @@ class StackTachTestAssertionsFixture(StackTachDBFixture):
         @param num_of_launch_entry: No. of expected launch entries
         @type num_of_launch_entry: Int
         """
-        self.assertEqual(len(self.launch_response.entity),
+        launches = self.event_snapshot.list(
+            self.event_instance_id, StackTachEventTypes.LAUNCH)
+        self.assertEqual(len(launches),
                          num_of_launch_entry,
                          self.msg.format("List of Launch objects",
                                          num_of_launch_entry,
-                                         len(self.launch_response.entity),
+                                         len(launches),
                                          self.launch_response.reason,
                                          self.launch_response.content))
         self.assertTrue(self.launch_response.ok,
@@ -413,7 +765,7 @@ class StackTachTestAssertionsFixture(StackTachDBFixture):
                                "instance_type_id", "instance_flavor_id",
                                "tenant", "os_distro", "os_version",
                                "os_architecture", "rax_options"]
-        for launch in self.event_launches:
+        for launch in launches:
             for entity in validation_entities:
                 self.assertTrue(getattr(launch, entity),
                                 self.msg.format(entity,
@@ -437,9 +789,9 @@ class StackTachTestAssertionsFixture(StackTachDBFixture):
         @param launched_at: The launched_at time of the server
         @type launched_at: datetime
         """
-        self.event_launch_server = self.event_launch
-        if event_launch_server:
-            self.event_launch_server = event_launch_server
+        self.event_launch_server = self.get_indexed_event(
+            StackTachEventTypes.LAUNCH,
+            event_launch_server or self.event_launch)
 
         self.expected_flavor_ref = self.flavor_ref
         if expected_flavor_ref:
@@ -500,11 +852,13 @@ class StackTachTestAssertionsFixture(StackTachDBFixture):
         @param num_of_exist_entry: No. of expected exist entries
         @type num_of_exist_entry: Int
         """
-        self.assertEqual(len(self.exist_response.entity),
+        exists = self.event_snapshot.list(
+            self.event_instance_id, StackTachEventTypes.EXIST)
+        self.assertEqual(len(exists),
                          num_of_exist_entry,
                          self.msg.format("List of Exists objects",
                                          num_of_exist_entry,
-                                         len(self.exist_response.entity),
+                                         len(exists),
                                          self.exist_response.reason,
                                          self.exist_response.content))
         self.assertTrue(self.exist_response.ok,
@@ -522,7 +876,7 @@ class StackTachTestAssertionsFixture(StackTachDBFixture):
         # should be null.
         validate_none_entities = ["deleted_at", "delete", "fail_reason"]
         validate_not_none_entities = ["send_status", "bandwidth_public_out"]
-        for exist in self.event_exists:
+        for exist in exists:
             for entity in validation_entities:
                 self.assertTrue(getattr(exist, entity),
                                 self.msg.format(entity,
@@ -562,9 +916,8 @@ class StackTachTestAssertionsFixture(StackTachDBFixture):
         @type launched_at: datetime
         """
 
-        self.event_exist_server = self.event_exist
-        if event_exist_server:
-            self.event_exist_server = event_exist_server
+        self.event_exist_server = self.get_indexed_event(
+            StackTachEventTypes.EXIST, event_exist_server or self.event_exist)
 
         self.expected_flavor_ref = self.flavor_ref
         if expected_flavor_ref:
@@ -642,9 +995,8 @@ class StackTachTestAssertionsFixture(StackTachDBFixture):
         @param event_exist_server: Details of the event Exist from DB
         @type event_exist_server: ServerExists
         """
-        self.event_exist_server = self.event_exist
-        if event_exist_server:
-            self.event_exist_server = event_exist_server
+        self.event_exist_server = self.get_indexed_event(
+            StackTachEventTypes.EXIST, event_exist_server or self.event_exist)
 
         self.assertTrue(EqualityTools.are_datetimes_equal(
             string_to_datetime(expected_audit_period_ending),
@@ -669,9 +1021,11 @@ class StackTachTestAssertionsFixture(StackTachDBFixture):
                                         self.exist_response.status_code,
                                         self.exist_response.reason,
                                         self.exist_response.content))
-        self.assertFalse(self.event_exist,
+        exists = self.event_snapshot.list(
+            self.event_instance_id, StackTachEventTypes.EXIST)
+        self.assertFalse(exists,
                          self.msg.format("Non-empty List of Exist objects",
-                                         "Empty List", self.event_exist,
+                                         "Empty List", exists,
                                          self.exist_response.reason,
                                          self.exist_response.content))
 
@@ -686,8 +1040,10 @@ class StackTachTestAssertionsFixture(StackTachDBFixture):
                                         self.delete_response.status_code,
                                         self.delete_response.reason,
                                         self.delete_response.content))
-        self.assertFalse(self.event_delete,
+        deletes = self.event_snapshot.list(
+            self.event_instance_id, StackTachEventTypes.DELETE)
+        self.assertFalse(deletes,
                          self.msg.format("Non-empty List of Delete objects",
-                                         "Empty List", self.event_delete,
+                                         "Empty List", deletes,
                                          self.delete_response.reason,
                                          self.delete_response.content))
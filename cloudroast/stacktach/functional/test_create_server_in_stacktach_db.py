@@ -23,9 +23,8 @@ class StackTachDBCreateServerTests(StackTachComputeIntegration,
     @summary: With Server Create, test the entries created in StackTach DB.
     """
     @classmethod
-    def setUpClass(cls):
+    def run_lifecycle(cls):
         cls.create_server()
-        cls.stacktach_events_for_server(server=cls.created_server)
 
     def test_launch_entry_on_create_server_response(self):
         """
@@ -28,10 +28,9 @@ class StackTachDBDeleteServerTests(StackTachComputeIntegration,
     @summary: With Server Delete, tests the entries created in StackTach DB.
     """
     @classmethod
-    def setUpClass(cls):
+    def run_lifecycle(cls):
         cls.create_server()
         cls.delete_server()
-        cls.stacktach_events_for_server(server=cls.deleted_server)
 
     def test_launch_entry_on_create_server_response(self):
         """
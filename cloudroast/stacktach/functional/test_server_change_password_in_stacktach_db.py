@@ -24,10 +24,9 @@ class StackTachDBChangePasswordServerTests(StackTachComputeIntegration,
         StackTach DB.
     """
     @classmethod
-    def setUpClass(cls):
+    def run_lifecycle(cls):
         cls.create_server()
         cls.change_password_server()
-        cls.stacktach_events_for_server(server=cls.changed_password_server)
 
     def test_launch_entry_on_change_password_server_response(self):
         """
@@ -24,10 +24,9 @@ class StackTachDBRebootHardServerTests(StackTachComputeIntegration,
       StackTach DB.
     """
     @classmethod
-    def setUpClass(cls):
+    def run_lifecycle(cls):
         cls.create_server()
         cls.hard_reboot_server()
-        cls.stacktach_events_for_server(server=cls.hard_rebooted_server)
 
     def test_launch_entry_on_reboot_hard_server_response(self):
         """
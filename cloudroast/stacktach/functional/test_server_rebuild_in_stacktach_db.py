@@ -29,13 +29,14 @@ class StackTachDBRebuildServerTests(StackTachComputeIntegration,
     """
 
     @classmethod
-    def setUpClass(cls):
+    def run_lifecycle(cls):
         cls.create_server()
         cls.rebuild_server()
         cls.audit_period_beginning = \
             datetime.utcnow().strftime(Constants.DATETIME_0AM_FORMAT)
 
-        cls.stacktach_events_for_server(cls.rebuilt_server)
+    @classmethod
+    def select_events(cls):
         cls.event_launch_rebuilt_server = cls.event_launches[1]
 
     def test_launch_entry_on_rebuild_server_response(self):
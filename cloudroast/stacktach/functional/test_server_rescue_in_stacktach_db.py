@@ -29,13 +29,14 @@ class StackTachDBRescueServerTests(StackTachComputeIntegration,
     """
 
     @classmethod
-    def setUpClass(cls):
+    def run_lifecycle(cls):
         cls.create_server()
         cls.rescue_and_unrescue_server()
         cls.audit_period_beginning = \
             datetime.utcnow().strftime(Constants.DATETIME_0AM_FORMAT)
 
-        cls.stacktach_events_for_server(cls.unrescued_server)
+    @classmethod
+    def select_events(cls):
         cls.event_launch_rescued_server = cls.event_launches[1]
 
     def test_launch_entry_on_rescue_server_response(self):
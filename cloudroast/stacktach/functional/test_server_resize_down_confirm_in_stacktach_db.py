@@ -29,7 +29,7 @@ class StackTachDBServerResizeDownConfirmTests(StackTachComputeIntegration,
     """
 
     @classmethod
-    def setUpClass(cls):
+    def run_lifecycle(cls):
         cls.flavors_config = FlavorsConfig()
         cls.flavor_ref = cls.flavors_config.primary_flavor
         cls.flavor_ref_alt = cls.flavors_config.secondary_flavor
@@ -45,7 +45,8 @@ class StackTachDBServerResizeDownConfirmTests(StackTachComputeIntegration,
         cls.audit_period_beginning = \
             datetime.utcnow().strftime(Constants.DATETIME_0AM_FORMAT)
 
-        cls.stacktach_events_for_server(server=cls.confirmed_resized_server)
+    @classmethod
+    def select_events(cls):
         cls.event_launch_resize_server = cls.event_launches[1]
 
     def test_launch_entry_on_resize_server_down_response(self):
@@ -30,7 +30,7 @@ class StackTachDBServerResizeDownRevertTests(StackTachComputeIntegration,
     """
 
     @classmethod
-    def setUpClass(cls):
+    def run_lifecycle(cls):
         cls.flavors_config = FlavorsConfig()
         cls.flavor_ref = cls.flavors_config.primary_flavor
         cls.flavor_ref_alt = cls.flavors_config.secondary_flavor
@@ -46,7 +46,8 @@ class StackTachDBServerResizeDownRevertTests(StackTachComputeIntegration,
         cls.audit_period_beginning = \
             datetime.utcnow().strftime(Constants.DATETIME_0AM_FORMAT)
 
-        cls.stacktach_events_for_server(server=cls.reverted_resized_server)
+    @classmethod
+    def select_events(cls):
         cls.event_launch_resize_server = cls.event_launches[1]
         cls.event_launch_revert_resize = cls.event_launches[2]
         cls.event_exist_resize_server = cls.event_exists[0]
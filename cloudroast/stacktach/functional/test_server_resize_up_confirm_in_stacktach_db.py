@@ -28,14 +28,15 @@ class StackTachDBServerResizeUpConfirmTests(StackTachComputeIntegration,
     """
 
     @classmethod
-    def setUpClass(cls):
+    def run_lifecycle(cls):
         cls.create_server()
         cls.resize_server()
         cls.confirm_resize_server()
         cls.audit_period_beginning = \
             datetime.utcnow().strftime(Constants.DATETIME_0AM_FORMAT)
 
-        cls.stacktach_events_for_server(server=cls.confirmed_resized_server)
+    @classmethod
+    def select_events(cls):
         cls.event_launch_resize_server = cls.event_launches[1]
 
     def test_launch_entry_on_resize_server_up_response(self):
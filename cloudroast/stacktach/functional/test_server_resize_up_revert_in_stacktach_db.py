@@ -29,14 +29,15 @@ class StackTachDBServerResizeUpRevertTests(StackTachComputeIntegration,
     """
 
     @classmethod
-    def setUpClass(cls):
+    def run_lifecycle(cls):
         cls.create_server()
         cls.resize_server()
         cls.revert_resize_server()
         cls.audit_period_beginning = \
             datetime.utcnow().strftime(Constants.DATETIME_0AM_FORMAT)
 
-        cls.stacktach_events_for_server(server=cls.reverted_resized_server)
+    @classmethod
+    def select_events(cls):
         cls.event_launch_resize_server = cls.event_launches[1]
         cls.event_launch_revert_resize = cls.event_launches[2]
         cls.event_exist_resize_server = cls.event_exists[0]
@@ -24,10 +24,9 @@ class StackTachDBRebootSoftServerTests(StackTachComputeIntegration,
       StackTach DB.
     """
     @classmethod
-    def setUpClass(cls):
+    def run_lifecycle(cls):
         cls.create_server()
         cls.soft_reboot_server()
-        cls.stacktach_events_for_server(server=cls.soft_rebooted_server)
 
     def test_launch_entry_on_reboot_soft_server_response(self):
         """
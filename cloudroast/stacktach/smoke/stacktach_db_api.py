@@ -26,39 +26,33 @@ class StackTachDBTest(StackTachDBFixture):
         @summary: Verify that List Launches records
             returns 200 Success response
         """
-        response = self.stacktach_dbclient.list_launches()
-        self.assertEqual(response.status_code, 200,
-                         self.msg.format("status code", "200",
-                                         response.status_code,
-                                         response.reason,
-                                         response.content))
-        self.verify_launches_entity_attribute_values(response.entity)
+        stats = self.verify_paged_listing(
+            self.stacktach_dbclient.list_launches,
+            self.verify_launch_entity_attribute_values)
+        self.assertGreaterEqual(stats.records, 1,
+                                msg="The response content is blank")
 
     def test_list_deletes(self):
         """
         @summary: Verify that List Deletes records
                   returns 200 Success response
         """
-        response = self.stacktach_dbclient.list_deletes()
-        self.assertEqual(response.status_code, 200,
-                         self.msg.format("status code", "200",
-                                         response.status_code,
-                                         response.reason,
-                                         response.content))
-        self.verify_deletes_entity_attribute_values(response.entity)
+        stats = self.verify_paged_listing(
+            self.stacktach_dbclient.list_deletes,
+            self.verify_delete_entity_attribute_values)
+        self.assertGreaterEqual(stats.records, 1,
+                                msg="The response content is blank")
 
     def test_list_exists(self):
         """
         @summary: Verify that List Exists records
                   returns 200 Success response
         """
-        response = self.stacktach_dbclient.list_exists()
-        self.assertEqual(response.status_code, 200,
-                         self.msg.format("status code", "200",
-                                         response.status_code,
-                                         response.reason,
-                                         response.content))
-        self.verify_exists_entity_attribute_values(response.entity)
+        stats = self.verify_paged_listing(
+            self.stacktach_dbclient.list_exists,
+            self.verify_exist_entity_attribute_values)
+        self.assertGreaterEqual(stats.records, 1,
+                                msg="The response content is blank")
 
     def test_get_launch(self):
         """